@@ -12,9 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
+import mmap
+import struct
 import wave
 from pathlib import Path
-from typing import Optional, Tuple, Union
+from typing import Iterator, Optional, Tuple, Union
 
 import numpy as np
 
@@ -22,11 +25,33 @@ import paddle
 
 from .backend import AudioInfo
 
+_WAVE_FORMAT_PCM = 0x0001
+_WAVE_FORMAT_IEEE_FLOAT = 0x0003
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+_SUPPORTED_FORMATS = {
+    _WAVE_FORMAT_PCM: (8, 16, 24, 32),
+    _WAVE_FORMAT_IEEE_FLOAT: (32, 64),
+}
+
+_WavHeader = collections.namedtuple(
+    '_WavHeader',
+    [
+        'format_tag',
+        'num_channels',
+        'sample_rate',
+        'bits_per_sample',
+        'block_align',
+        'data_offset',
+        'num_frames',
+    ],
+)
+
 
 def _error_message():
     package = "paddleaudio"
     warn_msg = (
-        "only PCM16 WAV supported. \n"
+        "only PCM8/16/24/32 and float WAV supported. \n"
         "if want support more other audio types, please "
         f"manually installed (usually with `pip install {package}`). \n "
         "and use paddle.audio.backends.set_backend('soundfile') to set audio backend"
@@ -34,6 +59,95 @@ def _error_message():
     return warn_msg
 
 
+def _read_header(file_obj) -> _WavHeader:
+    """Parse RIFF chunks of WAV file until the data chunk, the position of
+    file_obj is left at the beginning of the data chunk."""
+    riff = file_obj.read(12)
+    if len(riff) < 12 or riff[:4] != b'RIFF' or riff[8:] != b'WAVE':
+        raise NotImplementedError(_error_message())
+
+    fmt = None
+    while True:
+        chunk_header = file_obj.read(8)
+        if len(chunk_header) < 8:
+            raise NotImplementedError(_error_message())
+        chunk_id, chunk_size = struct.unpack('<4sI', chunk_header)
+        if chunk_id == b'fmt ':
+            body = file_obj.read(chunk_size + chunk_size % 2)
+            if len(body) < 16:
+                raise NotImplementedError(_error_message())
+            fmt = list(struct.unpack('<HHIIHH', body[:16]))
+            if fmt[0] == _WAVE_FORMAT_EXTENSIBLE and len(body) >= 26:
+                # the first two bytes of sub format GUID is the format tag
+                fmt[0] = struct.unpack('<H', body[24:26])[0]
+        elif chunk_id == b'data':
+            break
+        else:
+            # chunks are padded to even size
+            file_obj.seek(chunk_size + chunk_size % 2, 1)
+
+    if fmt is None:
+        raise NotImplementedError(_error_message())
+    format_tag, num_channels, sample_rate, _, block_align, bits = fmt
+    if bits not in _SUPPORTED_FORMATS.get(format_tag, ()):
+        raise NotImplementedError(_error_message())
+
+    # NOTE: size of data chunk may be wrong in streamed WAV files, never
+    #       read beyond the end of file
+    data_offset = file_obj.tell()
+    file_size = file_obj.seek(0, 2)
+    file_obj.seek(data_offset)
+    data_size = min(chunk_size, file_size - data_offset)
+    return _WavHeader(
+        format_tag,
+        num_channels,
+        sample_rate,
+        bits,
+        block_align,
+        data_offset,
+        data_size // block_align,
+    )
+
+
+def _decode_frames(
+    buffer, header: _WavHeader, normalize: bool = True
+) -> np.ndarray:
+    """Decode raw bytes of frames to float32 array in shape (time, channels)."""
+    bits = header.bits_per_sample
+    if header.format_tag == _WAVE_FORMAT_IEEE_FLOAT:
+        data = np.frombuffer(buffer, dtype=f'<f{bits // 8}')
+        data = data.astype(np.float32)
+    elif bits == 8:
+        # 8-bit PCM samples are unsigned
+        data = np.frombuffer(buffer, dtype=np.uint8).astype(np.float32) - 128
+    elif bits == 24:
+        raw = np.frombuffer(buffer, dtype=np.uint8).reshape(-1, 3)
+        raw = raw.astype(np.int32)
+        data = raw[:, 0] | (raw[:, 1] << 8) | (raw[:, 2] << 16)
+        data = (data - ((data & 0x800000) << 1)).astype(np.float32)
+    else:
+        data = np.frombuffer(buffer, dtype=f'<i{bits // 8}')
+        data = data.astype(np.float32)
+
+    if normalize and header.format_tag == _WAVE_FORMAT_PCM:
+        data /= 2 ** (bits - 1)
+    return np.reshape(data, (-1, header.num_channels))
+
+
+def _to_waveform(data: np.ndarray, channels_first: bool) -> paddle.Tensor:
+    waveform = paddle.to_tensor(data)
+    if channels_first:
+        waveform = paddle.transpose(waveform, perm=[1, 0])
+    return waveform
+
+
+def _frame_range(header: _WavHeader, frame_offset: int, num_frames: int):
+    begin = min(max(frame_offset, 0), header.num_frames)
+    if num_frames < 0:
+        return begin, header.num_frames
+    return begin, min(begin + num_frames, header.num_frames)
+
+
 def info(filepath: str) -> AudioInfo:
     """Get signal information of input audio file.
 
@@ -63,26 +177,23 @@ def info(filepath: str) -> AudioInfo:
     """
 
     if hasattr(filepath, 'read'):
-        file_obj = filepath
+        header = _read_header(filepath)
     else:
-        file_obj = open(filepath, 'rb')
+        with open(filepath, 'rb') as file_obj:
+            header = _read_header(file_obj)
 
-    try:
-        file_ = wave.open(file_obj)
-    except wave.Error:
-        file_obj.seek(0)
-        file_obj.close()
-        err_msg = _error_message()
-        raise NotImplementedError(err_msg)
-
-    channels = file_.getnchannels()
-    sample_rate = file_.getframerate()
-    sample_frames = file_.getnframes()  # audio frame
-    bits_per_sample = file_.getsampwidth() * 8
-    encoding = "PCM_S"  # default WAV encoding, only support
-    file_obj.close()
+    if header.format_tag == _WAVE_FORMAT_IEEE_FLOAT:
+        encoding = "PCM_F"
+    elif header.bits_per_sample == 8:
+        encoding = "PCM_U"
+    else:
+        encoding = "PCM_S"
     return AudioInfo(
-        sample_rate, sample_frames, channels, bits_per_sample, encoding
+        header.sample_rate,
+        header.num_frames,
+        header.num_channels,
+        header.bits_per_sample,
+        encoding,
     )
 
 
@@ -94,13 +205,14 @@ def load(
     channels_first: bool = True,
 ) -> Tuple[paddle.Tensor, int]:
     """Load audio data from file. load the audio content start form frame_offset, and get num_frames.
+    Only the requested frames are read from file. PCM 8/16/24/32 bits and float WAV files are supported.
 
     Args:
         frame_offset: from 0 to total frames,
         num_frames: from -1 (means total frames) or number frames which want to read,
         normalize:
             if True: return audio which norm to (-1, 1), dtype=float32
-            if False: return audio with raw data, dtype=int16
+            if False: return audio with raw integer data of PCM WAV, dtype=float32
 
         channels_first:
             if True: return audio with shape (channels, time)
@@ -132,37 +244,107 @@ def load(
         file_obj = open(filepath, 'rb')
 
     try:
-        file_ = wave.open(file_obj)
-    except wave.Error:
-        file_obj.seek(0)
-        file_obj.close()
-        err_msg = _error_message()
-        raise NotImplementedError(err_msg)
-
-    channels = file_.getnchannels()
-    sample_rate = file_.getframerate()
-    frames = file_.getnframes()  # audio frame
-
-    audio_content = file_.readframes(frames)
-    file_obj.close()
-
-    # default_subtype = "PCM_16", only support PCM16 WAV
-    audio_as_np16 = np.frombuffer(audio_content, dtype=np.int16)
-    audio_as_np32 = audio_as_np16.astype(np.float32)
-    if normalize:
-        # dtype = "float32"
-        audio_norm = audio_as_np32 / (2**15)
+        header = _read_header(file_obj)
+        begin, end = _frame_range(header, frame_offset, num_frames)
+        # only read the requested frames
+        file_obj.seek(header.data_offset + begin * header.block_align)
+        buffer = file_obj.read((end - begin) * header.block_align)
+    finally:
+        if file_obj is not filepath:
+            file_obj.close()
+
+    waveform = _decode_frames(buffer, header, normalize)
+    return _to_waveform(waveform, channels_first), header.sample_rate
+
+
+def stream(
+    filepath: Union[str, Path],
+    chunk_size: int,
+    overlap: int = 0,
+    frame_offset: int = 0,
+    num_frames: int = -1,
+    normalize: bool = True,
+    channels_first: bool = True,
+) -> Iterator[paddle.Tensor]:
+    """Iterate over audio data of file in chunks of chunk_size frames, the
+    file is memory-mapped and only the frames of current chunk are decoded,
+    so that long recordings can be processed without loading the whole file.
+
+    Args:
+        filepath: audio path or file object.
+        chunk_size: number of frames of every chunk, the last chunk may be shorter.
+        overlap: number of frames shared by adjacent chunks, should be less than chunk_size.
+        frame_offset: from 0 to total frames,
+        num_frames: from -1 (means total frames) or number frames which want to read,
+        normalize:
+            if True: return audio which norm to (-1, 1), dtype=float32
+            if False: return audio with raw data, dtype=float32
+        channels_first:
+            if True: return audio with shape (channels, time)
+
+    Return:
+        Iterator[paddle.Tensor]: chunks of audio content
+
+    Examples:
+        .. code-block:: python
+
+            >>> import paddle
+            >>> from paddle.audio.backends import wave_backend
+
+            >>> sample_rate = 16000
+            >>> wav_data = paddle.linspace(-1.0, 1.0, sample_rate) * 0.1
+            >>> filepath = "./test.wav"
+            >>> paddle.audio.save(filepath, wav_data.unsqueeze(0), sample_rate)
+
+            >>> for chunk in wave_backend.stream(filepath, 4000, overlap=1000):
+            ...     print(chunk.shape)
+            [1, 4000]
+            [1, 4000]
+            [1, 4000]
+            [1, 4000]
+            [1, 4000]
+    """
+    if not 0 <= overlap < chunk_size:
+        raise ValueError(
+            f"overlap should be in [0, chunk_size), but got overlap={overlap}"
+            f" and chunk_size={chunk_size}"
+        )
+
+    if hasattr(filepath, 'read'):
+        file_obj = filepath
     else:
-        # dtype = "int16"
-        audio_norm = audio_as_np32
+        file_obj = open(filepath, 'rb')
 
-    waveform = np.reshape(audio_norm, (frames, channels))
-    if num_frames != -1:
-        waveform = waveform[frame_offset : frame_offset + num_frames, :]
-    waveform = paddle.to_tensor(waveform)
-    if channels_first:
-        waveform = paddle.transpose(waveform, perm=[1, 0])
-    return waveform, sample_rate
+    try:
+        header = _read_header(file_obj)
+        begin, end = _frame_range(header, frame_offset, num_frames)
+        if begin == end:
+            return
+        try:
+            data = mmap.mmap(file_obj.fileno(), 0, access=mmap.ACCESS_READ)
+        except (AttributeError, OSError):
+            # file objects in memory can not be memory-mapped
+            data = None
+        try:
+            for start in range(begin, end, chunk_size - overlap):
+                stop = min(start + chunk_size, end)
+                offset = header.data_offset + start * header.block_align
+                nbytes = (stop - start) * header.block_align
+                if data is not None:
+                    buffer = data[offset : offset + nbytes]
+                else:
+                    file_obj.seek(offset)
+                    buffer = file_obj.read(nbytes)
+                waveform = _decode_frames(buffer, header, normalize)
+                yield _to_waveform(waveform, channels_first)
+                if stop == end:
+                    break
+        finally:
+            if data is not None:
+                data.close()
+    finally:
+        if file_obj is not filepath:
+            file_obj.close()
 
 
 def save(
@@ -11,7 +11,12 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import List
+import hashlib
+import json
+import os
+from typing import List, Optional
+
+import numpy as np
 
 import paddle
 
@@ -37,6 +42,8 @@ class AudioClassificationDataset(paddle.io.Dataset):
         labels: List[int],
         feat_type: str = 'raw',
         sample_rate: int = None,
+        feat_cache_dir: Optional[str] = None,
+        collate_feat: bool = False,
         **kwargs,
     ):
         """
@@ -45,6 +52,13 @@ class AudioClassificationDataset(paddle.io.Dataset):
             labels (:obj:`List[int]`): Labels of audio files.
             feat_type (:obj:`str`, `optional`, defaults to `raw`):
                 It identifies the feature type that user wants to extract an audio file.
+            feat_cache_dir (:obj:`str`, `optional`, defaults to `None`):
+                The directory to cache extracted features in. Features are keyed by the
+                audio file, `feat_type` and feature config, and are loaded from cache
+                instead of being extracted again in later epochs.
+            collate_feat (:obj:`bool`, `optional`, defaults to `False`):
+                If True, samples are waveforms and features are extracted from a batch
+                of waveforms by `collate_fn`, which should be passed to DataLoader.
         """
         super().__init__()
 
@@ -61,38 +75,138 @@ class AudioClassificationDataset(paddle.io.Dataset):
         self.feat_config = (
             kwargs  # Pass keyword arguments to customize feature config
         )
+        self.feat_cache_dir = feat_cache_dir
+        self.collate_feat = collate_feat
+        if feat_cache_dir is not None:
+            os.makedirs(feat_cache_dir, exist_ok=True)
+        # feature extractors of sample rates, built once in every process
+        self._feature_extractors = {}
 
     def _get_data(self, input_file: str):
         raise NotImplementedError
 
+    def get_feature_extractor(self, sample_rate: int):
+        """
+        Returns the feature extractor layer of `feat_type` for waveforms of
+        `sample_rate`, which is built on first call and reused afterwards, or
+        None if `feat_type` is `raw`.
+        """
+        feat_func = feat_funcs[self.feat_type]
+        if feat_func is None:
+            return None
+        if sample_rate not in self._feature_extractors:
+            if self.feat_type != 'spectrogram':
+                feature_extractor = feat_func(
+                    sr=sample_rate, **self.feat_config
+                )
+            else:
+                feature_extractor = feat_func(**self.feat_config)
+            self._feature_extractors[sample_rate] = feature_extractor
+        return self._feature_extractors[sample_rate]
+
+    def _feat_cache_file(self, file):
+        stat = os.stat(file)
+        key = json.dumps(
+            [
+                os.path.abspath(file),
+                stat.st_size,
+                stat.st_mtime_ns,
+                self.feat_type,
+                sorted(self.feat_config.items()),
+            ],
+            default=str,
+        )
+        return os.path.join(
+            self.feat_cache_dir,
+            hashlib.sha256(key.encode('utf-8')).hexdigest() + '.npy',
+        )
+
+    def _load_cached_feat(self, cache_file):
+        try:
+            return paddle.to_tensor(np.load(cache_file))
+        except (OSError, ValueError):
+            return None
+
+    def _save_cached_feat(self, cache_file, feat):
+        tmp_file = f'{cache_file}.{os.getpid()}.tmp'
+        try:
+            with open(tmp_file, 'wb') as f:
+                np.save(f, feat.numpy())
+            # NOTE: replace atomically, DataLoader workers may read it
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+
     def _convert_to_record(self, idx):
         file, label = self.files[idx], self.labels[idx]
+        record = {'label': label}
+
+        # features are extracted from batches by collate_fn if collate_feat
+        extract = self.feat_type != 'raw' and not self.collate_feat
+        cache_file = None
+        if extract and self.feat_cache_dir is not None:
+            cache_file = self._feat_cache_file(file)
+            record['feat'] = self._load_cached_feat(cache_file)
+            if record['feat'] is not None:
+                return record
+
         waveform, sample_rate = paddle.audio.load(file)
         self.sample_rate = sample_rate
 
-        feat_func = feat_funcs[self.feat_type]
-
-        record = {}
         if len(waveform.shape) == 2:
             waveform = waveform.squeeze(0)  # 1D input
         waveform = paddle.to_tensor(waveform, dtype=paddle.float32)
-        if feat_func is not None:
+        if extract:
             waveform = waveform.unsqueeze(0)  # (batch_size, T)
-            if self.feat_type != 'spectrogram':
-                feature_extractor = feat_func(
-                    sr=self.sample_rate, **self.feat_config
-                )
-            else:
-                feature_extractor = feat_func(**self.feat_config)
+            feature_extractor = self.get_feature_extractor(self.sample_rate)
             record['feat'] = feature_extractor(waveform).squeeze(0)
+            if cache_file is not None:
+                self._save_cached_feat(cache_file, record['feat'])
         else:
             record['feat'] = waveform
-        record['label'] = label
         return record
 
+    def collate_fn(self, batch):
+        """
+        Collates samples into a batch. If `collate_feat` is True, waveforms
+        are padded with zeros to the longest one, and features of the whole
+        batch are extracted at once, which is much faster than extracting
+        features sample by sample. All audio files should have the same
+        sample rate in this case.
+
+        Args:
+            batch (list): A list of (waveform or feature, label) samples.
+
+        Returns:
+            tuple: Tensors of batched features and labels.
+        """
+        feats, labels = zip(*batch)
+        labels = paddle.to_tensor(np.array(labels))
+        if not self.collate_feat or feat_funcs[self.feat_type] is None:
+            return paddle.stack(list(feats)), labels
+
+        # NOTE: collate_fn may run on a copy of dataset in DataLoader workers
+        #       which has not loaded any audio file
+        if self.sample_rate is None:
+            self.sample_rate = paddle.audio.info(self.files[0]).sample_rate
+        feature_extractor = self.get_feature_extractor(self.sample_rate)
+
+        max_len = max(feat.shape[-1] for feat in feats)
+        waveforms = np.zeros([len(feats), max_len], dtype='float32')
+        for i, feat in enumerate(feats):
+            waveforms[i, : feat.shape[-1]] = feat.numpy()
+        return feature_extractor(paddle.to_tensor(waveforms)), labels
+
     def __getitem__(self, idx):
         record = self._convert_to_record(idx)
         return record['feat'], record['label']
 
     def __len__(self):
         return len(self.files)
+
+    def __getstate__(self):
+        # NOTE: extractors are rebuilt in DataLoader workers, not pickled
+        state = self.__dict__.copy()
+        state['_feature_extractors'] = {}
+        return state
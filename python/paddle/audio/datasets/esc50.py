@@ -39,6 +39,8 @@ class ESC50(AudioClassificationDataset):
        split (int, optional): It specify the fold of dev dataset. Default:1.
        feat_type (str, optional): It identifies the feature type that user wants to extract of an audio file. Default:raw.
        archive(dict, optional): it tells where to download the audio archive. Default:None.
+       feat_cache_dir(str, optional): the directory to cache extracted features in, so that features are extracted only once. Default:None.
+       collate_feat(bool, optional): whether to extract features from batches of waveforms in `collate_fn` of the dataset, which should be passed to DataLoader. Default:False.
 
     Returns:
         :ref:`api_paddle_io_Dataset`. An instance of ESC50 dataset.
@@ -41,6 +41,8 @@ class TESS(AudioClassificationDataset):
        split (int, optional): It specify the fold of dev dataset. Defaults to 1.
        feat_type (str, optional): It identifies the feature type that user wants to extract of an audio file. Defaults to raw.
        archive(dict): it tells where to download the audio archive. Defaults to None.
+       feat_cache_dir(str, optional): the directory to cache extracted features in, so that features are extracted only once. Default:None.
+       collate_feat(bool, optional): whether to extract features from batches of waveforms in `collate_fn` of the dataset, which should be passed to DataLoader. Default:False.
 
     Returns:
         :ref:`api_paddle_io_Dataset`. An instance of TESS dataset.
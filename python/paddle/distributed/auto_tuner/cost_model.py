@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import math
+
 
 def all_params(mp, pp, sharding, h, l, V):
     # TODO: TBD - add some fixed structure models.
@@ -69,6 +71,51 @@ def get_mem(total_cards, parallel_cfg, l, h, a, V, s, gbs):
     return peak_mem
 
 
+# relative compute overhead of recompute granularities
+_RECOMPUTE_OVERHEAD = {
+    None: 0.0,
+    "core_attn": 0.05,
+    "full_attn": 0.2,
+    "full": 0.33,
+}
+
+
+def get_relative_cost(cfg, tuner_cfg):
+    """
+    Estimate the relative step time of a parallel strategy, which is only
+    comparable among strategies of the same model on the same cards. It
+    accounts for the pipeline bubble, the communication of model parallel
+    and sharding, the recompute overhead and the efficiency of micro batch
+    size, and is used to rank strategies before they are run.
+    """
+    mp = cfg["mp_degree"]
+    pp = cfg["pp_degree"]
+    vpp = cfg.get("vpp_degree", 1) or 1
+    dp = cfg["dp_degree"]
+    sharding = cfg["sharding_degree"]
+    stage = cfg.get("sharding_stage", 1) or 1
+    mbs = cfg["micro_batch_size"]
+    gbs = tuner_cfg["model_cfg"]["global_batch_size"]
+
+    cost = 1.0
+    # pipeline bubble of 1F1B schedule
+    acc_steps = max(gbs // (mbs * dp * sharding), 1)
+    cost *= 1 + (pp - 1) / (vpp * acc_steps)
+    # allreduce of activations in every layer, slower across nodes
+    gpus_per_node = tuner_cfg.get("gpus_per_node", 8)
+    if mp > 1:
+        cost *= 1 + 0.08 * math.log2(mp) * (2 if mp > gpus_per_node else 1)
+    # gather of parameters in sharding stage 2 and 3
+    if sharding > 1:
+        cost *= 1 + 0.02 * (stage - 1) * math.log2(sharding)
+    if cfg.get("use_recompute"):
+        granularity = cfg.get("recompute_granularity")
+        cost *= 1 + _RECOMPUTE_OVERHEAD.get(granularity, 0.33)
+    # kernels of small micro batch are less efficient
+    cost *= 1 + 0.1 / mbs
+    return cost
+
+
 def divisor(num, reverse=False):
     """Get the divisor of a given number."""
     results = set()
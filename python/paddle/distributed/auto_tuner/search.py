@@ -14,9 +14,13 @@
 
 
 import logging
+import math
 import os
 from abc import ABC, abstractmethod
 
+import numpy as np
+
+from .cost_model import get_relative_cost
 from .prune import _PRUNE_HISTORY_FUNC
 from .utils import (
     gbs_search_all,
@@ -63,6 +67,129 @@ class GridSearch(SearchAlgo):
         return new_cfg
 
 
+class ModelGuidedSearch(SearchAlgo):
+    """
+    Search candidates in the order of their predicted metric instead of the
+    order of enumeration. Candidates are ranked by the relative cost from
+    the cost model at first, and then by a Bayesian linear regression of the
+    log metric fitted to the finished trials, whose prior is the cost model,
+    so that the best candidates are tried before the task limit is hit. The
+    upper confidence bound of the prediction is used, weighted by the
+    `exploration` of search_algo config.
+    """
+
+    _GRANULARITIES = [None, "core_attn", "full_attn", "full"]
+
+    def __init__(self, tuner_cfg):
+        super().__init__(tuner_cfg)
+        self.idx = 0
+        self.all_tasks = search_all(tuner_cfg)
+        self.searched = [False] * len(self.all_tasks)
+        self.metric_name = tuner_cfg["metric_cfg"]["name"]
+        self.maximize = (
+            tuner_cfg["metric_cfg"].get("OptimizationDirection", "Maximize")
+            == "Maximize"
+        )
+        self.exploration = tuner_cfg["search_algo"].get("exploration", 1.0)
+        self.features = np.array(
+            [self._featurize(cfg) for cfg in self.all_tasks]
+        )
+
+    def _featurize(self, cfg):
+        granularity = cfg.get("recompute_granularity")
+        return [
+            1.0,
+            # the prior mean is the negative log cost
+            -math.log(get_relative_cost(cfg, self.tuner_cfg)),
+            math.log2(cfg["mp_degree"]),
+            math.log2(cfg["pp_degree"]),
+            math.log2(cfg["dp_degree"]),
+            math.log2(cfg["sharding_degree"]),
+            cfg.get("sharding_stage", 1) or 1,
+            math.log2(cfg["micro_batch_size"]),
+            math.log2(cfg.get("vpp_degree", 1) or 1),
+            float(bool(cfg.get("use_recompute"))),
+        ] + [
+            float(bool(cfg.get("use_recompute")) and granularity == g)
+            for g in self._GRANULARITIES[1:]
+        ]
+
+    def _observations(self, history_cfgs):
+        features, targets = [], []
+        for cfg in history_cfgs:
+            metric = cfg.get(self.metric_name)
+            if not isinstance(metric, (int, float)) or metric <= 0:
+                continue
+            features.append(self._featurize(cfg))
+            value = math.log(metric)
+            targets.append(value if self.maximize else -value)
+        dim = self.features.shape[1]
+        return np.array(features).reshape(-1, dim), np.array(targets)
+
+    def predict(self, history_cfgs, features=None):
+        """
+        Returns the posterior mean and standard deviation of the log metric
+        (negated if minimized) of candidates given the finished trials.
+        """
+        features = self.features if features is None else features
+        dim = features.shape[1]
+        # prior: weights are zero but the one of the cost model
+        prior_mean = np.zeros(dim)
+        prior_mean[1] = 1.0
+        alpha, beta = 1.0, 100.0
+
+        x, y = self._observations(history_cfgs)
+        precision = alpha * np.eye(dim) + beta * x.T @ x
+        cov = np.linalg.inv(precision)
+        weights = cov @ (alpha * prior_mean + beta * x.T @ y)
+        mean = features @ weights
+        std = np.sqrt(np.einsum('ij,jk,ik->i', features, cov, features))
+        if len(y) == 0:
+            # nothing to explore without observations
+            std = np.zeros_like(std)
+        return mean, std
+
+    def rank(self, history_cfgs):
+        """Returns indices of unsearched candidates, the best first."""
+        candidates = [i for i, s in enumerate(self.searched) if not s]
+        if not candidates:
+            return []
+        mean, std = self.predict(history_cfgs, self.features[candidates])
+        score = mean + self.exploration * std
+        return [candidates[i] for i in np.argsort(-score, kind='stable')]
+
+    def search_once(self, history_cfgs):
+        while True:
+            ranked = self.rank(history_cfgs)
+            if not ranked:
+                return None
+            self.searched[ranked[0]] = True
+            self.idx += 1
+            new_cfg = self.all_tasks[ranked[0]]
+            if not self.prune(self.tuner_cfg, new_cfg, history_cfgs):
+                return new_cfg
+
+    def search_batch(self, history_cfgs, num_trials):
+        """
+        Returns at most num_trials configs to run concurrently. Configs
+        selected but not finished are assumed to get the predicted metric,
+        so the exploration bonus is not spent on similar configs twice.
+        """
+        history_cfgs = list(history_cfgs)
+        cfgs = []
+        while len(cfgs) < num_trials:
+            new_cfg = self.search_once(history_cfgs)
+            if new_cfg is None:
+                break
+            cfgs.append(new_cfg)
+            mean, _ = self.predict(
+                history_cfgs, np.array([self._featurize(new_cfg)])
+            )
+            value = math.exp(mean[0] if self.maximize else -mean[0])
+            history_cfgs.append({**new_cfg, self.metric_name: value})
+        return cfgs
+
+
 class DpEstimationSearch(SearchAlgo):
     def __init__(self, tuner_cfg):
         super().__init__(tuner_cfg)
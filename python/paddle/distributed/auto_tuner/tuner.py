@@ -48,6 +48,11 @@ class AutoTuner:
 
             tuner_cfg["candidates"] = gbs_default_candidates(tuner_cfg)
             self.algo = GBSSearch(tuner_cfg)
+        elif search_algo == "model_guided":
+            from .search import ModelGuidedSearch
+
+            tuner_cfg["candidates"] = default_candidates(tuner_cfg)
+            self.algo = ModelGuidedSearch(tuner_cfg)
         elif search_algo == "customize":
             from .search import CustomizeSearch
 
@@ -68,6 +73,32 @@ class AutoTuner:
 
         return new_cfg
 
+    def search_batch(self, devices):
+        """
+        Return new task configs to run concurrently, each with a disjoint
+        subset of devices, as [(cfg, devices), ...].
+        """
+        num_gpus = self.tuner_cfg["num_gpus"]
+        num_trials = min(
+            len(devices) // num_gpus, self.task_limit - self.cur_task_id + 1
+        )
+        if num_trials <= 0:
+            return []
+        if hasattr(self.algo, "search_batch"):
+            cfgs = self.algo.search_batch(self.history_cfgs, num_trials)
+        else:
+            cfgs = []
+            while len(cfgs) < num_trials:
+                new_cfg = self.algo.search_once(self.history_cfgs + cfgs)
+                if new_cfg is None:
+                    break
+                cfgs.append(new_cfg)
+        self.cur_task_id += len(cfgs)
+        return [
+            (cfg, devices[i * num_gpus : (i + 1) * num_gpus])
+            for i, cfg in enumerate(cfgs)
+        ]
+
     def add_cfg(self, cfg):
         """Add cfg into history cfgs"""
         self.history_cfgs.append(cfg)
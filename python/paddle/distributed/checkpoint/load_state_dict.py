@@ -12,11 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import bisect
 import copy
 import os
 from dataclasses import dataclass
 from typing import Dict, Tuple
 
+import numpy as np
+
 import paddle
 from paddle.distributed.communication.group import is_initialized
 from paddle.distributed.fleet.utils.log_util import logger
@@ -62,21 +65,76 @@ def get_checkpoint_files(path, use_cache=True):
     return (metadata_files, local_data_files)
 
 
+PATH_TO_METADATA: Dict[str, Tuple[tuple, list]] = {}
+
+
+def get_metadata_list(path):
+    """
+    Load all the metadata files in path, which are cached until any of them
+    is modified.
+    """
+    metadata_files, _ = get_checkpoint_files(path)
+    key = tuple(
+        (file, os.stat(os.path.join(path, file)).st_mtime_ns)
+        for file in sorted(metadata_files)
+    )
+    cached = PATH_TO_METADATA.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    metadata_list = [
+        (file, paddle.load(os.path.join(path, file))) for file in metadata_files
+    ]
+    PATH_TO_METADATA[path] = (key, metadata_list)
+    return metadata_list
+
+
+class ChunkIndex:
+    """
+    Interval index of the stored chunks of a tensor, sorted by the begin of
+    chunks in the first dimension, to find the chunks overlapped with a
+    chunk without checking all of them.
+    """
+
+    def __init__(self, chunks):
+        self._chunks = sorted(chunks, key=lambda c: tuple(c.global_offset[:1]))
+        self._begins = [
+            c.global_offset[0] if len(c.global_offset) > 0 else 0
+            for c in self._chunks
+        ]
+        self._max_length = max(
+            (c.local_shape[0] for c in self._chunks if len(c.local_shape) > 0),
+            default=0,
+        )
+
+    def query(self, chunk: LocalTensorMetadata):
+        if len(chunk.global_offset) == 0:
+            candidates = self._chunks
+        else:
+            begin = chunk.global_offset[0]
+            end = begin + chunk.local_shape[0]
+            # an overlapped chunk begins in (begin - max_length, end)
+            lo = bisect.bisect_right(self._begins, begin - self._max_length)
+            hi = bisect.bisect_left(self._begins, end)
+            candidates = self._chunks[lo:hi]
+        return [c for c in candidates if not not_overlap(chunk, c)]
+
+
 def get_rank_to_files(path, state_dict, process_group, use_dist):
     """
     Get the mapping of rank to its accessible files.
     """
     metadata_files, local_data_files = get_checkpoint_files(path)
     # The neccesary files to be read
-    tensor_key_list = []
+    tensor_key_set = set()
+    tensor_index_set = set()
     necessary_files = []
-    for metadata_file in metadata_files:
-        metadata = paddle.load(os.path.join(path, metadata_file))
+    for metadata_file, metadata in get_metadata_list(path):
         for local_tensor_index, file_name in metadata.storage_metadata.items():
             assert (
-                local_tensor_index not in tensor_key_list
+                local_tensor_index not in tensor_index_set
             ), f"Duplicate tensor_key:{local_tensor_index} found. Check whether the metadata_file:{metadata_file} contains the same tensor metadata."
-            tensor_key_list.append(local_tensor_index.tensor_key)
+            tensor_index_set.add(local_tensor_index)
+            tensor_key_set.add(local_tensor_index.tensor_key)
             if local_tensor_index.tensor_key in state_dict:
                 necessary_files.append(file_name)
     necessary_data_files_set = set(necessary_files)
@@ -107,7 +165,7 @@ def get_rank_to_files(path, state_dict, process_group, use_dist):
         global_data_files_set & necessary_data_files_set
         == necessary_data_files_set
     ), f"The checkpoint files are not complete. Please check the checkpoint directory:{path}.global_data_files_set:{global_data_files_set}, necessary_data_files_set:{necessary_data_files_set}"
-    missing_keys = set(state_dict.keys()) - set(tensor_key_list)
+    missing_keys = set(state_dict.keys()) - tensor_key_set
     if len(missing_keys) > 0:
         logger.warning(
             f"Missing keys:{missing_keys}, check whether the checkpoint is complete."
@@ -220,9 +278,8 @@ def get_local_load_files(rank_to_files):
 
 def get_load_infos(path, local_load_files, process_group, use_dist):
     load_info = {}
-    metadata_files, _ = get_checkpoint_files(path)
-    for metadata_file in metadata_files:
-        metadata = paddle.load(os.path.join(path, metadata_file))
+    local_load_files = set(local_load_files)
+    for _, metadata in get_metadata_list(path):
         for local_tensor_index, file_name in metadata.storage_metadata.items():
             if file_name in local_load_files:
                 load_info[local_tensor_index] = (
@@ -296,9 +353,7 @@ def not_overlap(
 
 def get_read_items(path, state_dict, process_group, use_dist):
     storage_state_dict_metadata = {}
-    metadata_files, _ = get_checkpoint_files(path)
-    for metadata_file in metadata_files:
-        metadata = paddle.load(os.path.join(path, metadata_file))
+    for _, metadata in get_metadata_list(path):
         for (
             tensor_key,
             local_tensor_metadata,
@@ -306,6 +361,10 @@ def get_read_items(path, state_dict, process_group, use_dist):
             if tensor_key not in storage_state_dict_metadata:
                 storage_state_dict_metadata[tensor_key] = []
             storage_state_dict_metadata[tensor_key] += local_tensor_metadata
+    storage_chunk_indices = {
+        tensor_key: ChunkIndex(chunks)
+        for tensor_key, chunks in storage_state_dict_metadata.items()
+    }
     read_items = []
     logger.debug(f"storage_state_dict_metadata:{storage_state_dict_metadata}")
     for tensor_key, val in state_dict.items():
@@ -335,13 +394,9 @@ def get_read_items(path, state_dict, process_group, use_dist):
             assert (
                 tensor_key in storage_state_dict_metadata
             ), f"tensor_key:{tensor_key} not found in storage_state_dict_metadata:{storage_state_dict_metadata}."
-            for storage_local_tensor_metadata in storage_state_dict_metadata[
+            for storage_local_tensor_metadata in storage_chunk_indices[
                 tensor_key
-            ]:
-                if not_overlap(
-                    cur_chunk_metadata, storage_local_tensor_metadata
-                ):
-                    continue
+            ].query(cur_chunk_metadata):
                 cur_offsets, storage_offsets, lengths = compute_overlap(
                     cur_chunk_metadata, storage_local_tensor_metadata
                 )
@@ -472,33 +527,28 @@ def load_state_dict(
             # The src rank need to load the state_dict.
             if src_rank == paddle.distributed.get_rank():
                 if file_name not in storage_file_to_state_dict:
-                    # The value in state_dict is not distributed tensor but a normal tensor.
+                    # NOTE: files in tensor container format are memory-mapped,
+                    #       only the pages of the slices to read are loaded.
                     storage_file_to_state_dict[file_name] = paddle.load(
-                        os.path.join(path, file_name)
+                        os.path.join(path, file_name),
+                        mmap=True,
+                        return_numpy=True,
                     )
                 storage_state_dict = storage_file_to_state_dict[file_name]
                 assert item.local_tensor_index.tensor_key in storage_state_dict
-                storage_local_tensor = storage_state_dict[
+                storage_local_array = storage_state_dict[
                     item.local_tensor_index.tensor_key
                 ]
-                storage_offsets = item.storage_offset
-                storage_lengths = item.lengths
-                storage_ends = [
-                    storage_offset + storage_length
+                storage_slices = tuple(
+                    slice(storage_offset, storage_offset + storage_length)
                     for storage_offset, storage_length in zip(
-                        storage_offsets, storage_lengths
-                    )
-                ]
-                # The storage_chunk_tensor and storage_local_tensor share the same memory.
-                if len(storage_lengths) > 0:
-                    storage_chunk_tensor = paddle.slice(
-                        storage_local_tensor,
-                        list(range(len(storage_lengths))),
-                        storage_offsets,
-                        storage_ends,
+                        item.storage_offset, item.lengths
                     )
-                else:
-                    storage_chunk_tensor = storage_local_tensor
+                )
+                # NOTE: np.ascontiguousarray turns a 0-D array into 1-D
+                storage_chunk_tensor = paddle.to_tensor(
+                    np.array(storage_local_array[storage_slices], copy=True)
+                )
             # The read item rank need to be assigned
             if item.rank == paddle.distributed.get_rank():
                 assert (
@@ -12,11 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import math
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 import paddle
 from paddle.distributed.communication.group import is_initialized
 from paddle.distributed.fleet.utils.log_util import logger
+from paddle.framework.io_container import _save_container
 
 from .metadata import LocalTensorIndex, LocalTensorMetadata, Metadata
 from .utils import (
@@ -25,28 +28,6 @@ from .utils import (
 )
 
 
-def check_state_dict(state_dict, process_group):
-    local_keys = list(state_dict.keys())
-    gloabl_keys = []
-    paddle.distributed.all_gather_object(gloabl_keys, local_keys, process_group)
-    for keys in gloabl_keys[1:]:
-        assert (
-            keys == gloabl_keys[0]
-        ), f"keys:{keys} != first_keys: {gloabl_keys[0]}"
-
-
-def check_file_name(file_name, process_group):
-    all_unique_id = []
-    unique_id = int(file_name.split(".")[0].split("_")[1])
-    paddle.distributed.all_gather_object(
-        all_unique_id, unique_id, process_group
-    )
-    for id in all_unique_id[1:]:
-        assert (
-            id == all_unique_id[0]
-        ), f"id:{id} !=  all_unique_id[0]:{file_name}"
-
-
 def merge_state_dict_metadata(global_state_dict_metadata):
     assert isinstance(
         global_state_dict_metadata, list
@@ -73,32 +54,113 @@ def dedup_key_in_dict(global_storage_metadata):
     return out
 
 
-def dedup_tensor(
-    local_state_dict, local_storage_metadata, global_storage_metadata
-):
+def balance_replicated_tensors(global_storage_sizes):
     """
-    Dedup the replicated tensor in local state_dict.
+    Assign every local tensor to one of the ranks holding it, so that each
+    replicated tensor is saved only once and the bytes saved by ranks are
+    balanced.
 
     Args:
-        local_state_dict(Dict[str, paddle.Tensor]): The state_dict of current rank.
-        local_storage_metadata(Dict[LocalTensorIndex, str]): The storage metadata of current rank.
-        global_storage_metadata(Dict[LocalTensorIndex, str]): The final storage metadata of all ranks.
+        global_storage_sizes(List[Tuple[int, Dict[LocalTensorIndex, int]]]): The rank and the bytes of every local tensor of all ranks.
+
+    Returns:
+        Dict[LocalTensorIndex, int]: The rank to save every local tensor.
 
     Examples:
-        In rank0, local_state_dict:{"w1": t1_0, "w2": t2}, local_storage_metadata:{LocalTensorIndex("w1", (0,0)): "0_0.distcp", LocalTensorIndex("w2", (0,0)): "0_0.distcp"},
-        in rank1, local_state_dict:{"w1": t1_1, "w2": t2}, local_storage_metadata:{LocalTensorIndex("w1", (1,0)): "1_0.distcp", LocalTensorIndex("w2", (0,0)): "1_0.distcp"},
-        global_storage_metadata:{LocalTensorIndex("w1", (0,0)): "0_0.distcp", LocalTensorIndex("w1", (1,0)): "1_0.distcp", LocalTensorIndex("w2", (0, 0)): "0_0.distcp"}.
-        w2 is replicated in rank0 and rank1. We save it in rank0 as default thus need to remove it in other ranks.
-        Finally, the local_state_dict:{"w1": t1_1, "w2": t2} in rank1 update to {"w1": t1_1}.
+        global_storage_sizes:[(0, {LocalTensorIndex("w1", (0,0)): 64, LocalTensorIndex("w2", (0,0)): 16, LocalTensorIndex("w3", (0,)): 8}),
+                              (1, {LocalTensorIndex("w1", (0,0)): 64, LocalTensorIndex("w2", (1,0)): 16, LocalTensorIndex("w3", (0,)): 8})].
+        w2 is sharded, the shards are saved in their own ranks, then both rank0 and rank1 hold 16 bytes.
+        w1 and w3 are replicated, they are assigned from the largest one to the least loaded rank, with ties broken by the lower rank,
+        thus w1 is saved in rank0 and w3 is saved in rank1.
     """
+    holders = {}
+    sizes = {}
+    for rank, storage_sizes in global_storage_sizes:
+        for tensor_index, nbytes in storage_sizes.items():
+            holders.setdefault(tensor_index, []).append(rank)
+            sizes[tensor_index] = nbytes
+
+    loads = {rank: 0 for rank, _ in global_storage_sizes}
+    owners = {}
+    replicated = []
+    for tensor_index, ranks in holders.items():
+        if len(ranks) == 1:
+            owners[tensor_index] = ranks[0]
+            loads[ranks[0]] += sizes[tensor_index]
+        else:
+            replicated.append(tensor_index)
+    # sorted is stable, replicated tensors of the same size keep key order
+    for tensor_index in sorted(replicated, key=lambda x: -sizes[x]):
+        rank = min(holders[tensor_index], key=lambda r: (loads[r], r))
+        owners[tensor_index] = rank
+        loads[rank] += sizes[tensor_index]
+    return owners
+
+
+def split_into_files(storage_sizes, num_files):
+    """
+    Split local tensors into at most num_files groups of balanced bytes.
+
+    Args:
+        storage_sizes(Dict[LocalTensorIndex, int]): The bytes of local tensors to split.
+        num_files(int): The max number of groups.
+
+    Returns:
+        List[List[LocalTensorIndex]]: The non-empty groups of local tensors, tensors in a group keep their order in storage_sizes.
+    """
+    num_files = max(1, min(num_files, len(storage_sizes)))
+    order = {index: i for i, index in enumerate(storage_sizes)}
+    groups = [[] for _ in range(num_files)]
+    loads = [0] * num_files
+    for tensor_index in sorted(storage_sizes, key=lambda x: -storage_sizes[x]):
+        i = loads.index(min(loads))
+        groups[i].append(tensor_index)
+        loads[i] += storage_sizes[tensor_index]
+    return [sorted(group, key=lambda x: order[x]) for group in groups if group]
+
+
+def get_file_name(rank, unique_id, file_id, num_files):
+    if num_files == 1:
+        return f"{rank}_{unique_id}.distcp"
+    return f"{rank}_{unique_id}_{file_id}.distcp"
+
+
+_BACKGROUND_WRITER = None
+
+
+def snapshot_state_dict(state_dict):
+    """
+    Copy the tensors of state_dict to host memory, keeping their names.
+    """
+    snapshot = {}
+    for key, value in state_dict.items():
+        value = value.detach()
+        copied = value.clone() if value.place.is_cpu_place() else value.cpu()
+        copied.name = value.name
+        snapshot[key] = copied
+    return snapshot
 
-    for tensor_index, file_name in global_storage_metadata.items():
-        rank = int(file_name.split(".")[0].split("_")[0])
-        if (
-            tensor_index in local_storage_metadata
-            and rank != paddle.distributed.get_rank()
-        ):
-            local_state_dict.pop(tensor_index.tensor_key)
+
+def write_files(
+    path, file_to_state_dict, metadata, metadata_file, num_threads, save_func
+):
+    """
+    Write the state_dict files of current rank with a thread pool, then write
+    the metadata file if it is given.
+    """
+    if num_threads > 1:
+        with ThreadPoolExecutor(num_threads) as pool:
+            futures = [
+                pool.submit(save_func, sub_state_dict, os.path.join(path, f))
+                for f, sub_state_dict in file_to_state_dict.items()
+            ]
+            for future in futures:
+                future.result()
+    else:
+        for f, sub_state_dict in file_to_state_dict.items():
+            save_func(sub_state_dict, os.path.join(path, f))
+    if metadata_file is not None:
+        paddle.save(metadata, os.path.join(path, metadata_file))
 
 
 def save_state_dict(
@@ -106,15 +168,24 @@ def save_state_dict(
     path,
     process_group=None,
     coordinator_rank=0,
-) -> None:
+    num_files_per_rank=1,
+    async_save=False,
+):
     """
-    Save the state_dict of model to path.
+    Save the state_dict of model to path. The local tensors are saved in the tensor container format of
+    ``paddle.save``, so that the slices to load can be read from the memory-mapped files by ``load_state_dict``.
 
     Args:
         state_dict(Dict[str, paddle.Tensor]): The state_dict to save.
         path(str): The directory to save state_dict.
         process_group(paddle.distributed.collective.Group): ProcessGroup to be used for cross-rank synchronization. Use the default process group which contains all cards.
         coordinator_rank(int): The rank used to save non distributed values. Rank0 is used by default.
+        num_files_per_rank(int): The number of files to split the state_dict of each rank into, which are written by as many threads in parallel. Default: 1.
+        async_save(bool): If True, the local tensors are copied to host memory and the files are written in background, a ``concurrent.futures.Future``
+            which is done when all files of current rank are written is returned. Otherwise, return after all files of current rank are written. Default: False.
+
+    Returns:
+        concurrent.futures.Future|None: The future of the background writes if ``async_save`` is True, otherwise None.
 
     Examples:
         .. code-block:: python
@@ -130,10 +201,15 @@ def save_state_dict(
             >>> # doctest: -SKIP
 
     """
+    global _BACKGROUND_WRITER
+
     with paddle.base.dygraph.guard():
         assert isinstance(
             state_dict, dict
         ), "The state_dict should be a dictionary."
+        assert (
+            isinstance(num_files_per_rank, int) and num_files_per_rank > 0
+        ), f"num_files_per_rank should be a positive integer, but got {num_files_per_rank}."
         flat_state_dict, mapping = flatten_state_dict(state_dict)
         if len(flat_state_dict) > 0:
             for val in flat_state_dict.values():
@@ -150,22 +226,18 @@ def save_state_dict(
             # Init the default global process group
             paddle.distributed.init_parallel_env()
 
+        cur_rank = paddle.distributed.get_rank()
         unique_id = 0
-        file_name = ""
-        while True:
-            file_name = f"{paddle.distributed.get_rank()}_{unique_id}.distcp"
-            if not os.path.exists(os.path.join(path, file_name)):
-                break
+        while os.path.exists(
+            os.path.join(path, get_file_name(cur_rank, unique_id, 0, 1))
+        ) or os.path.exists(
+            os.path.join(path, get_file_name(cur_rank, unique_id, 0, 2))
+        ):
             unique_id += 1
-        logger.debug(f"file_name:{file_name}")
-        if use_dist:
-            check_file_name(file_name, process_group)
-            # the parameter_name and order in state_dict should be the same
-            check_state_dict(flat_state_dict, process_group)
-        metadata = Metadata()
+        logger.debug(f"unique_id:{unique_id}")
         local_state_dict = {}
         local_state_dict_metadata = {}
-        local_storage_metadata = {}
+        local_storage_sizes = {}
         for key, val in flat_state_dict.items():
             if isinstance(val, paddle.Tensor):
                 # Case1: not initialized means this tensor is placed in another mesh which do not contain this rank
@@ -202,40 +274,105 @@ def save_state_dict(
                 local_state_dict_metadata[key] = LocalTensorMetadata(
                     global_offset, local_shape
                 )
-                local_storage_metadata[
+                local_storage_sizes[
                     LocalTensorIndex(key, tuple(global_offset))
-                ] = file_name
+                ] = (
+                    math.prod(local_tensor.shape) * local_tensor.element_size()
+                )
 
-        global_state_dict_metadata = []
-        global_storage_metadata = []
-        global_flatten_mapping = []
+        # exchange all the metadata with one collective
+        local_info = {
+            "rank": cur_rank,
+            "unique_id": unique_id,
+            "keys": list(flat_state_dict.keys()),
+            "state_dict_metadata": local_state_dict_metadata,
+            "storage_sizes": local_storage_sizes,
+            "mapping": mapping,
+        }
+        global_infos = []
         if use_dist:
             paddle.distributed.all_gather_object(
-                global_state_dict_metadata,
-                local_state_dict_metadata,
-                process_group,
-            )
-            paddle.distributed.all_gather_object(
-                global_storage_metadata, local_storage_metadata, process_group
-            )
-            paddle.distributed.all_gather_object(
-                global_flatten_mapping, mapping, process_group
+                global_infos, local_info, process_group
             )
         else:
-            global_state_dict_metadata.append(local_state_dict_metadata)
-            global_storage_metadata.append(local_storage_metadata)
-            global_flatten_mapping.append(mapping)
+            global_infos.append(local_info)
+        for info in global_infos[1:]:
+            # the parameter_name and order in state_dict should be the same
+            assert (
+                info["keys"] == global_infos[0]["keys"]
+            ), f"keys:{info['keys']} != first_keys: {global_infos[0]['keys']}"
+            assert (
+                info["unique_id"] == unique_id
+            ), f"unique_id:{info['unique_id']} != unique_id: {unique_id}"
+
+        # every rank plans the files of all ranks in the same way, so the
+        # storage metadata needs no more collective
+        owners = balance_replicated_tensors(
+            [(info["rank"], info["storage_sizes"]) for info in global_infos]
+        )
+        global_storage_metadata = {}
+        file_to_state_dict = {}
+        for info in global_infos:
+            rank = info["rank"]
+            storage_sizes = {
+                index: nbytes
+                for index, nbytes in info["storage_sizes"].items()
+                if owners[index] == rank
+            }
+            groups = split_into_files(storage_sizes, num_files_per_rank)
+            for file_id, group in enumerate(groups):
+                file_name = get_file_name(rank, unique_id, file_id, len(groups))
+                for tensor_index in group:
+                    global_storage_metadata[tensor_index] = file_name
+                if rank == cur_rank:
+                    file_to_state_dict[file_name] = {
+                        index.tensor_key: local_state_dict[index.tensor_key]
+                        for index in group
+                    }
+        if len(file_to_state_dict) == 0:
+            # keep a file for every rank, which unique_id is searched by
+            file_to_state_dict[get_file_name(cur_rank, unique_id, 0, 1)] = {}
 
+        metadata = Metadata()
         metadata.state_dict_metadata = merge_state_dict_metadata(
-            global_state_dict_metadata
+            [info["state_dict_metadata"] for info in global_infos]
+        )
+        metadata.storage_metadata = global_storage_metadata
+        metadata.flat_mapping = dedup_key_in_dict(
+            [info["mapping"] for info in global_infos]
         )
-        metadata.storage_metadata = dedup_key_in_dict(global_storage_metadata)
-        metadata.flat_mapping = dedup_key_in_dict(global_flatten_mapping)
-        if coordinator_rank == paddle.distributed.get_rank():
+        metadata_file = None
+        if coordinator_rank == cur_rank:
             logger.debug(f"metadata:{metadata}")
-            paddle.save(metadata, os.path.join(path, f"{unique_id}.metadata"))
-        logger.debug(f"local_state_dict:{local_state_dict}")
-        dedup_tensor(
-            local_state_dict, local_storage_metadata, metadata.storage_metadata
+            metadata_file = f"{unique_id}.metadata"
+        logger.debug(f"file_to_state_dict:{file_to_state_dict}")
+
+        num_threads = min(num_files_per_rank, len(file_to_state_dict))
+        if not async_save:
+            write_files(
+                path,
+                file_to_state_dict,
+                metadata,
+                metadata_file,
+                num_threads,
+                _save_container,
+            )
+            return None
+
+        # snapshot the local tensors on host, so that they can be updated by
+        # training while the files are written in background
+        for file_name, sub_state_dict in file_to_state_dict.items():
+            file_to_state_dict[file_name] = snapshot_state_dict(sub_state_dict)
+        if _BACKGROUND_WRITER is None:
+            _BACKGROUND_WRITER = ThreadPoolExecutor(
+                1, thread_name_prefix="save_state_dict"
+            )
+        return _BACKGROUND_WRITER.submit(
+            write_files,
+            path,
+            file_to_state_dict,
+            metadata,
+            metadata_file,
+            num_threads,
+            _save_container,
         )
-        paddle.save(local_state_dict, os.path.join(path, file_name))
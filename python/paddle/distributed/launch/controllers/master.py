@@ -155,14 +155,15 @@ class HTTPMaster(Master):
         k = f"{prefix}/{ky}/{rank}"
 
         while not self.ctx.status.is_done():
-            if not self.client.put(k, value):
-                self.ctx.logger.warning("put value failed")
+            # put and wait for all peers in one request
+            rjson = self.client.put_and_wait(k, value, prefix, size)
+            if rjson is None:
+                self.ctx.logger.warning("waiting peers timeout or failed")
                 time.sleep(0.1)
                 continue
 
-            rjson = self.client.get_prefix(prefix)
             self.ctx.logger.debug(f"sync peers {rjson}")
-            if rjson and len(rjson) == size:
+            if len(rjson) == size:
                 if self.ctx.args.sort_ip:
                     ret = sorted(rjson.values(), key=_cmp_by_ip)
                     idx = ret.index(value)
@@ -58,6 +58,49 @@ class KVClient:
         except:
             return ""
 
+    def wait_prefix(self, key, size, timeout=30):
+        """
+        Blocks until there are at least size keys with prefix key, returns
+        the dict of them, or None if timed out or failed.
+        """
+        key = key if key.startswith('/') else f"/{key}"
+        u = f"{self.endpoint}{key}"
+        try:
+            r = httpx.get(
+                u,
+                params={'size': size, 'timeout': timeout},
+                timeout=timeout + 10,
+                follow_redirects=True,
+            )
+            if r.status_code == 200:
+                return r.json()
+        except:
+            pass
+        return None
+
+    def put_and_wait(self, key, value, prefix, size, timeout=30):
+        """
+        Puts value of key, then blocks until there are at least size keys
+        with prefix in one request, returns the dict of them, or None if
+        timed out or failed.
+        """
+        key = key if key.startswith('/') else f"/{key}"
+        prefix = prefix if prefix.startswith('/') else f"/{prefix}"
+        u = f"{self.endpoint}{key}"
+        try:
+            r = httpx.post(
+                u,
+                data=value,
+                params={'prefix': prefix, 'size': size, 'timeout': timeout},
+                timeout=timeout + 10,
+                follow_redirects=True,
+            )
+            if r.status_code == 200:
+                return r.json()
+        except:
+            pass
+        return None
+
     def delete(self, key):
         key = key if key.startswith('/') else f"/{key}"
         u = f"{self.endpoint}{key}"
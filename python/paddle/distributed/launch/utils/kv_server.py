@@ -12,46 +12,85 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import bisect
 import http.server as SimpleHTTPServer
 import json
 import threading
-from http.server import HTTPServer
+import time
+import urllib.parse
+from http.server import ThreadingHTTPServer
 from multiprocessing import Process
 
+# the longest time in seconds a request waits for keys
+MAX_WAIT_TIMEOUT = 60
+
+
+def _prefix_end(prefix):
+    # the smallest string greater than all strings starting with prefix
+    return prefix + '\U0010ffff'
+
 
 class KVHandler(SimpleHTTPServer.SimpleHTTPRequestHandler):
+    """
+    GET /prefix returns all keys starting with /prefix, POST/PUT /key sets
+    the value of /key and DELETE /key deletes it.
+
+    GET and POST/PUT accept query `size` and `timeout`, with which the
+    request blocks until there are at least `size` keys starting with the
+    prefix (the query `prefix` of POST/PUT), and returns them, or responses
+    408 if timed out. So that peers put and wait for each other in one round
+    trip.
+    """
+
+    def _parse_path(self):
+        url = urllib.parse.urlsplit(self.path)
+        return url.path, dict(urllib.parse.parse_qsl(url.query))
+
+    def _output_prefix(self, prefix, query):
+        if 'size' in query:
+            timeout = min(
+                float(query.get('timeout', MAX_WAIT_TIMEOUT)), MAX_WAIT_TIMEOUT
+            )
+            ret = self.server.wait_prefix(prefix, int(query['size']), timeout)
+            if ret is None:
+                self.output(408)
+                return
+        else:
+            ret = self.server.get_prefix(prefix)
+
+        if ret:
+            self.output(200, json.dumps(ret).encode("utf-8"))
+        else:
+            self.output(404)
+
     def do_GET(self):
-        with self.server.kv_lock:
-            ret = {}
-            for k, v in self.server.kv.items():
-                if k.startswith(self.path):
-                    ret[k] = v.decode(encoding="utf-8")
-            if ret:
-                self.output(200, json.dumps(ret).encode("utf-8"))
-            else:
-                self.output(404)
+        prefix, query = self._parse_path()
+        self._output_prefix(prefix, query)
 
     def do_PUT(self):
         self.do_POST()
 
     def do_POST(self):
+        key, query = self._parse_path()
         content_length = int(self.headers['Content-Length'] or 0)
         try:
             value = self.rfile.read(content_length)
-            with self.server.kv_lock:
-                self.server.kv[self.path] = value
-                self.output(200)
-                return
+            self.server.put(key, value)
         except:
             self.output(500)
+            return
+
+        if 'size' in query:
+            self._output_prefix(query.get('prefix', key), query)
+        else:
+            self.output(200)
 
     def do_DELETE(self):
-        with self.server.kv_lock:
-            if self.path in self.server.kv:
-                del self.server.kv[self.path]
-                self.output(200)
-            else:
-                self.output(404)
+        key, _ = self._parse_path()
+        if self.server.delete(key):
+            self.output(200)
+        else:
+            self.output(404)
 
     def output(self, code, value=''):
         self.send_response(code)
@@ -65,15 +104,68 @@ class KVHandler(SimpleHTTPServer.SimpleHTTPRequestHandler):
         return
 
 
-class KVServer(HTTPServer):
+class KVServer(ThreadingHTTPServer):
+    # requests are handled in threads, waiting requests don't block others
+    daemon_threads = True
+    # all pods connect at the same time in rendezvous
+    request_queue_size = 4096
+
     def __init__(self, port):
         super().__init__(('', port), KVHandler)
-        self.kv_lock = threading.Lock()
+        self.kv_lock = threading.Condition()
         self.kv = {'/healthy': b'ok'}
+        # sorted keys for prefix lookups
+        self.keys = ['/healthy']
         self.port = port
         self.stopped = False
         self.started = False
 
+    def put(self, key, value):
+        with self.kv_lock:
+            if key not in self.kv:
+                bisect.insort(self.keys, key)
+            self.kv[key] = value
+            self.kv_lock.notify_all()
+
+    def delete(self, key):
+        with self.kv_lock:
+            if key not in self.kv:
+                return False
+            del self.kv[key]
+            del self.keys[bisect.bisect_left(self.keys, key)]
+            return True
+
+    def _prefix_range(self, prefix):
+        begin = bisect.bisect_left(self.keys, prefix)
+        end = bisect.bisect_left(self.keys, _prefix_end(prefix), lo=begin)
+        return begin, end
+
+    def _items(self, begin, end):
+        return {
+            k: self.kv[k].decode(encoding="utf-8") for k in self.keys[begin:end]
+        }
+
+    def get_prefix(self, prefix):
+        with self.kv_lock:
+            return self._items(*self._prefix_range(prefix))
+
+    def wait_prefix(self, prefix, size, timeout):
+        """
+        Waits until there are at least size keys starting with prefix and
+        returns them, or returns None if timed out or the server stopped.
+        """
+        deadline = time.time() + timeout
+        with self.kv_lock:
+            while not self.stopped:
+                begin, end = self._prefix_range(prefix)
+                if end - begin >= size:
+                    return self._items(begin, end)
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return None
+                self.kv_lock.wait(remaining)
+        return None
+
     def start(self):
         self.listen_thread = threading.Thread(target=self.serve_forever)
         self.listen_thread.start()
@@ -83,7 +175,10 @@ class KVServer(HTTPServer):
         self.shutdown()
         self.listen_thread.join()
         self.server_close()
-        self.stopped = True
+        with self.kv_lock:
+            self.stopped = True
+            # wake up waiting requests
+            self.kv_lock.notify_all()
 
 
 class PKVServer:
@@ -112,7 +207,6 @@ if __name__ == '__main__':
     # kv = PKVServer(8090)
     kv = KVServer(8090)
     kv.start()
-    import time
 
     # print("serve at 8090 for 600 s")
 
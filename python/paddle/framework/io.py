@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import collections
+import concurrent.futures
 import copyreg
 import os
 import pickle
@@ -38,6 +39,7 @@ from paddle.base.framework import (
     in_dygraph_mode,
 )
 
+from .io_container import _is_container, _load_container, _save_container
 from .io_utils import (
     _is_file_path,
     _is_memory_buffer,
@@ -52,14 +54,137 @@ __all__ = []
 async_save_queue = []
 
 
+class _AsyncCheckpointEngine:
+    """Stages tensors to host and writes checkpoints in background.
+
+    Tensors are copied into reusable (pinned, if compiled with CUDA) host
+    buffers on a side stream, the default stream waits for the copies on
+    device so that in-place updates of the next step are ordered after them,
+    while the host returns immediately. A bounded writer pool waits for the
+    copies and saves the staged object to a temporary file, which is renamed
+    to the target path when it is complete. At most ``max_pending`` saves
+    are in flight, later ones block until a former one finishes.
+    """
+
+    def __init__(self, num_writers=2, max_pending=2):
+        self._writers = concurrent.futures.ThreadPoolExecutor(
+            num_writers, thread_name_prefix='paddle_async_save'
+        )
+        self._pending = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+        self._free_buffers = collections.defaultdict(list)
+        self._last_jobs = {}
+        self._stream = None
+
+    def _acquire_buffer(self, tensor):
+        key = (tuple(tensor.shape), tensor.dtype)
+        with self._lock:
+            if self._free_buffers[key]:
+                return self._free_buffers[key].pop(), True
+        # NOTE: the first save allocates staging buffers with a blocking
+        #       copy, later saves reuse them
+        if core.is_compiled_with_cuda():
+            return tensor.pin_memory(), False
+        elif tensor.place.is_cpu_place():
+            return tensor.detach().clone(), False
+        return tensor.cpu(), False
+
+    def _release_buffers(self, buffers):
+        with self._lock:
+            for buffer in buffers:
+                key = (tuple(buffer.shape), buffer.dtype)
+                self._free_buffers[key].append(buffer)
+
+    def _stage(self, obj, buffers, blocking):
+        if isinstance(obj, core.eager.Tensor):
+            buffer, reused = self._acquire_buffer(obj)
+            if reused:
+                buffer.copy_(obj, blocking)
+            buffer.name = obj.name
+            buffers.append(buffer)
+            return buffer
+        elif type(obj) in (dict, collections.OrderedDict):
+            return type(obj)(
+                (k, self._stage(v, buffers, blocking)) for k, v in obj.items()
+            )
+        elif type(obj) in (list, tuple):
+            return type(obj)(self._stage(v, buffers, blocking) for v in obj)
+        return obj
+
+    def _write(self, obj, path, buffers, event, last_job, protocol, configs):
+        try:
+            if event is not None:
+                event.synchronize()
+            if last_job is not None:
+                # keep the order of saves to the same path
+                concurrent.futures.wait([last_job])
+            if _is_file_path(path):
+                tmp_path = f'{path}.{os.getpid()}.tmp'
+                try:
+                    save(obj, tmp_path, protocol, **configs)
+                    os.replace(tmp_path, path)
+                finally:
+                    if os.path.exists(tmp_path):
+                        os.remove(tmp_path)
+            else:
+                save(obj, path, protocol, **configs)
+        finally:
+            self._release_buffers(buffers)
+            self._pending.release()
+        return path
+
+    def submit(self, obj, path, protocol, configs):
+        self._pending.acquire()
+        try:
+            buffers = []
+            event = None
+            if core.is_compiled_with_cuda():
+                if self._stream is None:
+                    self._stream = paddle.device.Stream()
+                current_stream = paddle.device.current_stream()
+                self._stream.wait_stream(current_stream)
+                with paddle.device.stream_guard(self._stream):
+                    staged = self._stage(obj, buffers, blocking=False)
+                event = self._stream.record_event()
+                current_stream.wait_event(event)
+            else:
+                staged = self._stage(obj, buffers, blocking=True)
+        except:
+            self._release_buffers(buffers)
+            self._pending.release()
+            raise
+
+        key = path if _is_file_path(path) else id(path)
+        with self._lock:
+            self._last_jobs = {
+                k: v for k, v in self._last_jobs.items() if not v.done()
+            }
+            last_job = self._last_jobs.get(key)
+            job = self._writers.submit(
+                self._write,
+                staged,
+                path,
+                buffers,
+                event,
+                last_job,
+                protocol,
+                configs,
+            )
+            self._last_jobs[key] = job
+        return job
+
+
+_async_save_engine = None
+
+
 def clear_async_save_task_queue():
     '''
     wait until all async save task to be done.
     '''
     while len(async_save_queue) > 0:
         task = async_save_queue.pop()
-        if task and task.is_alive():
-            task.join()
+        if task:
+            task.result()
 
 
 def async_save(obj, path, protocol=4, sync_other_task=False, **configs):
@@ -68,7 +193,10 @@ def async_save(obj, path, protocol=4, sync_other_task=False, **configs):
     Note:
         currently only support dygraph mode.
     Note:
-        any argument passed through configs will be overrided by default setting.
+        Tensors are copied to reusable host staging buffers on a side stream, and
+        the object is saved by a bounded pool of background writers to a temporary
+        file, which is renamed to ``path`` when it is complete. If too many saves are
+        in flight, this call blocks until a former one finishes.
     Args:
         obj(Object) : The object to be saved.
         path(str|BytesIO) : The path/buffer of the object to be saved.
@@ -76,7 +204,10 @@ def async_save(obj, path, protocol=4, sync_other_task=False, **configs):
         protocol(int, optional): The protocol version of pickle module must be greater than 1 and less than 5.
                                  Default: 4
         sync_other_task(bool) : Determine whether to wait other async save task to be finished before this one be put in queue.
-        **configs(dict, optional): compatible argument to paddle.save, but will be overrided by default setting.
+        **configs(dict, optional): optional keyword arguments, the same as paddle.save.
+    Returns:
+        concurrent.futures.Future: the future of the save task, whose result is ``path``
+        when the checkpoint is completely written.
     Examples:
         .. code-block:: python
             :name: code-example-1
@@ -86,43 +217,35 @@ def async_save(obj, path, protocol=4, sync_other_task=False, **configs):
             layer_state_dict = emb.state_dict()
 
             # call paddle.async_save with the same style of paddle.save
-            paddle.async_save(layer_state_dict, "emb.pdparams")
+            future = paddle.async_save(layer_state_dict, "emb.pdparams")
             for i in range(10):
                 # do some calculations here
             # wait if any async_save task has not been done
-            paddle.clear_async_task_queue()
+            paddle.clear_async_save_task_queue()
+            # or wait for the specified task
+            future.result()
     '''
+    global _async_save_engine
+
     if not in_dygraph_mode():
         raise ValueError(
             "async_save currently is not supported in static mode."
         )
-    if len(configs) > 0:
-        warnings.warn(
-            "configs are not supported in async mode, will be overided by default settings."
-        )
-
-    # TODO: make this part async
-    def move_state_dict_to_cpu(sd):
-        for k, v in sd.items():
-            if isinstance(v, dict):
-                move_state_dict_to_cpu(v)
-            elif isinstance(v, core.eager.Tensor):
-                sd[k] = v.pin_memory() if core.is_compiled_with_cuda() else v
-
-    if isinstance(obj, dict):
-        move_state_dict_to_cpu(obj)
-    elif isinstance(obj, core.eager.Tensor):
-        obj = obj.pin_memory() if core.is_compiled_with_cuda() else obj
-    else:
+    if not isinstance(obj, (dict, core.eager.Tensor)):
         # other types are currently not supported
         raise TypeError(
             f"currently async_save does not support this type: {type(obj)}"
         )
+    # check configs here, errors of background writers are raised by future
+    _parse_save_config(configs)
+
     if sync_other_task:
         clear_async_save_task_queue()
-    t = threading.Thread(target=save, args=(obj, path, protocol))
-    t.start()
-    async_save_queue.append(t)
+    if _async_save_engine is None:
+        _async_save_engine = _AsyncCheckpointEngine()
+    task = _async_save_engine.submit(obj, path, protocol, configs)
+    async_save_queue.append(task)
+    return task
 
 
 def _build_saved_state_dict(state_dict):
@@ -305,6 +428,7 @@ def _parse_load_config(configs):
         'params_filename',
         'keep_name_table',
         'return_numpy',
+        'mmap',
     ]
 
     # input check
@@ -325,12 +449,17 @@ def _parse_load_config(configs):
     inner_config.params_filename = configs.get('params_filename', None)
     inner_config.keep_name_table = configs.get('keep_name_table', None)
     inner_config.return_numpy = configs.get('return_numpy', False)
+    inner_config.mmap = configs.get('mmap', False)
 
     return inner_config
 
 
 def _parse_save_config(configs):
-    supported_configs = ['use_binary_format', 'pickle_protocol']
+    supported_configs = [
+        'use_binary_format',
+        'pickle_protocol',
+        'use_tensor_container',
+    ]
 
     # input check
     for key in configs:
@@ -348,6 +477,9 @@ def _parse_save_config(configs):
     inner_config = _SaveLoadConfig()
     inner_config.use_binary_format = configs.get('use_binary_format', False)
     inner_config.pickle_protocol = configs.get('pickle_protocol', None)
+    inner_config.use_tensor_container = configs.get(
+        'use_tensor_container', False
+    )
 
     return inner_config
 
@@ -744,6 +876,11 @@ def save(obj, path, protocol=4, **configs):
           use_binary_format(bool): When the saved object is static graph variable, you can specify ``use_binary_for_var``.
           If True, save the file in the c++ binary format when saving a single static graph variable; otherwise, save it in pickle format.
           Default: False
+          use_tensor_container(bool): If True, save the object in the tensor container format instead of pickle format. The file
+          starts with a JSON header of the object structure and the dtypes, shapes and offsets of tensors, followed by aligned raw
+          tensor data, which is written directly from tensor buffers and can be loaded without unpickling and memory-mapped by
+          ``paddle.load``. Only Tensor, numpy.ndarray and nested dict, list and tuple of them and python scalars are supported.
+          Default: False
 
     Returns:
         None
@@ -877,8 +1014,17 @@ def save(obj, path, protocol=4, **configs):
             )
         )
 
+    if not isinstance(config.use_tensor_container, bool):
+        raise TypeError(
+            "Type of `use_tensor_container` should be bool, but received {}.".format(
+                type(config.use_tensor_container)
+            )
+        )
+
     if config.use_binary_format:
         _save_binary_var(obj, path)
+    elif config.use_tensor_container:
+        _save_container(obj, path)
     else:
         # `protocol` need to be used, `pickle_protocol` is a deprecated arg.
         if config.pickle_protocol is not None:
@@ -1002,6 +1148,9 @@ def load(path, **configs):
             by default.
             (3) return_numpy(bool): If specified as True, return tensor as numpy.ndarray, otherwise return tensor as paddle.Tensor.
             Default False.
+            (4) mmap(bool): Only takes effect for files saved with ``use_tensor_container=True``. If specified as True, the file
+            is memory-mapped, tensors returned as numpy.ndarray share memory with the mapping instead of being read into memory, and
+            a saved dict is returned as a read-only mapping whose values are loaded when they are accessed. Default False.
 
     Returns:
         Object(Object): a target object can be used in paddle
@@ -1124,6 +1273,8 @@ def load(path, **configs):
 
     if _is_memory_buffer(path) or os.path.isfile(path):
         config = _parse_load_config(configs)
+        if _is_container(path):
+            return _load_tensor_container(path, config)
         exception_type = pickle.UnpicklingError
         try:
             with _open_file_buffer(path, 'rb') as f:
@@ -1205,6 +1356,31 @@ def load(path, **configs):
     return load_result
 
 
+def _load_tensor_container(path, config):
+    names = {}
+
+    def ndarray_to_tensor(ndarray, name):
+        tensor = _ndarray_to_tensor(ndarray, return_numpy=False)
+        if name and in_dygraph_mode():
+            tensor.name = name
+        names[id(tensor)] = name
+        return tensor
+
+    load_result = _load_container(
+        path,
+        None if config.return_numpy else ndarray_to_tensor,
+        lazy=config.mmap,
+    )
+    if config.keep_name_table and isinstance(load_result, dict):
+        # the same name table as loading a state_dict saved in pickle format
+        load_result["StructuredToParameterName@@"] = {
+            key: names[id(value)]
+            for key, value in load_result.items()
+            if names.get(id(value))
+        }
+    return load_result
+
+
 def _legacy_load(path, **configs):
     load_result = None
     config = _parse_load_config(configs)
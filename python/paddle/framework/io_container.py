@@ -0,0 +1,265 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Tensor container format of `paddle.save(..., use_tensor_container=True)`:
+#
+#   magic (8 bytes) | header length (uint64, little endian) | JSON header |
+#   padding | payload 0 | padding | payload 1 | ...
+#
+# The JSON header holds the nested structure of the saved object, in which
+# tensors are replaced by indices of their dtype, shape, name and byte offset
+# relative to the first payload. Payloads are the raw bytes of tensors in C
+# order, aligned to `_ALIGNMENT` bytes, so that they can be mapped to numpy
+# arrays without copying and without unpickling anything.
+
+import collections
+import json
+import mmap
+import struct
+from collections.abc import Mapping
+
+import numpy as np
+
+from paddle.base import core
+from paddle.base.data_feeder import convert_dtype
+
+from .io_utils import _is_file_path, _open_file_buffer
+
+__all__ = []
+
+_MAGIC = b'PDTENSOR'
+_VERSION = 1
+_ALIGNMENT = 64
+_HEADER_LEN = struct.Struct('<Q')
+
+
+def _align(offset):
+    return (offset + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+def _is_leaf(obj):
+    return isinstance(
+        obj, (core.eager.Tensor, core.LoDTensor, np.ndarray, np.generic)
+    )
+
+
+def _encode_tree(obj, leaves):
+    if _is_leaf(obj):
+        leaves.append(obj)
+        return {'t': len(leaves) - 1}
+    if obj is None or isinstance(obj, (bool, int, float, str)):
+        return {'v': obj}
+    if type(obj) in (dict, collections.OrderedDict):
+        items = []
+        for key, value in obj.items():
+            if not (key is None or isinstance(key, (bool, int, float, str))):
+                raise TypeError(
+                    "The tensor container format only supports dict keys of "
+                    f"type str, int, float, bool or None, but received {type(key)}."
+                )
+            items.append([key, _encode_tree(value, leaves)])
+        return {'o' if type(obj) is collections.OrderedDict else 'd': items}
+    if type(obj) in (list, tuple):
+        values = [_encode_tree(value, leaves) for value in obj]
+        return {'l' if type(obj) is list else 'u': values}
+    raise TypeError(
+        "The tensor container format supports Tensor, numpy.ndarray and "
+        "nested dict, list and tuple of them and python scalars, but "
+        f"received {type(obj)}. Please save it without use_tensor_container."
+    )
+
+
+def _decode_tree(node, get_leaf):
+    ((tag, value),) = node.items()
+    if tag == 't':
+        return get_leaf(value)
+    if tag == 'v':
+        return value
+    if tag in ('d', 'o'):
+        cls = collections.OrderedDict if tag == 'o' else dict
+        return cls((key, _decode_tree(item, get_leaf)) for key, item in value)
+    values = [_decode_tree(item, get_leaf) for item in value]
+    return values if tag == 'l' else tuple(values)
+
+
+def _leaf_meta(leaf):
+    if isinstance(leaf, core.eager.Tensor):
+        return convert_dtype(leaf.dtype), list(leaf.shape), 'tensor', leaf.name
+    if isinstance(leaf, core.LoDTensor):
+        return convert_dtype(leaf._dtype()), leaf.shape(), 'tensor', None
+    kind = 'scalar' if isinstance(leaf, np.generic) else 'ndarray'
+    return leaf.dtype.str, list(leaf.shape), kind, None
+
+
+def _leaf_to_host_array(leaf):
+    # NOTE: numpy arrays of DenseTensor on CPU share memory with the tensor,
+    #       so tensors on CPU are written from their own buffers, tensors on
+    #       devices are copied to host one at a time
+    if isinstance(leaf, core.eager.Tensor):
+        if not leaf.place.is_cpu_place():
+            leaf = leaf.cpu()
+        leaf = leaf.value().get_tensor()
+    elif isinstance(leaf, core.LoDTensor):
+        if not leaf._place().is_cpu_place():
+            place = core.Place()
+            place.set_place(core.CPUPlace())
+            leaf = leaf._copy(place)
+    return np.ascontiguousarray(leaf)
+
+
+def _save_container(obj, path):
+    leaves = []
+    tree = _encode_tree(obj, leaves)
+
+    metas = []
+    offset = 0
+    for leaf in leaves:
+        dtype, shape, kind, name = _leaf_meta(leaf)
+        nbytes = np.dtype(dtype).itemsize * int(np.prod(shape, dtype='int64'))
+        metas.append(
+            {
+                'dtype': np.dtype(dtype).str,
+                'shape': shape,
+                'kind': kind,
+                'name': name,
+                'offset': offset,
+                'nbytes': nbytes,
+            }
+        )
+        offset = _align(offset + nbytes)
+    header = json.dumps(
+        {
+            'version': _VERSION,
+            'nbytes': offset,
+            'tensors': metas,
+            'tree': tree,
+        }
+    ).encode('utf-8')
+    header_end = len(_MAGIC) + _HEADER_LEN.size + len(header)
+
+    with _open_file_buffer(path, 'wb') as f:
+        f.write(_MAGIC)
+        f.write(_HEADER_LEN.pack(len(header)))
+        f.write(header)
+        f.write(b'\0' * (_align(header_end) - header_end))
+        for leaf, meta in zip(leaves, metas):
+            array = _leaf_to_host_array(leaf)
+            if array.nbytes != meta['nbytes']:
+                raise ValueError(
+                    f"Expected {meta['nbytes']} bytes of tensor with shape "
+                    f"{meta['shape']} and dtype {meta['dtype']}, but got "
+                    f"{array.nbytes} bytes."
+                )
+            if array.nbytes > 0:
+                f.write(array.reshape(-1).view('uint8').data)
+            f.write(b'\0' * (_align(array.nbytes) - array.nbytes))
+
+
+def _is_container(path):
+    with _open_file_buffer(path, 'rb') as f:
+        pos = f.tell()
+        magic = f.read(len(_MAGIC))
+        f.seek(pos)
+    return magic == _MAGIC
+
+
+class _LazyContainerDict(Mapping):
+    """Read-only mapping of a dict saved in tensor container format, whose
+    values are loaded from the memory-mapped file when first accessed."""
+
+    def __init__(self, items, get_leaf):
+        self._items = dict(items)
+        self._get_leaf = get_leaf
+        self._loaded = {}
+
+    def __getitem__(self, key):
+        if key not in self._loaded:
+            self._loaded[key] = _decode_tree(self._items[key], self._get_leaf)
+        return self._loaded[key]
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(keys={list(self._items)})"
+
+
+def _load_container(path, convert_func, lazy=False):
+    """Loads an object saved in tensor container format.
+
+    Args:
+        path(str|BytesIO): the path or buffer to load from.
+        convert_func(Callable|None): called with the numpy array and the name
+            of every saved tensor, returns the loaded tensor. If None, tensors
+            are loaded as numpy arrays.
+        lazy(bool): if True, numpy arrays are views of the memory-mapped
+            file, and a dict is returned as a mapping which loads its values
+            on access.
+    """
+    with _open_file_buffer(path, 'rb') as f:
+        f.read(len(_MAGIC))
+        (header_len,) = _HEADER_LEN.unpack(f.read(_HEADER_LEN.size))
+        header = json.loads(f.read(header_len).decode('utf-8'))
+        if header['version'] > _VERSION:
+            raise ValueError(
+                f"The tensor container version {header['version']} is newer "
+                f"than the supported version {_VERSION}, please upgrade paddle."
+            )
+        header_end = len(_MAGIC) + _HEADER_LEN.size + header_len
+        f.read(_align(header_end) - header_end)
+        if _is_file_path(path):
+            # NOTE: copy-on-write mapping, arrays are writable and shared
+            #       with page cache until they are written to
+            data_offset = _align(header_end)
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        else:
+            data_offset = 0
+            data = bytearray(header['nbytes'])
+            f.readinto(data)
+
+    metas = header['tensors']
+
+    def get_leaf(index):
+        meta = metas[index]
+        dtype = np.dtype(meta['dtype'])
+        if meta['nbytes'] == 0:
+            array = np.empty(meta['shape'], dtype=dtype)
+        else:
+            array = np.frombuffer(
+                data,
+                dtype=dtype,
+                count=meta['nbytes'] // dtype.itemsize,
+                offset=data_offset + meta['offset'],
+            ).reshape(meta['shape'])
+        if meta['kind'] == 'tensor' and convert_func is not None:
+            # tensors are copied from payloads by convert_func
+            return convert_func(array, meta['name'])
+        if not lazy:
+            array = array.copy()
+        return array[()] if meta['kind'] == 'scalar' else array
+
+    tree = header['tree']
+    if lazy:
+        if set(tree) <= {'d', 'o'}:
+            ((_, items),) = tree.items()
+            return _LazyContainerDict(items, get_leaf)
+        return _decode_tree(tree, get_leaf)
+
+    result = _decode_tree(tree, get_leaf)
+    if isinstance(data, mmap.mmap):
+        data.close()
+    return result
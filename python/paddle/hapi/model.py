@@ -67,6 +67,60 @@ def to_numpy(var):
     return np.array(t)
 
 
+class _DeferredLogs:
+    """
+    Keeps the losses and metric outputs of training steps instead of
+    converting them to numpy every step, which synchronizes device. Their
+    copies to host are issued asynchronously when appended, so that they
+    overlap with the following steps, and metrics are only updated with
+    them when flushed.
+    """
+
+    def __init__(self, metrics):
+        self._metrics = metrics
+        self._losses = []
+        self._metric_outs = []
+        self._event = None
+        self._need_sync = False
+
+    def _to_host(self, tensor):
+        tensor = tensor.detach()
+        if tensor.place.is_gpu_place():
+            tensor = tensor._copy_to(base.CUDAPinnedPlace(), False)
+            self._need_sync = True
+        return tensor
+
+    def append(self, losses, metric_outs):
+        self._need_sync = False
+        self._losses = [self._to_host(l) for l in losses]
+        self._metric_outs.append(
+            [[self._to_host(m) for m in outs] for outs in metric_outs]
+        )
+        if self._need_sync:
+            self._event = paddle.device.current_stream().record_event()
+
+    def __len__(self):
+        return len(self._metric_outs)
+
+    def flush(self):
+        """
+        Updates metrics with the pending outputs, and returns the losses of
+        the last step and the accumulated metrics.
+        """
+        if self._event is not None:
+            self._event.synchronize()
+            self._event = None
+        for step_outs in self._metric_outs:
+            for metric, outs in zip(self._metrics, step_outs):
+                metric.update(*[to_numpy(m) for m in outs])
+        self._metric_outs = []
+
+        metrics = [[float(to_numpy(l)) for l in self._losses]]
+        for metric in self._metrics:
+            metrics.extend(to_list(metric.accumulate()))
+        return metrics
+
+
 def flatten_list(l):
     assert isinstance(l, list), "not a list"
     outl = []
@@ -98,6 +152,32 @@ def _all_gather(x):
     return output
 
 
+def _num_local_samples(data_loader):
+    """
+    Returns the number of samples of the current rank which are not padded
+    by DistributedBatchSampler, or None if it can not be told.
+    """
+    sampler = getattr(data_loader, 'batch_sampler', None)
+    if not isinstance(sampler, DistributedBatchSampler) or sampler.shuffle:
+        return None
+    # NOTE: the dataset is padded to total_size with samples at the head,
+    #       without shuffle the padded positions [len(dataset), total_size)
+    #       are the last samples of the ranks they are assigned to
+    batch_size = sampler.batch_size * sampler.nranks
+    last_batch_start = sampler.total_size - sampler.total_size % batch_size
+    last_local_batch_size = (sampler.total_size - last_batch_start) // (
+        sampler.nranks
+    )
+    num_padded = 0
+    for pos in range(len(sampler.dataset), sampler.total_size):
+        if pos >= last_batch_start:
+            rank = (pos - last_batch_start) // last_local_batch_size
+        else:
+            rank = pos % batch_size // sampler.batch_size
+        num_padded += rank == sampler.local_rank
+    return sampler.num_samples - num_padded
+
+
 def wait_server_ready(endpoints):
     assert not isinstance(endpoints, str)
     while True:
@@ -790,6 +870,9 @@ class DynamicGraphAdapter:
             'test_batch': 0,
         }
 
+        # samples of this rank left to evaluate when outputs are sharded
+        self._local_samples = None
+
         self._input_info = None
         self._amp_level = "O0"
         self._amp_configs = {}
@@ -818,7 +901,7 @@ class DynamicGraphAdapter:
         self.model.mode = value
 
     # TODO multi device in dygraph mode not implemented at present time
-    def train_batch(self, inputs, labels=None, update=True):
+    def train_batch(self, inputs, labels=None, update=True, defer=False):
         assert (
             self.model._optimizer
         ), "model not ready, please call `model.prepare()` first"
@@ -859,6 +942,14 @@ class DynamicGraphAdapter:
                 self.model._optimizer.minimize(final_loss)
                 self.model.network.clear_gradients()
 
+        if defer:
+            # metrics are updated with the outputs later, see _DeferredLogs
+            metric_outs = [
+                to_list(metric.compute(*(to_list(outputs) + labels)))
+                for metric in self.model._metrics
+            ]
+            return losses, metric_outs
+
         metrics = []
         for metric in self.model._metrics:
             metric_outs = metric.compute(*(to_list(outputs) + labels))
@@ -893,7 +984,10 @@ class DynamicGraphAdapter:
             losses = self.model._loss(*(to_list(outputs) + labels))
             losses = to_list(losses)
 
-        if self._nranks > 1:
+        if self._nranks > 1 and self.model._sharded_eval:
+            # metrics are updated locally and reduced at the end of epoch
+            outputs, labels = self._remove_padding(to_list(outputs), labels)
+        elif self._nranks > 1:
             outputs = [_all_gather(o) for o in to_list(outputs)]
             labels = [_all_gather(l) for l in labels]
 
@@ -920,7 +1014,12 @@ class DynamicGraphAdapter:
                     self._merge_count[self.mode + '_batch'] = samples
 
         metrics = []
+        # all samples of the batch may be padded ones in sharded evaluation
+        is_empty = to_list(outputs)[0].shape[0] == 0
         for metric in self.model._metrics:
+            if is_empty:
+                metrics.append(metric.accumulate())
+                continue
             # cut off padding value.
             metric_outs = metric.compute(*(to_list(outputs) + labels))
             m = metric.update(*[to_numpy(m) for m in to_list(metric_outs)])
@@ -939,11 +1038,24 @@ class DynamicGraphAdapter:
         inputs = [to_variable(x) for x in to_list(inputs)]
         self._input_info = _update_input_info(inputs)
         outputs = self.model.network(*inputs)
-        if self._nranks > 1 and isinstance(self.model._place, base.CUDAPlace):
+        if self._nranks > 1 and self.model._sharded_eval:
+            outputs, _ = self._remove_padding(to_list(outputs), [])
+        elif self._nranks > 1 and isinstance(self.model._place, base.CUDAPlace):
             outputs = [_all_gather(o) for o in to_list(outputs)]
 
         return [to_numpy(o) for o in to_list(outputs)]
 
+    def _remove_padding(self, outputs, labels):
+        if self._local_samples is None:
+            return outputs, labels
+        samples = outputs[0].shape[0]
+        num = min(samples, self._local_samples)
+        self._local_samples -= num
+        if num < samples:
+            outputs = [o[:num] for o in outputs]
+            labels = [l[:num] for l in labels]
+        return outputs, labels
+
     def parameters(self, *args, **kwargs):
         return self.model.network.parameters(*args, **kwargs)
 
@@ -1174,6 +1286,7 @@ class Model:
         self._input_info = None
         self._is_shape_inferred = False
         self._test_dataloader = None
+        self._sharded_eval = False
         self.stop_training = False
 
         if not in_dynamic_mode():
@@ -1770,6 +1883,7 @@ class Model:
         callbacks=None,
         accumulate_grad_batches=1,
         num_iters=None,
+        deferred_logging=False,
     ):
         """
 
@@ -1818,6 +1932,11 @@ class Model:
             num_iters (int|None, optional): The number of iterations to evaluate the model.
                 If None, evaluate on whole input dataset, otherwise, evaluate `num_iters` times.
                 Default: None.
+            deferred_logging (bool, optional): Whether to keep the losses and metric outputs of
+                training steps on device and only update the logs every `log_freq` steps and at
+                the end of epoch, which avoids synchronizing device every step. The logs passed
+                to callbacks are not updated between these steps. Only works in dynamic graph
+                mode. Default: False.
 
         Returns:
             None
@@ -1954,6 +2073,9 @@ class Model:
         self._test_dataloader = eval_loader
 
         self._accumulate = accumulate_grad_batches
+        self._deferred_log_freq = (
+            log_freq if deferred_logging and in_dynamic_mode() else None
+        )
 
         steps = self._len_data_loader(train_loader)
         self.num_iters = num_iters
@@ -2001,6 +2123,7 @@ class Model:
 
         cbks.on_end('train', logs)
         self._test_dataloader = None
+        self._deferred_log_freq = None
 
     def evaluate(
         self,
@@ -2011,6 +2134,7 @@ class Model:
         num_workers=0,
         callbacks=None,
         num_iters=None,
+        sharded=False,
     ):
         """
         Evaluate the loss and metrics of the model on input dataset.
@@ -2036,6 +2160,12 @@ class Model:
             num_iters (int|None, optional): The number of iterations to evaluate the model.
                 If None, evaluate on whole input dataset, otherwise, evaluate `num_iters` times.
                 Default: None.
+            sharded (bool, optional): Whether to evaluate without gathering outputs and labels
+                of all ranks in distributed evaluation. If True, every rank updates metrics with
+                its own outputs, and the states of metrics are all-reduced once at the end, so all
+                metrics should implement `state` and `set_state`. Metrics logged during evaluation
+                and losses are the ones of the current rank. Only supported in dynamic graph mode.
+                Default: False.
         Returns:
             dict: Result of metric. The key is the names of Metric,
                 value is a scalar or numpy.array.
@@ -2078,34 +2208,37 @@ class Model:
             eval_loader = eval_data
 
         self._test_dataloader = eval_loader
+        self._set_sharded_eval(sharded, eval_loader)
 
-        cbks = config_callbacks(
-            callbacks,
-            model=self,
-            log_freq=log_freq,
-            verbose=verbose,
-            metrics=self._metrics_name(),
-        )
-
-        eval_steps = self._len_data_loader(eval_loader)
-        self.num_iters = num_iters
-        if (
-            num_iters is not None
-            and isinstance(num_iters, int)
-            and isinstance(eval_steps, int)
-        ):
-            assert num_iters > 0, "num_iters must be greater than 0!"
-            eval_steps = min(num_iters, eval_steps)
-            self.num_iters = eval_steps
-        cbks.on_begin(
-            'eval', {'steps': eval_steps, 'metrics': self._metrics_name()}
-        )
+        try:
+            cbks = config_callbacks(
+                callbacks,
+                model=self,
+                log_freq=log_freq,
+                verbose=verbose,
+                metrics=self._metrics_name(),
+            )
 
-        logs = self._run_one_epoch(eval_loader, cbks, 'eval')
+            eval_steps = self._len_data_loader(eval_loader)
+            self.num_iters = num_iters
+            if (
+                num_iters is not None
+                and isinstance(num_iters, int)
+                and isinstance(eval_steps, int)
+            ):
+                assert num_iters > 0, "num_iters must be greater than 0!"
+                eval_steps = min(num_iters, eval_steps)
+                self.num_iters = eval_steps
+            cbks.on_begin(
+                'eval', {'steps': eval_steps, 'metrics': self._metrics_name()}
+            )
 
-        cbks.on_end('eval', logs)
+            logs = self._run_one_epoch(eval_loader, cbks, 'eval')
 
-        self._test_dataloader = None
+            cbks.on_end('eval', logs)
+        finally:
+            self._test_dataloader = None
+            self._set_sharded_eval(False)
 
         eval_result = {}
         for k in self._metrics_name():
@@ -2121,6 +2254,8 @@ class Model:
         stack_outputs=False,
         verbose=1,
         callbacks=None,
+        sharded=False,
+        output_dir=None,
     ):
         """
         Compute the output predictions on testing data.
@@ -2143,6 +2278,13 @@ class Model:
             verbose (int, optional): The verbosity mode, should be 0, 1, or 2. 0 = silent,
                 1 = progress bar, 2 = one line per batch. Default: 1.
             callbacks(Callback, optional): A Callback instance, Default: None.
+            sharded (bool, optional): Whether to predict without gathering outputs of all ranks
+                in distributed prediction. If True, every rank only returns the outputs of the
+                samples it is assigned to. Only supported in dynamic graph mode. Default: False.
+            output_dir (str|None, optional): The directory to save outputs of every rank into,
+                which can be only set when `sharded` is True. Outputs of rank `i` are saved to
+                `output_dir/predict.rank{i}.pdout` by `paddle.save` in tensor container format,
+                and can be loaded by `paddle.load(path, return_numpy=True)`. Default: None.
 
         Returns:
             list: output of models.
@@ -2188,6 +2330,11 @@ class Model:
                 >>> print(len(result[0]), result[0][0].shape)
                 157 (64, 10)
         """
+        if output_dir is not None and not sharded:
+            raise ValueError(
+                "output_dir can be only set when sharded is True, outputs "
+                "of all ranks are gathered to every rank otherwise."
+            )
 
         if test_data is not None and isinstance(test_data, Dataset):
             test_sampler = DistributedBatchSampler(
@@ -2204,26 +2351,38 @@ class Model:
             test_loader = test_data
 
         self._test_dataloader = test_loader
+        self._set_sharded_eval(sharded, test_loader)
 
-        cbks = config_callbacks(callbacks, model=self, verbose=verbose)
+        try:
+            cbks = config_callbacks(callbacks, model=self, verbose=verbose)
 
-        test_steps = self._len_data_loader(test_loader)
-        logs = {'steps': test_steps}
+            test_steps = self._len_data_loader(test_loader)
+            logs = {'steps': test_steps}
 
-        cbks.on_begin('predict', logs)
+            cbks.on_begin('predict', logs)
 
-        outputs = []
+            outputs = []
 
-        logs, outputs = self._run_one_epoch(test_loader, cbks, 'predict')
+            logs, outputs = self._run_one_epoch(test_loader, cbks, 'predict')
 
-        outputs = list(zip(*outputs))
+            outputs = list(zip(*outputs))
 
-        # NOTE: for lod tensor output, we should not stack outputs
-        # for stacking may lose its detail info
-        if stack_outputs:
-            outputs = [np.vstack(outs) for outs in outputs]
+            # NOTE: for lod tensor output, we should not stack outputs
+            # for stacking may lose its detail info
+            if stack_outputs:
+                outputs = [np.vstack(outs) for outs in outputs]
 
-        self._test_dataloader = None
+            if output_dir is not None:
+                os.makedirs(output_dir, exist_ok=True)
+                rank = paddle.distributed.ParallelEnv().local_rank
+                paddle.save(
+                    outputs,
+                    os.path.join(output_dir, f'predict.rank{rank}.pdout'),
+                    use_tensor_container=True,
+                )
+        finally:
+            self._test_dataloader = None
+            self._set_sharded_eval(False)
 
         cbks.on_end('predict', logs)
         return outputs
@@ -2298,6 +2457,9 @@ class Model:
         logs={},
     ):
         outputs = []
+        deferred_logs = None
+        if mode == 'train' and getattr(self, '_deferred_log_freq', None):
+            deferred_logs = _DeferredLogs(self._metrics)
         for step, data in enumerate(data_loader):
             # Data might come from different types of data_loader and have
             # different format, as following:
@@ -2330,23 +2492,30 @@ class Model:
                         or step + 1 == len(data_loader)
                     )
 
-                outs = getattr(self, mode + '_batch')(*_inputs)
-
-                if self._metrics and self._loss:
-                    metrics = [[float(l) for l in outs[0]]]
-                elif self._loss:
-                    metrics = [[float(l) for l in outs]]
+                if deferred_logs is not None:
+                    deferred_logs.append(
+                        *self._adapter.train_batch(*_inputs, defer=True)
+                    )
+                    if self._input_info is None:
+                        self._update_inputs()
+                    if (step + 1) % self._deferred_log_freq == 0:
+                        self._update_logs(logs, deferred_logs.flush())
                 else:
-                    metrics = []
+                    outs = getattr(self, mode + '_batch')(*_inputs)
 
-                # metrics
-                for metric in self._metrics:
-                    res = metric.accumulate()
-                    metrics.extend(to_list(res))
+                    if self._metrics and self._loss:
+                        metrics = [[float(l) for l in outs[0]]]
+                    elif self._loss:
+                        metrics = [[float(l) for l in outs]]
+                    else:
+                        metrics = []
+
+                    # metrics
+                    for metric in self._metrics:
+                        res = metric.accumulate()
+                        metrics.extend(to_list(res))
 
-                assert len(self._metrics_name()) == len(metrics)
-                for k, v in zip(self._metrics_name(), metrics):
-                    logs[k] = v
+                    self._update_logs(logs, metrics)
             else:
                 if self._inputs is not None:
                     outs = self.predict_batch(data[: len(self._inputs)])
@@ -2373,12 +2542,38 @@ class Model:
                     self.stop_training = True
                     del self.num_iters
                     break
+        if deferred_logs is not None and len(deferred_logs) > 0:
+            self._update_logs(logs, deferred_logs.flush())
+        if mode == 'eval' and self._sharded_eval and self._metrics:
+            paddle.metric.all_reduce_metrics(self._metrics)
+            metrics = [logs.get('loss')] if self._loss else []
+            for metric in self._metrics:
+                metrics.extend(to_list(metric.accumulate()))
+            self._update_logs(logs, metrics)
         self._reset_metrics()
 
         if mode == 'predict':
             return logs, outputs
         return logs
 
+    def _set_sharded_eval(self, sharded, data_loader=None):
+        if sharded and not in_dynamic_mode():
+            warnings.warn(
+                "Sharded evaluation is only supported in dynamic graph mode, "
+                "outputs of all ranks are gathered in static graph mode."
+            )
+            sharded = False
+        self._sharded_eval = sharded
+        if isinstance(self._adapter, DynamicGraphAdapter):
+            self._adapter._local_samples = (
+                _num_local_samples(data_loader) if sharded else None
+            )
+
+    def _update_logs(self, logs, metrics):
+        assert len(self._metrics_name()) == len(metrics)
+        for k, v in zip(self._metrics_name(), metrics):
+            logs[k] = v
+
     def summary(self, input_size=None, dtype=None):
         """Prints a string summary of the network.
 
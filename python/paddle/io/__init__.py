@@ -16,12 +16,16 @@
 
 from .dataloader import (
     BatchSampler,
+    BucketBatchSampler,
     ChainDataset,
     ComposeDataset,
     ConcatDataset,
     Dataset,
     DistributedBatchSampler,
     IterableDataset,
+    MmapDataset,
+    MmapDatasetWriter,
+    PadCollateFn,
     RandomSampler,
     Sampler,
     SequenceSampler,
@@ -42,6 +46,8 @@ __all__ = [
     'ChainDataset',
     'BatchSampler',
     'DistributedBatchSampler',
+    'BucketBatchSampler',
+    'PadCollateFn',
     'DataLoader',
     'get_worker_info',
     'Sampler',
@@ -52,4 +58,6 @@ __all__ = [
     'Subset',
     'SubsetRandomSampler',
     'ConcatDataset',
+    'MmapDataset',
+    'MmapDatasetWriter',
 ]
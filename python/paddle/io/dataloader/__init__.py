@@ -14,8 +14,10 @@
 
 from .batch_sampler import (  # noqa: F401
     BatchSampler,
+    BucketBatchSampler,
     DistributedBatchSampler,
 )
+from .collate import PadCollateFn  # noqa: F401
 from .dataset import (  # noqa: F401
     ChainDataset,
     ComposeDataset,
@@ -26,6 +28,7 @@ from .dataset import (  # noqa: F401
     TensorDataset,
     random_split,
 )
+from .mmap_dataset import MmapDataset, MmapDatasetWriter  # noqa: F401
 from .sampler import (  # noqa: F401
     RandomSampler,
     Sampler,
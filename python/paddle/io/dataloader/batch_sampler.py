@@ -368,3 +368,257 @@ class DistributedBatchSampler(BatchSampler):
                 ...     sampler.set_epoch(epoch)
         """
         self.epoch = epoch
+
+
+class BucketBatchSampler(BatchSampler):
+    """
+    Batch sampler which groups samples of similar length into the same
+    mini-batch, to reduce the padding in variable-length workloads, e.g.
+    NLP and speech tasks.
+
+    Sample indices are split into pools of :attr:`pool_size` samples
+    (shuffled first if :attr:`shuffle` is True), samples in each pool are
+    sorted by length and grouped into mini-batches, either of
+    :attr:`batch_size` samples or of at most :attr:`max_tokens` padded
+    tokens. The order of mini-batches is shuffled if :attr:`shuffle` is
+    True.
+
+    In distributed training, every replica builds the same mini-batches
+    deterministically from :attr:`seed` and the epoch number, and takes
+    every :attr:`num_replicas`-th mini-batch starting from :attr:`rank`.
+    Mini-batches are repeated to make the mini-batch number evenly
+    divisible by :attr:`num_replicas`, so all replicas run the same number
+    of steps.
+
+    Args:
+        lengths(list|tuple|numpy.ndarray): the length of each sample in
+            dataset, e.g. token number of a sentence.
+        batch_size(int, optional): sample number in a mini-batch. If
+            :attr:`max_tokens` is also set, it is the maximum sample number
+            in a mini-batch. Default None.
+        max_tokens(int, optional): the maximum token number of a mini-batch
+            after padding, i.e. sample number multiplied by the maximum
+            length in the mini-batch. A sample longer than :attr:`max_tokens`
+            forms a mini-batch alone. Default None.
+        shuffle(bool, optional): whether to shuffle samples before building
+            pools and shuffle mini-batches after building. Default False.
+        drop_last(bool, optional): whether to drop the last incomplete
+            mini-batch, only useful when :attr:`max_tokens` is None.
+            Default False.
+        pool_size(int, optional): number of samples sorted by length
+            together. Default None, all samples are sorted together.
+        num_replicas(int, optional): process number in distributed training.
+            If :attr:`num_replicas` is None, :attr:`num_replicas` will be
+            retrieved from :ref:`api_paddle_distributed_ParallelEnv` .
+            Default None.
+        rank(int, optional): the rank of the current process among
+            :attr:`num_replicas` processes. If :attr:`rank` is None,
+            :attr:`rank` is retrieved from
+            :ref:`api_paddle_distributed_ParallelEnv`. Default None.
+        seed(int, optional): random seed for shuffling, combined with the
+            epoch number set by :code:`set_epoch`. Default 0.
+
+    Returns:
+        BucketBatchSampler, return an iterable object for indices iterating.
+
+    Examples:
+        .. code-block:: python
+
+            >>> import numpy as np
+            >>> from paddle.io import BucketBatchSampler
+
+            >>> lengths = [5, 1, 4, 2, 3, 6]
+            >>> bs = BucketBatchSampler(lengths, batch_size=2)
+            >>> for batch_indices in bs:
+            ...     print(batch_indices)
+            [1, 3]
+            [4, 2]
+            [0, 5]
+
+            >>> bs = BucketBatchSampler(lengths, max_tokens=8)
+            >>> for batch_indices in bs:
+            ...     print(batch_indices)
+            [1, 3]
+            [4, 2]
+            [0]
+            [5]
+    """
+
+    def __init__(
+        self,
+        lengths,
+        batch_size=None,
+        max_tokens=None,
+        shuffle=False,
+        drop_last=False,
+        pool_size=None,
+        num_replicas=None,
+        rank=None,
+        seed=0,
+    ):
+        assert (
+            batch_size is not None or max_tokens is not None
+        ), "either batch_size or max_tokens should be set"
+        assert batch_size is None or (
+            isinstance(batch_size, int) and batch_size > 0
+        ), f"batch_size should be a positive integer, but got {batch_size}"
+        assert max_tokens is None or (
+            isinstance(max_tokens, int) and max_tokens > 0
+        ), f"max_tokens should be a positive integer, but got {max_tokens}"
+        assert pool_size is None or (
+            isinstance(pool_size, int) and pool_size > 0
+        ), f"pool_size should be a positive integer, but got {pool_size}"
+        assert isinstance(
+            shuffle, bool
+        ), f"shuffle should be a boolean value, but got {type(shuffle)}"
+        assert isinstance(
+            drop_last, bool
+        ), f"drop_last should be a boolean value, but got {type(drop_last)}"
+
+        self.lengths = np.asarray(lengths, dtype='int64')
+        self.batch_size = batch_size
+        self.max_tokens = max_tokens
+        self.shuffle = shuffle
+        self.drop_last = drop_last
+        self.pool_size = pool_size
+        self.seed = seed
+
+        from paddle.distributed import ParallelEnv
+
+        if num_replicas is not None:
+            assert (
+                isinstance(num_replicas, int) and num_replicas > 0
+            ), "num_replicas should be a positive integer"
+            self.nranks = num_replicas
+        else:
+            self.nranks = ParallelEnv().nranks
+
+        if rank is not None:
+            assert (
+                isinstance(rank, int) and rank >= 0
+            ), "rank should be a non-negative integer"
+            self.local_rank = rank
+        else:
+            self.local_rank = ParallelEnv().local_rank
+
+        self.epoch = 0
+        self._num_batches = None
+
+    def _split_pool(self, pool):
+        # pool indices are sorted by length
+        if self.max_tokens is None:
+            return [
+                pool[i : i + self.batch_size].tolist()
+                for i in range(0, len(pool), self.batch_size)
+            ]
+
+        batches = []
+        batch_indices = []
+        max_length = 0
+        for idx, length in zip(pool.tolist(), self.lengths[pool].tolist()):
+            new_max_length = max(max_length, length)
+            if batch_indices and (
+                (len(batch_indices) + 1) * new_max_length > self.max_tokens
+                or len(batch_indices) == self.batch_size
+            ):
+                batches.append(batch_indices)
+                batch_indices = []
+                new_max_length = length
+            batch_indices.append(idx)
+            max_length = new_max_length
+        if batch_indices:
+            batches.append(batch_indices)
+        return batches
+
+    def _build_batches(self):
+        rng = np.random.RandomState(self.seed + self.epoch)
+        indices = np.arange(len(self.lengths))
+        if self.shuffle:
+            indices = rng.permutation(indices)
+
+        pool_size = self.pool_size or max(len(indices), 1)
+        sorted_indices = [
+            pool[np.argsort(self.lengths[pool], kind='stable')]
+            for pool in (
+                indices[i : i + pool_size]
+                for i in range(0, len(indices), pool_size)
+            )
+        ]
+        if self.max_tokens is None:
+            # group samples across pools, so that only the last mini-batch
+            # may be incomplete
+            sorted_indices = [np.concatenate(sorted_indices or [indices])]
+
+        batches = []
+        for pool in sorted_indices:
+            batches.extend(self._split_pool(pool))
+        if (
+            self.drop_last
+            and self.max_tokens is None
+            and batches
+            and len(batches[-1]) < self.batch_size
+        ):
+            batches.pop()
+
+        if self.shuffle:
+            rng.shuffle(batches)
+
+        self._num_batches = (self._length_key(), len(batches))
+        if self.nranks > 1 and batches:
+            # add extra batches to make it evenly divisible
+            padding_size = -len(batches) % self.nranks
+            batches += (batches * math.ceil(padding_size / len(batches)))[
+                :padding_size
+            ]
+            batches = batches[self.local_rank :: self.nranks]
+        return batches
+
+    def _length_key(self):
+        # mini-batch number only depends on the shuffle seed when shuffled
+        # pools are split by max_tokens, otherwise it is the same in every
+        # epoch
+        if self.shuffle and self.max_tokens is not None and self.pool_size:
+            return self.epoch
+        return None
+
+    def __iter__(self):
+        batches = self._build_batches()
+        if self.shuffle:
+            self.epoch += 1
+        yield from batches
+
+    def __len__(self):
+        if self.max_tokens is None:
+            num_samples = len(self.lengths)
+            if self.drop_last:
+                num_batches = num_samples // self.batch_size
+            else:
+                num_batches = math.ceil(num_samples / self.batch_size)
+        else:
+            key = self._length_key()
+            if self._num_batches is None or self._num_batches[0] != key:
+                self._build_batches()
+            num_batches = self._num_batches[1]
+        return math.ceil(num_batches / self.nranks)
+
+    def set_epoch(self, epoch):
+        """
+        Sets the epoch number. When :attr:`shuffle=True`, this number is
+        combined with :attr:`seed` as seeds of random numbers, all replicas
+        build the same mini-batches at the same epoch.
+
+        Arguments:
+            epoch (int): Epoch number.
+
+        Examples:
+            .. code-block:: python
+
+                >>> from paddle.io import BucketBatchSampler
+
+                >>> lengths = [5, 1, 4, 2, 3, 6]
+                >>> bs = BucketBatchSampler(lengths, batch_size=2, shuffle=True)
+
+                >>> for epoch in range(10):
+                ...     bs.set_epoch(epoch)
+        """
+        self.epoch = epoch
@@ -12,8 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import bisect
 import numbers
 from collections.abc import Mapping, Sequence
+from operator import itemgetter
 
 import numpy as np
 
@@ -80,6 +82,172 @@ def default_collate_fn(batch):
     )
 
 
+# NOTE: the casting argument of np.stack, which is needed to write samples
+#       into a reused buffer exactly as np.stack would allocate, is only
+#       supported since numpy 1.24
+_STACK_SUPPORTS_CASTING = np.lib.NumpyVersion(np.__version__) >= '1.24.0'
+
+_LEAF_TYPES = (
+    np.ndarray,
+    paddle.Tensor,
+    core.eager.Tensor,
+    numbers.Number,
+    str,
+    bytes,
+)
+
+
+class _CollateField:
+    """
+    A field in the flattened sample schema, ``getter`` gets the field
+    value from a sample, ``kind`` is the exact type of the field value
+    in the first sample, ``buffer`` is the reused output buffer of
+    numpy array field.
+    """
+
+    __slots__ = ('getter', 'kind', 'buffer')
+
+    def __init__(self, getter, kind):
+        self.getter = getter
+        self.kind = kind
+        self.buffer = None
+
+
+class _SchemaCollateFn:
+    """
+    Batch collating function with the same output as
+    :code:`default_collate_fn`, which infers the schema of samples from
+    the first batch only once, and compiles it into a flat list of fields,
+    so each batch is collated by stacking each field directly without
+    dispatching on types recursively.
+
+    If :code:`reuse_buffer` is True, numpy array fields are stacked into
+    buffers allocated in the first batch and reused across batches, so
+    that output of a batch is only valid until the next call, which is
+    safe only if output is copied before the next call, e.g. converted to
+    LoDTensor in DataLoader.
+
+    If a batch does not match the compiled schema, it is collated by
+    :code:`default_collate_fn` and the schema is compiled again from it.
+    """
+
+    def __init__(self, reuse_buffer=False):
+        self._reuse_buffer = reuse_buffer and _STACK_SUPPORTS_CASTING
+        self._fields = None
+        # (getter, length) of Mapping and Sequence nodes in samples
+        self._nodes = None
+        self._structure = None
+
+    def _compile(self, sample):
+        fields = []
+        nodes = []
+
+        def _getter(path):
+            if len(path) == 0:
+                return lambda sample: sample
+            elif len(path) == 1:
+                return itemgetter(path[0])
+
+            def _get(sample):
+                for key in path:
+                    sample = sample[key]
+                return sample
+
+            return _get
+
+        def _build(value, path):
+            if isinstance(value, _LEAF_TYPES):
+                fields.append(_CollateField(_getter(path), type(value)))
+                return len(fields) - 1
+            elif isinstance(value, Mapping):
+                nodes.append((_getter(path), len(value), False))
+                return {k: _build(value[k], path + (k,)) for k in value}
+            elif isinstance(value, Sequence):
+                nodes.append((_getter(path), len(value), True))
+                return [_build(v, path + (i,)) for i, v in enumerate(value)]
+            raise TypeError(
+                "batch data con only contains: tensor, numpy.ndarray, "
+                f"dict, list, number, but got {type(value)}"
+            )
+
+        if not isinstance(sample, (Mapping, Sequence)) or isinstance(
+            sample, (str, bytes)
+        ):
+            # plain samples have no fields to flatten
+            return False
+        self._structure = _build(sample, ())
+        self._fields = fields
+        self._nodes = nodes
+        return True
+
+    def _restore(self, structure, outputs):
+        if isinstance(structure, dict):
+            return {k: self._restore(v, outputs) for k, v in structure.items()}
+        elif isinstance(structure, list):
+            return [self._restore(v, outputs) for v in structure]
+        return outputs[structure]
+
+    def _stack(self, field, values):
+        if not self._reuse_buffer:
+            return np.stack(values, axis=0)
+
+        buffer = field.buffer
+        if buffer is not None and buffer.shape[0] == len(values):
+            try:
+                return np.stack(values, axis=0, out=buffer, casting='no')
+            except (TypeError, ValueError):
+                # shape or dtype of field changed
+                pass
+        field.buffer = np.stack(values, axis=0)
+        return field.buffer
+
+    def _collate(self, batch):
+        sample = batch[0]
+        for getter, length, is_sequence in self._nodes:
+            if is_sequence:
+                if not all(len(getter(s)) == length for s in batch):
+                    return None
+            elif len(getter(sample)) != length:
+                return None
+
+        outputs = []
+        for field in self._fields:
+            values = list(map(field.getter, batch))
+            kind = field.kind
+            if type(values[0]) is not kind:
+                return None
+            if issubclass(kind, np.ndarray):
+                outputs.append(self._stack(field, values))
+            elif issubclass(kind, (paddle.Tensor, core.eager.Tensor)):
+                outputs.append(paddle.stack(values, axis=0))
+            elif issubclass(kind, numbers.Number):
+                outputs.append(np.array(values))
+            else:
+                outputs.append(values)
+        return self._restore(self._structure, outputs)
+
+    def __call__(self, batch):
+        if self._fields is None:
+            try:
+                compiled = self._compile(batch[0])
+            except TypeError:
+                compiled = False
+            if not compiled:
+                return default_collate_fn(batch)
+
+        try:
+            data = self._collate(batch)
+        except (KeyError, IndexError, TypeError):
+            data = None
+
+        if data is None:
+            # schema of samples changed, collate by default_collate_fn
+            # which raises proper error for invalid samples
+            data = default_collate_fn(batch)
+            self._fields = None
+        return data
+
+
 def default_convert_fn(batch):
     """
     Default batch converting function for :code:`paddle.io.DataLoader`.
@@ -109,3 +277,149 @@ def default_convert_fn(batch):
         return [default_convert_fn(d) for d in batch]
     else:
         return batch
+
+
+class PadCollateFn:
+    """
+    Batch collating function for variable-length samples, which pads
+    variable-length fields to the same length along the first axis and
+    emits the attention masks of padded fields, other fields are collated
+    by :code:`default_collate_fn`. It is usually used together with
+    :ref:`api_paddle_io_BucketBatchSampler`.
+
+    The padded length of a mini-batch is the maximum length of samples,
+    rounded up to the smallest value in :attr:`buckets` not less than it,
+    then rounded up to a multiple of :attr:`pad_to_multiple_of`, which
+    keeps the shapes of mini-batches in a small set for compiled graphs.
+
+    Masks are int64 arrays of shape [batch_size, padded_length], 1 for
+    valid positions and 0 for padding. For dict samples, the mask of field
+    ``key`` is added as ``key + '_mask'``, for list or tuple samples, masks
+    are appended after all fields in the order of :attr:`pad_fields`, for
+    numpy array samples, the output is ``[padded_array, mask]``.
+
+    Args:
+        pad_fields(list|tuple, optional): keys of dict samples or indices of
+            list or tuple samples of the fields to pad. Default None, all
+            numpy array fields with at least 1 dimension are padded.
+        pad_value(int|float, optional): value to pad with. Default 0.
+        buckets(list|tuple, optional): candidates of padded length.
+            Default None.
+        pad_to_multiple_of(int, optional): padded length is rounded up to a
+            multiple of it. Default None.
+        return_mask(bool, optional): whether to emit masks of padded
+            fields. Default True.
+
+    Examples:
+        .. code-block:: python
+
+            >>> import numpy as np
+            >>> from paddle.io import PadCollateFn
+
+            >>> batch = [
+            ...     {'ids': np.array([1, 2, 3]), 'label': 0},
+            ...     {'ids': np.array([4]), 'label': 1},
+            ... ]
+            >>> collate_fn = PadCollateFn(pad_fields=['ids'], buckets=[4, 8])
+            >>> out = collate_fn(batch)
+            >>> print(out['ids'])
+            [[1 2 3 0]
+             [4 0 0 0]]
+            >>> print(out['ids_mask'])
+            [[1 1 1 0]
+             [1 0 0 0]]
+            >>> print(out['label'])
+            [0 1]
+    """
+
+    def __init__(
+        self,
+        pad_fields=None,
+        pad_value=0,
+        buckets=None,
+        pad_to_multiple_of=None,
+        return_mask=True,
+    ):
+        self.pad_fields = pad_fields
+        self.pad_value = pad_value
+        self.buckets = sorted(buckets) if buckets is not None else None
+        self.pad_to_multiple_of = pad_to_multiple_of
+        self.return_mask = return_mask
+
+    def _padded_length(self, max_length):
+        if self.buckets is not None:
+            idx = bisect.bisect_left(self.buckets, max_length)
+            if idx < len(self.buckets):
+                max_length = self.buckets[idx]
+        if self.pad_to_multiple_of:
+            max_length = (
+                -(-max_length // self.pad_to_multiple_of)
+                * self.pad_to_multiple_of
+            )
+        return max_length
+
+    def _pad(self, arrays):
+        arrays = [np.asarray(a) for a in arrays]
+        lengths = np.array([a.shape[0] for a in arrays], dtype='int64')
+        padded_length = self._padded_length(int(lengths.max()))
+        padded = np.full(
+            (len(arrays), padded_length) + arrays[0].shape[1:],
+            self.pad_value,
+            dtype=arrays[0].dtype,
+        )
+        for i, a in enumerate(arrays):
+            padded[i, : a.shape[0]] = a
+        mask = (
+            np.arange(padded_length)[np.newaxis, :] < lengths[:, np.newaxis]
+        ).astype('int64')
+        return padded, mask
+
+    def _get_pad_fields(self, sample, keys):
+        if self.pad_fields is not None:
+            return list(self.pad_fields)
+        return [
+            k
+            for k in keys
+            if isinstance(sample[k], np.ndarray) and sample[k].ndim >= 1
+        ]
+
+    def __call__(self, batch):
+        sample = batch[0]
+        if isinstance(sample, np.ndarray):
+            padded, mask = self._pad(batch)
+            return [padded, mask] if self.return_mask else padded
+        elif isinstance(sample, Mapping):
+            pad_fields = self._get_pad_fields(sample, list(sample.keys()))
+            out = {}
+            for key in sample:
+                if key in pad_fields:
+                    out[key], mask = self._pad([d[key] for d in batch])
+                    if self.return_mask:
+                        out[key + '_mask'] = mask
+                else:
+                    out[key] = default_collate_fn([d[key] for d in batch])
+            return out
+        elif isinstance(sample, Sequence):
+            sample_fields_num = len(sample)
+            if not all(len(s) == sample_fields_num for s in batch):
+                raise RuntimeError(
+                    "fileds number not same among samples in a batch"
+                )
+            pad_fields = self._get_pad_fields(
+                sample, list(range(sample_fields_num))
+            )
+            out, masks = [], {}
+            for i, fields in enumerate(zip(*batch)):
+                if i in pad_fields:
+                    padded, masks[i] = self._pad(fields)
+                    out.append(padded)
+                else:
+                    out.append(default_collate_fn(list(fields)))
+            if self.return_mask:
+                out.extend(masks[i] for i in pad_fields)
+            return out
+
+        raise TypeError(
+            "batch data of PadCollateFn can only be numpy.ndarray, "
+            f"dict, list, but got {type(sample)}"
+        )
@@ -36,7 +36,11 @@ from ..multiprocess_utils import (
     _set_SIGCHLD_handler,
 )
 from .batch_sampler import _InfiniteIterableSampler
-from .collate import default_collate_fn, default_convert_fn
+from .collate import (  # noqa: F401
+    _SchemaCollateFn,
+    default_collate_fn,
+    default_convert_fn,
+)
 from .flat import _flatten_batch, _restore_batch
 from .worker import (
     _DatasetKind,
@@ -104,10 +108,17 @@ class _DataLoaderIterBase:
         self._worker_init_fn = loader.worker_init_fn
         self._dataset_kind = loader.dataset_kind
         self._pin_memory = loader.pin_memory
+        self._in_order = loader.in_order
 
         self._sampler_iter = iter(self._index_sampler)
         if self._auto_collate_batch:
-            self._collate_fn = loader.collate_fn or default_collate_fn
+            # NOTE: batch data is copied into LoDTensor before next batch is
+            #       collated in single-process mode and in multi-process mode
+            #       with shared memory, so that buffers of collated numpy
+            #       arrays can be reused across batches
+            self._collate_fn = loader.collate_fn or _SchemaCollateFn(
+                reuse_buffer=self._num_workers == 0 or self._use_shared_memory
+            )
         else:
             self._collate_fn = loader.collate_fn or default_convert_fn
 
@@ -379,6 +390,12 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
         self._task_infos = {}
         self._structure_infos = []
 
+        # NOTE: stall: a received batch waits in _task_infos for an earlier
+        #       batch in order keeping mode. straggler: a batch is received
+        #       after a batch sent later than it.
+        self._dispatch_stats = {'stalls': 0, 'stragglers': 0}
+        self._max_rcvd_send_idx = -1
+
         # indices outstand as _outstanding_capacity at first, and
         # blocking_queue capacity is also _outstanding_capacity.
         # _outstanding_capacity here to make sure each indices_queue
@@ -433,6 +450,8 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
         self._worker_status = []
         self._indices_queues = []
         self._workers_idx_cycle = itertools.cycle(range(self._num_workers))
+        # number of batches sent to each worker and not received yet
+        self._worker_outstanding = [0] * self._num_workers
 
         # create data_queue for workers
         self._data_queue = multiprocessing.Queue()
@@ -550,6 +569,8 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
         self._batches_outstanding = 0
         self._task_infos = {}
         self._structure_infos = []
+        self._worker_outstanding = [0] * self._num_workers
+        self._max_rcvd_send_idx = -1
 
         # set all worker status available
         self._worker_status = [True] * self._num_workers
@@ -645,7 +666,22 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
             # in _send_idx but will not increase _rcvd_idx, so we check
             # whether the worker is still alive here to skip the discarded
             # batch indices and increase _rcvd_idx
-            if self._dataset_kind == _DatasetKind.ITER:
+            if self._dataset_kind == _DatasetKind.ITER and not self._in_order:
+                # NOTE: batches are not received by order, skip all discarded
+                #       batch indices of stopped workers, data drained when
+                #       no batch indices is waiting for data
+                for idx in [
+                    idx
+                    for idx, info in self._task_infos.items()
+                    if not self._worker_status[info[0]]
+                ]:
+                    del self._task_infos[idx]
+                    self._rcvd_idx += 1
+                    self._batches_outstanding -= 1
+                if len(self._task_infos) == 0 and not self._persistent_workers:
+                    if self._batches_outstanding < len(self._places):
+                        return None
+            elif self._dataset_kind == _DatasetKind.ITER:
                 while self._rcvd_idx < self._send_idx:
                     info = self._task_infos[self._rcvd_idx]
                     if len(info) == 3 or self._worker_status[info[0]]:
@@ -750,12 +786,21 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                     self._exit_thread_unexpectedly()
                     batch.reraise()
 
-                if idx == self._rcvd_idx:
+                if idx in self._task_infos:
+                    self._worker_outstanding[self._task_infos[idx][0]] -= 1
+                if idx < self._max_rcvd_send_idx:
+                    self._dispatch_stats['stragglers'] += 1
+                else:
+                    self._max_rcvd_send_idx = idx
+
+                # NOTE: if not in order, deliver batch as soon as received
+                if not self._in_order or idx == self._rcvd_idx:
                     if idx in self._task_infos:
                         del self._task_infos[idx]
                     self._structure_infos.append(structure)
                     return batch
                 else:
+                    self._dispatch_stats['stalls'] += 1
                     self._task_infos[idx] += (batch, structure)
                     continue
 
@@ -778,18 +823,53 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
             except StopIteration:
                 return
 
-            for i in range(self._num_workers):
-                worker_idx = next(self._workers_idx_cycle)
-                if self._worker_status[worker_idx]:
-                    break
-            else:
+            worker_idx = self._select_worker()
+            if worker_idx is None:
                 return
 
             self._indices_queues[worker_idx].put((self._send_idx, indices))
             self._task_infos[self._send_idx] = (worker_idx,)
+            self._worker_outstanding[worker_idx] += 1
             self._batches_outstanding += 1
             self._send_idx += 1
 
+    def _select_worker(self):
+        for i in range(self._num_workers):
+            worker_idx = next(self._workers_idx_cycle)
+            if self._worker_status[worker_idx]:
+                break
+        else:
+            return None
+
+        # NOTE: batches of IterableDataset are generated by the dataset
+        #       copy in each worker, keep round-robin dispatching so that
+        #       the order of output data is deterministic
+        if self._dataset_kind == _DatasetKind.ITER:
+            return worker_idx
+
+        # dispatch to the worker with fewest outstanding batches, a slow
+        # batch only delays batches queued on the same worker, prefer the
+        # round-robin worker on ties
+        for i in range(1, self._num_workers):
+            candidate = (worker_idx + i) % self._num_workers
+            if (
+                self._worker_status[candidate]
+                and self._worker_outstanding[candidate]
+                < self._worker_outstanding[worker_idx]
+            ):
+                worker_idx = candidate
+        return worker_idx
+
+    @property
+    def dispatch_stats(self):
+        """
+        Counters of batch dispatching among workers: ``stalls`` is the
+        number of received batches which wait for an earlier batch to be
+        output in order keeping mode, ``stragglers`` is the number of
+        batches received after a batch sent later than them.
+        """
+        return dict(self._dispatch_stats)
+
     def __del__(self):
         self._try_shutdown_all()
 
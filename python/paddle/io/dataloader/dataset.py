@@ -34,6 +34,16 @@ class Dataset:
     :code:`__len__`: return dataset sample number. This method is required
     by some implements of :code:`paddle.io.BatchSampler`
 
+    Subclasses can optionally implement following method:
+
+    :code:`__getitems__`: get samples of a mini-batch from dataset with a
+    list of indices in one call, e.g. by fancy indexing a memory-mapped
+    array. If it is implemented, :code:`paddle.io.DataLoader` calls it
+    instead of :code:`__getitem__` for each index. It should return a list
+    of samples, which is collated by :attr:`collate_fn` as usual. To return
+    a batch collated already, set :attr:`collate_fn` of
+    :code:`paddle.io.DataLoader` to :code:`lambda batch: batch`.
+
     see :code:`paddle.io.DataLoader`.
 
     Examples:
@@ -60,6 +70,25 @@ class Dataset:
             >>> for i in range(len(dataset)):
             ...     image, label = dataset[i]
             ...     # do something
+
+            >>> # define a dataset which reads a mini-batch in one call
+            >>> class ArrayDataset(Dataset):
+            ...     def __init__(self, num_samples):
+            ...         self.images = np.random.random([num_samples, 784]).astype('float32')
+            ...         self.labels = np.random.randint(0, 9, (num_samples, 1)).astype('int64')
+            ...
+            ...     def __getitem__(self, idx):
+            ...         return self.images[idx], self.labels[idx]
+            ...
+            ...     def __getitems__(self, indices):
+            ...         return list(zip(self.images[indices], self.labels[indices]))
+            ...
+            ...     def __len__(self):
+            ...         return len(self.images)
+            ...
+            >>> dataset = ArrayDataset(10)
+            >>> samples = dataset.__getitems__([0, 2, 4])
+            >>> image, label = samples[0]
     """
 
     def __init__(self):
@@ -476,6 +505,12 @@ class Subset(Dataset):
     def __getitem__(self, idx):
         return self.dataset[self.indices[idx]]
 
+    def __getitems__(self, indices):
+        indices = [self.indices[idx] for idx in indices]
+        if hasattr(self.dataset, '__getitems__'):
+            return self.dataset.__getitems__(indices)
+        return [self.dataset[idx] for idx in indices]
+
     def __len__(self):
         return len(self.indices)
 
@@ -68,9 +68,16 @@ class _IterableDatasetFetcher(_DatasetFetcher):
 class _MapDatasetFetcher(_DatasetFetcher):
     def __init__(self, dataset, auto_collate_batch, collate_fn, drop_last):
         super().__init__(dataset, auto_collate_batch, collate_fn, drop_last)
+        # NOTE: dataset can read samples of a batch in one call by
+        #       implementing the optional __getitems__ method
+        self._getitems = getattr(dataset, '__getitems__', None)
 
     def fetch(self, batch_indices, done_event=None):
-        if self.auto_collate_batch:
+        if self.auto_collate_batch and self._getitems is not None:
+            if done_event is not None and done_event.is_set():
+                return None
+            data = self._getitems(batch_indices)
+        elif self.auto_collate_batch:
             data = []
             for idx in batch_indices:
                 if done_event is None or not done_event.is_set():
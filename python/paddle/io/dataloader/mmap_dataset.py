@@ -0,0 +1,319 @@
+#   Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+
+import numpy as np
+
+from .dataset import Dataset
+
+# Layout of a memory-mapped dataset directory:
+#   meta.json: sample number, sample type and dtype/shape of each field
+#   <field>.bin: raw data of field, samples of fixed field are stored as
+#       an array of shape [num_samples, *shape], samples of ragged field
+#       are concatenated along the first axis
+#   <field>.idx: int64 offsets of ragged field samples in the first axis
+#       of <field>.bin, with num_samples + 1 elements
+_META_FILE = 'meta.json'
+_META_VERSION = 1
+
+
+def _data_file(path, name):
+    return os.path.join(path, f'{name}.bin')
+
+
+def _index_file(path, name):
+    return os.path.join(path, f'{name}.idx')
+
+
+class MmapDatasetWriter:
+    """
+    Streaming writer of the memory-mapped dataset format read by
+    :ref:`api_paddle_io_MmapDataset`. Samples are appended to field
+    files one by one, so a corpus larger than memory can be written.
+
+    A sample should be a dict or a list/tuple of numpy arrays (or values
+    which can be converted to numpy arrays), the field names and dtypes
+    are inferred from the first sample, samples are read back in the same
+    container type as the first sample. Fields whose first dimension varies
+    among samples, e.g. token ids of sentences, should be declared in
+    :attr:`ragged_fields`, other fields should have the same shape in all
+    samples.
+
+    Meta data of a dataset already in :attr:`path` is removed when the
+    writer is created, and written again only when the writer is closed,
+    so that an interrupted writing never leaves a readable dataset.
+
+    Args:
+        path(str): the directory to write dataset files into.
+        ragged_fields(list|tuple, optional): keys of dict samples or
+            indices of list/tuple samples of ragged fields. Default None.
+
+    Examples:
+        .. code-block:: python
+
+            >>> import numpy as np
+            >>> from paddle.io import MmapDataset, MmapDatasetWriter
+
+            >>> with MmapDatasetWriter('mmap_dataset', ragged_fields=['ids']) as writer:
+            ...     for i in range(10):
+            ...         writer.write({'ids': np.arange(i + 1), 'label': np.array([i])})
+            ...
+            >>> dataset = MmapDataset('mmap_dataset')
+            >>> print(len(dataset))
+            10
+            >>> print(dataset[2]['ids'])
+            [0 1 2]
+    """
+
+    def __init__(self, path, ragged_fields=None):
+        self.path = path
+        self.ragged_fields = list(ragged_fields or [])
+        self._files = None
+        self._fields = None
+        self._sample_type = None
+        self._offsets = {}
+        self._num_samples = 0
+        os.makedirs(path, exist_ok=True)
+        # NOTE: field files of the dataset in path are overwritten, remove
+        #       its meta first so that they are never read with stale meta
+        meta_file = os.path.join(path, _META_FILE)
+        if os.path.exists(meta_file):
+            os.remove(meta_file)
+
+    def _init_fields(self, sample):
+        if isinstance(sample, dict):
+            self._sample_type = 'dict'
+            names = list(sample.keys())
+        elif isinstance(sample, (list, tuple)):
+            self._sample_type = 'list' if isinstance(sample, list) else 'tuple'
+            names = list(range(len(sample)))
+        else:
+            raise TypeError(
+                "sample of MmapDatasetWriter should be dict, list or tuple, "
+                f"but got {type(sample)}"
+            )
+        for name in self.ragged_fields:
+            if name not in names:
+                raise ValueError(
+                    f"ragged field {name} not found in sample fields {names}"
+                )
+
+        self._fields = {}
+        self._files = {}
+        for name in names:
+            value = np.asarray(sample[name])
+            ragged = name in self.ragged_fields
+            if ragged and value.ndim == 0:
+                raise ValueError(
+                    f"ragged field {name} should have at least 1 dimension"
+                )
+            self._fields[name] = {
+                'dtype': value.dtype.str,
+                'shape': list(value.shape[1:] if ragged else value.shape),
+                'ragged': ragged,
+            }
+            self._files[name] = open(_data_file(self.path, name), 'wb')
+            if ragged:
+                self._offsets[name] = [0]
+
+    def write(self, sample):
+        """
+        Append a sample to dataset.
+
+        Args:
+            sample(dict|list|tuple): the sample to write.
+        """
+        if self._fields is None:
+            self._init_fields(sample)
+
+        for name, field in self._fields.items():
+            value = np.asarray(sample[name], dtype=np.dtype(field['dtype']))
+            shape = list(value.shape[1:] if field['ragged'] else value.shape)
+            if shape != field['shape']:
+                raise ValueError(
+                    f"shape of field {name} should be {field['shape']}"
+                    f"{' after the first dimension' if field['ragged'] else ''}"
+                    f", but got {list(value.shape)}. Fields whose first "
+                    "dimension varies among samples should be set in "
+                    "ragged_fields."
+                )
+            self._files[name].write(value.tobytes())
+            if field['ragged']:
+                offsets = self._offsets[name]
+                offsets.append(offsets[-1] + value.shape[0])
+        self._num_samples += 1
+
+    def close(self):
+        """
+        Finish writing, flush field files and write the offset index and
+        meta data.
+        """
+        if self._files is None:
+            raise RuntimeError("no sample has been written to MmapDataset")
+        for f in self._files.values():
+            f.close()
+        for name, offsets in self._offsets.items():
+            np.asarray(offsets, dtype='int64').tofile(
+                _index_file(self.path, name)
+            )
+        meta = {
+            'version': _META_VERSION,
+            'num_samples': self._num_samples,
+            'sample_type': self._sample_type,
+            'fields': [
+                dict(name=name, **field) for name, field in self._fields.items()
+            ],
+        }
+        # write meta last, a dataset directory without meta is incomplete
+        meta_file = os.path.join(self.path, _META_FILE)
+        tmp_file = f'{meta_file}.{os.getpid()}.tmp'
+        with open(tmp_file, 'w') as f:
+            json.dump(meta, f)
+        os.replace(tmp_file, meta_file)
+        self._files = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        elif self._files is not None:
+            for f in self._files.values():
+                f.close()
+
+
+class MmapDataset(Dataset):
+    """
+    Map-style dataset reading samples written by
+    :ref:`api_paddle_io_MmapDatasetWriter` from memory-mapped files
+    without copying.
+
+    Field files are memory-mapped lazily in each process, so that all
+    :code:`paddle.io.DataLoader` workers share the same pages in OS page
+    cache instead of holding a copy of the data each. Samples got by
+    :code:`__getitem__` are read-only numpy arrays viewing the mapped
+    files. :code:`__getitems__` reads a mini-batch with one fancy indexing
+    per field if there is no ragged field, see :ref:`api_paddle_io_Dataset`.
+
+    Args:
+        path(str): the directory of dataset files.
+
+    Examples:
+        .. code-block:: python
+
+            >>> import numpy as np
+            >>> import paddle
+            >>> from paddle.io import DataLoader, MmapDataset, MmapDatasetWriter
+
+            >>> with MmapDatasetWriter('mmap_dataset') as writer:
+            ...     for i in range(10):
+            ...         writer.write((np.random.random([4]).astype('float32'), np.array([i])))
+            ...
+            >>> dataset = MmapDataset('mmap_dataset')
+            >>> loader = DataLoader(dataset, batch_size=5)
+            >>> for image, label in loader:
+            ...     print(image.shape, label.shape)
+            [5, 4] [5, 1]
+            [5, 4] [5, 1]
+    """
+
+    def __init__(self, path):
+        self.path = path
+        meta_file = os.path.join(path, _META_FILE)
+        if not os.path.exists(meta_file):
+            raise ValueError(
+                f"{meta_file} not found, {path} is not a complete MmapDataset"
+            )
+        with open(meta_file) as f:
+            meta = json.load(f)
+        self._num_samples = meta['num_samples']
+        self._sample_type = meta['sample_type']
+        self._fields = meta['fields']
+        self._has_ragged = any(field['ragged'] for field in self._fields)
+        self._arrays = None
+
+    def _open(self):
+        # NOTE: memory maps are opened lazily, so that they are created in
+        #       DataLoader workers rather than pickled to them
+        arrays = []
+        for field in self._fields:
+            name = field['name']
+            dtype = np.dtype(field['dtype'])
+            if field['ragged']:
+                offsets = np.fromfile(
+                    _index_file(self.path, name), dtype='int64'
+                )
+                shape = (int(offsets[-1]),) + tuple(field['shape'])
+            else:
+                offsets = None
+                shape = (self._num_samples,) + tuple(field['shape'])
+            if int(np.prod(shape)) == 0:
+                data = np.empty(shape, dtype=dtype)
+            else:
+                data = np.memmap(
+                    _data_file(self.path, name),
+                    dtype=dtype,
+                    mode='r',
+                    shape=shape,
+                )
+            arrays.append((data, offsets))
+        self._arrays = arrays
+
+    def _make_sample(self, values):
+        if self._sample_type == 'dict':
+            return {
+                field['name']: value
+                for field, value in zip(self._fields, values)
+            }
+        if self._sample_type == 'list':
+            return list(values)
+        return tuple(values)
+
+    def __getitem__(self, idx):
+        if self._arrays is None:
+            self._open()
+        if idx < 0:
+            idx += self._num_samples
+        if not 0 <= idx < self._num_samples:
+            raise IndexError(
+                f"index {idx} out of range of MmapDataset with "
+                f"{self._num_samples} samples"
+            )
+        values = []
+        for data, offsets in self._arrays:
+            if offsets is None:
+                values.append(data[idx])
+            else:
+                values.append(data[offsets[idx] : offsets[idx + 1]])
+        return self._make_sample(values)
+
+    def __getitems__(self, indices):
+        if self._has_ragged:
+            return [self[idx] for idx in indices]
+        if self._arrays is None:
+            self._open()
+        indices = np.asarray(indices, dtype='int64')
+        columns = [np.asarray(data[indices]) for data, _ in self._arrays]
+        return [self._make_sample(values) for values in zip(*columns)]
+
+    def __len__(self):
+        return self._num_samples
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_arrays'] = None
+        return state
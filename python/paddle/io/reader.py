@@ -166,6 +166,12 @@ class AuToTune:
                 shuffle=self.loader.batch_sampler.shuffle,
                 drop_last=self.loader.batch_sampler.drop_last,
             )
+        elif isinstance(
+            self.loader.batch_sampler, paddle.io.BucketBatchSampler
+        ):
+            # BucketBatchSampler is built from sample lengths only, there
+            # is no dataset to take a sub dataset from
+            loader = None
         elif isinstance(self.loader.batch_sampler, paddle.io.BatchSampler):
             dataset = self.loader.batch_sampler.sampler.data_source
             sub_dataset = self.get_sub_dataset(dataset, batch_size)
@@ -311,6 +317,10 @@ class DataLoader:
         worker_init_fn(callable, optional): init function which will be called with
             worker id on each subproces starting if not set as None. Default
             None.
+        in_order(bool, optional): whether to output batches in the order of
+            batch indices in multi-process mode. If False, batches are output
+            as soon as any worker finishes loading, so that a slow batch does
+            not block batches loaded by other workers. Default True.
 
     Returns:
         DataLoader: an iterable object for data iterating, each elemnet of the generated data is a Tensor.
@@ -399,12 +409,14 @@ class DataLoader:
         timeout=0,
         worker_init_fn=None,
         persistent_workers=False,
+        in_order=True,
     ):
         self.return_list = return_list
         self.collate_fn = collate_fn
         self.use_buffer_reader = use_buffer_reader
         self.prefetch_factor = prefetch_factor
         self.worker_init_fn = worker_init_fn
+        self.in_order = in_order
 
         self.dataset = dataset
 
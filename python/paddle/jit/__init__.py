@@ -14,6 +14,7 @@
 # limitations under the License.
 
 from .api import ignore_module, load, not_to_static, save, to_static
+from .dy2static.compile_cache import set_compile_cache
 from .dy2static.logging_utils import set_code_level, set_verbosity
 from .dy2static.program_translator import enable_to_static
 from .translated_layer import TranslatedLayer
@@ -28,4 +29,5 @@ __all__ = [
     'set_verbosity',
     'not_to_static',
     'enable_to_static',
+    'set_compile_cache',
 ]
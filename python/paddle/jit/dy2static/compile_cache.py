@@ -0,0 +1,262 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import inspect
+import json
+import os
+import threading
+
+import paddle.version as paddle_version
+
+from .origin_info import Location, OriginInfo, global_origin_info_map
+
+__all__ = []
+
+CACHE_DIR_ENV_NAME = 'TRANSLATOR_CACHE_DIR'
+DEFAULT_MAX_CACHE_SIZE = 256 * 1024 * 1024
+_CACHE_FORMAT_VERSION = 1
+
+
+def _func_location(func):
+    """
+    Returns the source file, the first line number and the column offset of
+    the first line of func, which origin infos are relative to.
+    """
+    source_lines, begin_lineno = inspect.getsourcelines(func)
+    begin_line = source_lines[0]
+    col_offset = len(begin_line) - len(begin_line.lstrip())
+    return inspect.getsourcefile(func), begin_lineno, col_offset
+
+
+class CompileCache:
+    """
+    Persistent cache of the code transformed from dygraph functions by
+    dy2static, so that a new process does not transform the same function
+    again. The transformation only depends on the source code of function,
+    the version of Paddle and the transformation flags, which make up the
+    key of an entry. Every entry is a json file with the transformed module
+    source and the origin infos of its lines, entries are evicted in least
+    recently used order once the total size exceeds ``max_size`` bytes.
+    """
+
+    def __init__(self, cache_dir, max_size=DEFAULT_MAX_CACHE_SIZE):
+        if not isinstance(max_size, int) or max_size <= 0:
+            raise ValueError(
+                f"max_size should be a positive integer, but received {max_size}."
+            )
+        self.cache_dir = os.path.abspath(cache_dir)
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'writes': 0,
+            'invalidations': 0,
+            'evictions': 0,
+        }
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _key(self, source_code):
+        flag = str(os.environ.get('FLAGS_optim_transformation'))
+        key = '\n'.join(
+            [
+                str(_CACHE_FORMAT_VERSION),
+                paddle_version.full_version,
+                paddle_version.commit,
+                flag,
+                source_code,
+            ]
+        )
+        return hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+    def _entry_path(self, source_code):
+        return os.path.join(self.cache_dir, self._key(source_code) + '.json')
+
+    def _count(self, name):
+        with self._lock:
+            self._stats[name] += 1
+
+    def stats(self):
+        """
+        Returns a dict of the numbers of hits, misses, writes, invalidations
+        and evictions of cache since created.
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def load(self, source_code):
+        """
+        Returns the cached entry of source_code, or None if not cached.
+        """
+        entry_path = self._entry_path(source_code)
+        try:
+            with open(entry_path, encoding='utf-8') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            self._count('misses')
+            return None
+        except (OSError, ValueError):
+            entry = None
+        # NOTE: the key is a hash, check the source to rule out collisions
+        if (
+            not isinstance(entry, dict)
+            or entry.get('version') != _CACHE_FORMAT_VERSION
+            or entry.get('source_code') != source_code
+        ):
+            self._count('invalidations')
+            self._remove(entry_path)
+            return None
+        # update mtime for LRU eviction
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+        self._count('hits')
+        return entry
+
+    def register_origin_info(self, entry, func, static_file):
+        """
+        Restores the origin infos of a cached entry, which are saved
+        relatively to the location of the function transformed.
+        """
+        filepath, begin_lineno, begin_col = _func_location(func)
+        for static_lineno, lineno, col, func_name, code in entry['origin_info']:
+            location = Location(
+                filepath,
+                begin_lineno + lineno,
+                None if col is None else begin_col + col,
+            )
+            global_origin_info_map[(static_file, static_lineno)] = OriginInfo(
+                location, func_name, code
+            )
+
+    def save(self, source_code, func, static_source, origin_info_map):
+        """
+        Saves the transformed module source of func and the origin infos of
+        its lines into cache.
+        """
+        filepath, begin_lineno, begin_col = _func_location(func)
+        origin_info = []
+        for (_, static_lineno), info in origin_info_map.items():
+            if info.location.filepath != filepath:
+                continue
+            col = info.location.col_offset
+            origin_info.append(
+                [
+                    static_lineno,
+                    info.location.lineno - begin_lineno,
+                    None if col is None else col - begin_col,
+                    info.function_name,
+                    info.source_code,
+                ]
+            )
+        entry = {
+            'version': _CACHE_FORMAT_VERSION,
+            'source_code': source_code,
+            'static_source': static_source,
+            'origin_info': origin_info,
+        }
+        entry_path = self._entry_path(source_code)
+        tmp_path = f'{entry_path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, entry_path)
+        except OSError:
+            # the cache is an optimization, never fail the conversion
+            self._remove(tmp_path)
+            return
+        self._count('writes')
+        self._evict()
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+            return True
+        except OSError:
+            return False
+
+    def _evict(self):
+        entries = []
+        total_size = 0
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if not entry.name.endswith('.json'):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+                total_size += stat.st_size
+        if total_size <= self.max_size:
+            return
+        entries.sort()
+        for _, size, path in entries:
+            if total_size <= self.max_size:
+                break
+            if self._remove(path):
+                total_size -= size
+                self._count('evictions')
+
+
+_COMPILE_CACHE = None
+_COMPILE_CACHE_INITIALIZED = False
+
+
+def set_compile_cache(cache_dir=None, max_size=DEFAULT_MAX_CACHE_SIZE):
+    """
+    Sets the directory of the persistent cache of code transformed by
+    ``paddle.jit.to_static``, so that the functions transformed once are
+    not transformed again by later processes, which speeds up the first
+    call of the decorated functions after restarts.
+
+    There are two means to set the cache directory:
+
+    1. Call function `set_compile_cache`
+
+    2. Set environment variable `TRANSLATOR_CACHE_DIR`
+
+    **Note**:
+    `set_compile_cache` has a higher priority than the environment variable.
+
+    Args:
+        cache_dir(str|None): The directory of cache. If None, the cache is disabled. Default: None.
+        max_size(int): The maximum total size of cache files in bytes, least recently used
+            entries are removed once exceeded. Default: 256MB.
+
+    Examples:
+        .. code-block:: python
+
+            >>> import paddle
+
+            >>> paddle.jit.set_compile_cache('./to_static_cache')
+            >>> # The transformed code of functions decorated by paddle.jit.to_static are
+            >>> # saved to and loaded from ./to_static_cache
+    """
+    global _COMPILE_CACHE, _COMPILE_CACHE_INITIALIZED
+    _COMPILE_CACHE = (
+        CompileCache(cache_dir, max_size) if cache_dir is not None else None
+    )
+    _COMPILE_CACHE_INITIALIZED = True
+
+
+def get_compile_cache():
+    global _COMPILE_CACHE, _COMPILE_CACHE_INITIALIZED
+    if not _COMPILE_CACHE_INITIALIZED:
+        cache_dir = os.getenv(CACHE_DIR_ENV_NAME)
+        _COMPILE_CACHE = CompileCache(cache_dir) if cache_dir else None
+        _COMPILE_CACHE_INITIALIZED = True
+    return _COMPILE_CACHE
@@ -37,6 +37,7 @@ from paddle.pir.core import _convert_into_value, static_op_arg_cast_guard
 from paddle.utils import flatten, gast
 
 from . import error, logging_utils
+from .compile_cache import get_compile_cache
 from .function_spec import (
     FunctionSpec,
     _hash_spec_names,
@@ -65,6 +66,7 @@ from .utils import (
     make_hashable,
     prim_is_enabled,
     prim_or_cinn_is_enabled,
+    source_to_func,
     type_name,
 )
 
@@ -141,9 +143,23 @@ class FunctionCache:
         #  Consider this case: source_code in self._code_to_ast_caches,
         #  but actually they are methods in different classes.
         #  Maybe use (__class__, source_code) as key
+        compile_cache = None
         if source_code in self._code_to_ast_caches:
             root = self._code_to_ast_caches[source_code]
         else:
+            compile_cache = get_compile_cache()
+            entry = (
+                compile_cache.load(source_code)
+                if compile_cache is not None
+                else None
+            )
+            if entry is not None:
+                # Skip the transformation if transformed by previous processes
+                static_func, file_name = source_to_func(
+                    entry['static_source'], func
+                )
+                compile_cache.register_origin_info(entry, func, file_name)
+                return static_func
             root = gast.parse(source_code)
             root = attach_origin_info(root, func)
             root = self._dygraph_to_static.get_static_ast(root)
@@ -152,7 +168,15 @@ class FunctionCache:
         # Get static function from AST
         static_func, file_name = ast_to_func(root, func)
 
-        create_and_update_origin_info_map(root, static_func)
+        origin_info_map = create_and_update_origin_info_map(
+            root, static_func, is_global=False
+        )
+        if compile_cache is not None:
+            with open(file_name, encoding='utf-8') as f:
+                static_source = f.read()
+            compile_cache.save(
+                source_code, func, static_source, origin_info_map
+            )
         return static_func
 
     def exist(self, func):
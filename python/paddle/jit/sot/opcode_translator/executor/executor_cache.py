@@ -15,13 +15,16 @@
 from __future__ import annotations
 
 import gc
+import time
 import traceback
 import types
-from typing import List, Tuple
+from collections import OrderedDict
+from typing import Any, List, Tuple
 
 from ...profiler import EventGuard, event_register
 from ...psdb import NO_FALLBACK_CODES
 from ...utils import (
+    ENV_SOT_CACHE_SIZE,
     BreakGraphError,
     FallbackError,
     InnerError,
@@ -31,7 +34,7 @@ from ...utils import (
     log_do,
 )
 from ..custom_code import CustomCode
-from .guard import Guard
+from .guard import Guard, make_sub_guard
 from .opcode_executor import OpcodeExecutor, OpcodeExecutorBase
 
 GuardedFunction = Tuple[CustomCode, Guard]
@@ -42,6 +45,147 @@ dummy_guard.expr = "lambda frame: True"
 dummy_guard.lambda_expr = "lambda frame: True"
 
 
+class GuardNode:
+    """
+    A node of GuardTree. The check of node is shared by the guards of all
+    entries in its subtree, and is only evaluated once per lookup.
+    """
+
+    __slots__ = ["key", "check", "parent", "children", "entries", "num_entries"]
+
+    def __init__(self, key, check: Guard | None, parent: GuardNode | None):
+        self.key = key
+        self.check = check
+        self.parent = parent
+        # children in most recently hit order
+        self.children: OrderedDict[Any, GuardNode] = OrderedDict()
+        # entries whose guards are fully checked by the path to this node
+        self.entries: list[GuardEntry] = []
+        self.num_entries = 0
+
+
+class GuardEntry:
+    __slots__ = ["custom_code", "guard_fn", "node"]
+
+    def __init__(self, custom_code: CustomCode, guard_fn: Guard, node):
+        self.custom_code = custom_code
+        self.guard_fn = guard_fn
+        self.node = node
+
+
+class GuardTree:
+    """
+    The guarded functions of a code object, organized as a decision tree of
+    the sub expressions of their guards. The guards of the same code usually
+    share most of their checks, e.g. the types of inputs, which are checked
+    once for all entries, and the entries failing a shared check are skipped
+    together. Children and entries are tried in most recently hit order.
+    """
+
+    def __init__(self):
+        self.root = GuardNode(None, None, None)
+        # entries in least recently hit order
+        self._entries: OrderedDict[GuardEntry, None] = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __iter__(self):
+        for entry in reversed(self._entries):
+            yield entry.custom_code, entry.guard_fn
+
+    @staticmethod
+    def _checks(guard_fn: Guard):
+        sub_exprs = getattr(guard_fn, "sub_exprs", None)
+        if sub_exprs is None:
+            yield ("guard", id(guard_fn)), lambda: guard_fn
+            return
+        for expr, free_vars in sub_exprs:
+            # the free variables are referenced by the check of node, so
+            # their ids are not reused while the node is alive
+            key = (
+                expr,
+                tuple(
+                    sorted(
+                        (name, id(value)) for name, value in free_vars.items()
+                    )
+                ),
+            )
+            yield key, lambda expr=expr, free_vars=free_vars: make_sub_guard(
+                expr, free_vars
+            )
+
+    def add(self, custom_code: CustomCode, guard_fn: Guard):
+        node = self.root
+        node.num_entries += 1
+        for key, make_check in self._checks(guard_fn):
+            child = node.children.get(key)
+            if child is None:
+                child = GuardNode(key, make_check(), node)
+                node.children[key] = child
+                node.children.move_to_end(key, last=False)
+            node = child
+            node.num_entries += 1
+        entry = GuardEntry(custom_code, guard_fn, node)
+        node.entries.insert(0, entry)
+        self._entries[entry] = None
+
+    def evict(self) -> GuardedFunction:
+        """
+        Removes the least recently hit entry.
+        """
+        entry, _ = self._entries.popitem(last=False)
+        node = entry.node
+        node.entries.remove(entry)
+        while node is not None:
+            node.num_entries -= 1
+            parent = node.parent
+            if node.num_entries == 0 and parent is not None:
+                del parent.children[node.key]
+            node = parent
+        return entry.custom_code, entry.guard_fn
+
+    @staticmethod
+    def _check(check: Guard, frame: types.FrameType) -> bool:
+        try:
+            return bool(check(frame))
+        except Exception as e:
+            log(2, f"[Cache]: Guard function error: {e}\n")
+            return False
+
+    def _match(self, node: GuardNode, frame: types.FrameType):
+        if node.entries:
+            return node.entries[0]
+        for key, child in node.children.items():
+            if self._check(child.check, frame):
+                entry = self._match(child, frame)
+                if entry is not None:
+                    node.children.move_to_end(key, last=False)
+                    return entry
+        return None
+
+    def lookup(self, frame: types.FrameType) -> GuardedFunction | None:
+        """
+        Returns the most recently hit guarded function whose guard passes,
+        or None if all guards miss.
+        """
+        if len(self._entries) == 1:
+            # the whole guard shares the temporary values of sub expressions
+            entry = next(iter(self._entries))
+            if not self._check(entry.guard_fn, frame):
+                return None
+        else:
+            entry = self._match(self.root, frame)
+            if entry is None:
+                return None
+            entries = entry.node.entries
+            if entries[0] is not entry:
+                entries.remove(entry)
+                entries.insert(0, entry)
+        self._entries.move_to_end(entry)
+        return entry.custom_code, entry.guard_fn
+
+
 @Singleton
 class OpcodeExecutorCache:
     """
@@ -49,84 +193,121 @@ class OpcodeExecutorCache:
     This cache is used to store previously translated instructions along with their corresponding guard functions.
 
     Attributes:
-        cache (dict): A dictionary that maps code objects to tuples of a cache getter function and a list of guarded functions.
+        cache (dict): A dictionary that maps code objects to the GuardTree of their guarded functions.
         translate_count (int): The count of how many instructions have been translated. It is used to test whether the cache hits.
+        hit_count (int): The count of lookups which hit the cache.
+        miss_count (int): The count of lookups which miss all guards of the code object.
+        evict_count (int): The count of guarded functions evicted because the cache of code object is full.
+        guard_time (float): The total seconds spent on checking guards.
     """
 
-    MAX_CACHE_SIZE = 20
-    cache: dict[types.CodeType, GuardedFunctions]
+    cache: dict[types.CodeType, GuardTree]
     translate_count: int
 
     def __init__(self):
         self.cache = {}
         self.translate_count = 0
+        self.hit_count = 0
+        self.miss_count = 0
+        self.evict_count = 0
+        self.guard_time = 0.0
+
+    @property
+    def max_cache_size(self) -> int:
+        """
+        The maximum number of guarded functions of a code object, which is
+        set by the environment variable `SOT_CACHE_SIZE`.
+        """
+        return max(ENV_SOT_CACHE_SIZE.get(), 1)
 
     def clear(self):
         """
-        Clears the cache and resets the translate count.
+        Clears the cache and resets the counters.
         """
         self.cache.clear()
         self.translate_count = 0
+        self.hit_count = 0
+        self.miss_count = 0
+        self.evict_count = 0
+        self.guard_time = 0.0
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Returns the counters of cache.
+        """
+        return {
+            "translate_count": self.translate_count,
+            "hit_count": self.hit_count,
+            "miss_count": self.miss_count,
+            "evict_count": self.evict_count,
+            "guard_time": self.guard_time,
+        }
 
     def __call__(self, frame: types.FrameType, **kwargs) -> CustomCode:
         code: types.CodeType = frame.f_code
         if code not in self.cache:
             log(2, f"[Cache]: Firstly call {code}\n")
             new_custom_code, guard_fn = self.translate(frame, **kwargs)
-            self.cache[code] = [(new_custom_code, guard_fn)]
+            guarded_fns = GuardTree()
+            guarded_fns.add(new_custom_code, guard_fn)
+            self.cache[code] = guarded_fns
             return new_custom_code
         guarded_fns = self.cache[code]
         return self.lookup(frame, guarded_fns, **kwargs)
 
     @event_register("lookup")
     def lookup(
-        self, frame: types.FrameType, guarded_fns: GuardedFunctions, **kwargs
+        self, frame: types.FrameType, guarded_fns: GuardTree, **kwargs
     ) -> CustomCode:
         """
-        Looks up the cache for a matching code object and returns a custom code object if a matching guard function is found, otherwise None.
+        Looks up the cache for a matching code object and returns a custom code object if a matching guard function is found,
+        otherwise translates the frame and adds the result to cache, evicting the least recently hit guarded function if full.
 
         Args:
             frame (types.FrameType): The frame whose code object needs to be looked up in the cache.
-            guarded_fns (GuardedFunctions): The list of guarded functions associated with the code object.
+            guarded_fns (GuardTree): The guarded functions associated with the code object.
 
         Returns:
-            CustomCode | None: The custom code object if a matching guard function is found, otherwise None.
+            CustomCode: The custom code object of the matching guard function or the new translation.
         """
+        start = time.perf_counter()
+        with EventGuard("try guard"):
+            result = guarded_fns.lookup(frame)
+        self.guard_time += time.perf_counter() - start
 
-        if len(guarded_fns) >= self.MAX_CACHE_SIZE:
-            log(2, "[Cache]: Exceed max cache size, skip it\n")
-            return CustomCode(None, False)
-
-        for custom_code, guard_fn in guarded_fns:
-            try:
-                with EventGuard("try guard"):
-                    guard_result = guard_fn(frame)
-                if guard_result:
-                    log(
-                        2,
-                        f"[Cache]: Cache hit, Guard is \n{getattr(guard_fn, 'expr', 'None')}\n",
-                    )
-                    return custom_code
-                else:
-                    log_do(
-                        4,
-                        self.analyse_guard_global_object(guard_fn),
-                    )
-                    log(
-                        2,
-                        f"[Cache]: Cache miss, Guard is \n{getattr(guard_fn, 'expr', 'None')}\n",
-                    )
-                    log_do(
-                        2,
-                        self.analyse_guard_error(guard_fn, frame),
-                    )
-            except Exception as e:
-                log(2, f"[Cache]: Guard function error: {e}\n")
-                continue
+        if result is not None:
+            custom_code, guard_fn = result
+            self.hit_count += 1
+            log(
+                2,
+                f"[Cache]: Cache hit, Guard is \n{getattr(guard_fn, 'expr', 'None')}\n",
+            )
+            return custom_code
 
+        self.miss_count += 1
+        for _, guard_fn in guarded_fns:
+            log_do(
+                4,
+                self.analyse_guard_global_object(guard_fn),
+            )
+            log(
+                2,
+                f"[Cache]: Cache miss, Guard is \n{getattr(guard_fn, 'expr', 'None')}\n",
+            )
+            log_do(
+                2,
+                self.analyse_guard_error(guard_fn, frame),
+            )
         log(2, "[Cache]: all guards missed\n")
         new_custom_code, guard_fn = self.translate(frame, **kwargs)
-        guarded_fns.append((new_custom_code, guard_fn))
+        while len(guarded_fns) >= self.max_cache_size:
+            _, evicted_guard_fn = guarded_fns.evict()
+            self.evict_count += 1
+            log(
+                2,
+                f"[Cache]: Exceed max cache size, evict Guard \n{getattr(evicted_guard_fn, 'expr', 'None')}\n",
+            )
+        guarded_fns.add(new_custom_code, guard_fn)
         return new_custom_code
 
     def translate(
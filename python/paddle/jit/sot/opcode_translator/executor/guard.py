@@ -85,6 +85,7 @@ def make_guard(stringify_guards: list[StringifyExpression]) -> Guard:
         if not num_guards:
             guard = lambda frame: True
             guard.expr = "lambda frame: True"
+            guard.sub_exprs = []
             return guard
 
         def analyse_expresions(stringify_exprs, tmp_names):
@@ -122,11 +123,30 @@ def make_guard(stringify_guards: list[StringifyExpression]) -> Guard:
         log(3, f"[Guard]: {lambda_string}\n")
         guard.lambda_expr = lambda_string
         guard.expr = func_string
+        # the sub expressions are checked separately by OpcodeExecutorCache
+        # to share the common checks among the guards of a code
+        guard.sub_exprs = [
+            (str_expr.debug_expr, str_expr.free_vars)
+            for str_expr in stringify_guards
+        ]
         assert callable(guard), "guard must be callable."
 
         return guard
 
 
+def make_sub_guard(expr: str, free_vars: dict[str, Any]) -> Guard:
+    """
+    Make a guard from a sub expression of guard, see `make_guard`.
+
+    Args:
+        expr: the debug expression of a StringifyExpression.
+        free_vars: the free variables used in the expression.
+    """
+    guard = eval(f"lambda frame: {expr}", dict(free_vars))
+    guard.expr = expr
+    return guard
+
+
 def support_weak_ref(obj):
     if isinstance(obj, types.FunctionType):
         return True
@@ -33,6 +33,7 @@ ENV_SOT_WITH_CONTROL_FLOW = BooleanEnvironmentVariable(
     "SOT_WITH_CONTROL_FLOW", True
 )
 ENV_SOT_EXPORT = StringEnvironmentVariable("SOT_EXPORT", "")
+ENV_SOT_CACHE_SIZE = IntegerEnvironmentVariable("SOT_CACHE_SIZE", 20)
 
 
 @contextmanager
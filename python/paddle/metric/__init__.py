@@ -12,7 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .metrics import Accuracy, Auc, Metric, Precision, Recall, accuracy
+from .metrics import (
+    Accuracy,
+    Auc,
+    ConfusionMatrix,
+    Metric,
+    MultiLabelAuc,
+    Precision,
+    PrecisionRecallF1,
+    Recall,
+    accuracy,
+    all_reduce_metrics,
+)
 
 __all__ = [
     'Metric',
@@ -20,5 +31,9 @@ __all__ = [
     'Precision',
     'Recall',
     'Auc',
+    'ConfusionMatrix',
+    'PrecisionRecallF1',
+    'MultiLabelAuc',
     'accuracy',
+    'all_reduce_metrics',
 ]
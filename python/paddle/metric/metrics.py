@@ -31,6 +31,68 @@ def _is_numpy_(var):
     return isinstance(var, (np.ndarray, np.generic))
 
 
+def _is_tensor_(var):
+    return isinstance(var, (paddle.Tensor, paddle.base.core.eager.Tensor))
+
+
+def _to_numpy_input(var, var_name):
+    if _is_tensor_(var):
+        return np.array(var)
+    elif not _is_numpy_(var):
+        raise ValueError(f"The '{var_name}' must be a numpy ndarray or Tensor.")
+    return var
+
+
+def _to_tensor_input(var, var_name):
+    if _is_tensor_(var):
+        return var
+    elif not _is_numpy_(var):
+        raise ValueError(f"The '{var_name}' must be a numpy ndarray or Tensor.")
+    return paddle.to_tensor(var)
+
+
+def _auc_from_histograms(stat_pos, stat_neg):
+    """
+    Computes ROC AUC from positive and negative histograms over prediction
+    buckets, the last axis of histograms is the bucket axis, the leading
+    axes are batched.
+    """
+    # accumulate from the highest threshold to the lowest one
+    tot_pos = np.cumsum(stat_pos[..., ::-1], axis=-1)
+    tot_neg = np.cumsum(stat_neg[..., ::-1], axis=-1)
+    tot_pos_prev = tot_pos - stat_pos[..., ::-1]
+    tot_neg_prev = tot_neg - stat_neg[..., ::-1]
+    auc = np.sum(
+        Auc.trapezoid_area(tot_neg, tot_neg_prev, tot_pos, tot_pos_prev),
+        axis=-1,
+    )
+
+    tot_pos, tot_neg = tot_pos[..., -1], tot_neg[..., -1]
+    valid = np.logical_and(tot_pos > 0.0, tot_neg > 0.0)
+    denom = np.where(valid, tot_pos * tot_neg, 1.0)
+    return np.where(valid, auc / denom, 0.0)
+
+
+def _label_to_index(label):
+    if (len(label.shape) == 1) or (
+        len(label.shape) == 2 and label.shape[-1] == 1
+    ):
+        return paddle.reshape(label, (-1, 1))
+    # one-hot label
+    return paddle.argmax(label, axis=-1, keepdim=True)
+
+
+def _safe_divide(numerator, denominator):
+    numerator = np.asarray(numerator, dtype="float64")
+    denominator = np.asarray(denominator, dtype="float64")
+    return np.divide(
+        numerator,
+        denominator,
+        out=np.zeros_like(numerator),
+        where=denominator != 0,
+    )
+
+
 class Metric(metaclass=abc.ABCMeta):
     r"""
     Base class for metric, encapsulates metric logic and APIs
@@ -179,6 +241,39 @@ class Metric(metaclass=abc.ABCMeta):
         """
         return args
 
+    def state(self):
+        """
+        Returns the accumulated states of metric as a 1-D float64 numpy
+        array. States of the same metric computed on different dataloader
+        workers or ranks can be combined by :code:`merge_state`, which
+        avoids gathering all predictions and labels to compute metric.
+
+        see :code:`Metric.merge_state` and
+        :code:`paddle.metric.all_reduce_metrics`
+        """
+        raise NotImplementedError(
+            f"function 'state' not implemented in {self.__class__.__name__}."
+        )
+
+    def set_state(self, state):
+        """
+        Overwrites the accumulated states of metric by :code:`state`, which
+        is in the same format as the output of :code:`Metric.state`.
+        """
+        raise NotImplementedError(
+            f"function 'set_state' not implemented in {self.__class__.__name__}."
+        )
+
+    def merge_state(self, state):
+        """
+        Merges :code:`state`, which is the output of :code:`Metric.state`
+        of the same metric computed on other data, into the accumulated
+        states of metric. States are count based, default behaviour is to
+        sum them up.
+        """
+        state = np.asarray(state, dtype="float64")
+        self.set_state(self.state() + state)
+
 
 class Accuracy(Metric):
     """
@@ -305,6 +400,20 @@ class Accuracy(Metric):
         self.total = [0.0] * len(self.topk)
         self.count = [0] * len(self.topk)
 
+    def state(self):
+        """
+        Returns the total correct count and total count of each top-k.
+        """
+        return np.array(self.total + self.count, dtype="float64")
+
+    def set_state(self, state):
+        """
+        Overwrites the total correct count and total count of each top-k.
+        """
+        num_topk = len(self.topk)
+        self.total = [float(t) for t in state[:num_topk]]
+        self.count = [int(c) for c in state[num_topk:]]
+
     def accumulate(self):
         """
         Computes and returns the accumulated metric.
@@ -342,6 +451,10 @@ class Precision(Metric):
     Args:
         name (str, optional): String name of the metric instance.
             Default is `precision`.
+        accumulate_on_device (bool, optional): Whether to keep the metric
+            states as Tensors on the device of the inputs. If True, inputs
+            of :code:`update` are not fetched to host, states are only
+            fetched in :code:`accumulate`. Default is False.
 
     Examples:
         .. code-block:: python
@@ -395,11 +508,13 @@ class Precision(Metric):
             >>> model.fit(data, batch_size=16)
     """
 
-    def __init__(self, name='precision', *args, **kwargs):
+    def __init__(
+        self, name='precision', *args, accumulate_on_device=False, **kwargs
+    ):
         super().__init__(*args, **kwargs)
-        self.tp = 0  # true positive
-        self.fp = 0  # false positive
         self._name = name
+        self._accumulate_on_device = accumulate_on_device
+        self.reset()
 
     def update(self, preds, labels):
         """
@@ -413,34 +528,38 @@ class Precision(Metric):
                 the shape should keep the same as preds.
                 The data type is 'int32' or 'int64'.
         """
-        if isinstance(preds, (paddle.Tensor, paddle.base.core.eager.Tensor)):
-            preds = np.array(preds)
-        elif not _is_numpy_(preds):
-            raise ValueError("The 'preds' must be a numpy ndarray or Tensor.")
+        if self._accumulate_on_device:
+            preds = _to_tensor_input(preds, 'preds').flatten()
+            labels = _to_tensor_input(labels, 'labels').flatten()
+            # floor(pred + 0.5) == 1 <=> 0.5 <= pred < 1.5
+            pos = paddle.logical_and(preds >= 0.5, preds < 1.5)
+            tp = paddle.logical_and(pos, labels == 1)
+            num_pos = paddle.sum(paddle.cast(pos, 'int64'))
+            num_tp = paddle.sum(paddle.cast(tp, 'int64'))
+            self.tp = self.tp + num_tp
+            self.fp = self.fp + (num_pos - num_tp)
+            return
+
+        preds = _to_numpy_input(preds, 'preds').reshape(-1)
+        labels = _to_numpy_input(labels, 'labels').reshape(-1)
 
-        if isinstance(labels, (paddle.Tensor, paddle.base.core.eager.Tensor)):
-            labels = np.array(labels)
-        elif not _is_numpy_(labels):
-            raise ValueError("The 'labels' must be a numpy ndarray or Tensor.")
-
-        sample_num = labels.shape[0]
         preds = np.floor(preds + 0.5).astype("int32")
-
-        for i in range(sample_num):
-            pred = preds[i]
-            label = labels[i]
-            if pred == 1:
-                if pred == label:
-                    self.tp += 1
-                else:
-                    self.fp += 1
+        pos = preds == 1
+        num_pos = int(np.count_nonzero(pos))
+        num_tp = int(np.count_nonzero(pos & (labels == 1)))
+        self.tp += num_tp
+        self.fp += num_pos - num_tp
 
     def reset(self):
         """
         Resets all of the metric state.
         """
-        self.tp = 0
-        self.fp = 0
+        if self._accumulate_on_device:
+            self.tp = paddle.zeros([], dtype='int64')
+            self.fp = paddle.zeros([], dtype='int64')
+        else:
+            self.tp = 0  # true positive
+            self.fp = 0  # false positive
 
     def accumulate(self):
         """
@@ -449,8 +568,23 @@ class Precision(Metric):
         Returns:
             A scaler float: results of the calculated precision.
         """
-        ap = self.tp + self.fp
-        return float(self.tp) / ap if ap != 0 else 0.0
+        tp, fp = int(self.tp), int(self.fp)
+        ap = tp + fp
+        return float(tp) / ap if ap != 0 else 0.0
+
+    def state(self):
+        """
+        Returns the true positive and false positive count.
+        """
+        return np.array([int(self.tp), int(self.fp)], dtype="float64")
+
+    def set_state(self, state):
+        """
+        Overwrites the true positive and false positive count.
+        """
+        self.reset()
+        self.tp = self.tp + int(state[0])
+        self.fp = self.fp + int(state[1])
 
     def name(self):
         """
@@ -474,6 +608,10 @@ class Recall(Metric):
     Args:
         name (str, optional): String name of the metric instance.
             Default is `recall`.
+        accumulate_on_device (bool, optional): Whether to keep the metric
+            states as Tensors on the device of the inputs. If True, inputs
+            of :code:`update` are not fetched to host, states are only
+            fetched in :code:`accumulate`. Default is False.
 
     Examples:
         .. code-block:: python
@@ -527,11 +665,13 @@ class Recall(Metric):
             >>> model.fit(data, batch_size=16)
     """
 
-    def __init__(self, name='recall', *args, **kwargs):
+    def __init__(
+        self, name='recall', *args, accumulate_on_device=False, **kwargs
+    ):
         super().__init__(*args, **kwargs)
-        self.tp = 0  # true positive
-        self.fn = 0  # false negative
         self._name = name
+        self._accumulate_on_device = accumulate_on_device
+        self.reset()
 
     def update(self, preds, labels):
         """
@@ -545,27 +685,29 @@ class Recall(Metric):
                 the shape should keep the same as preds.
                 Shape: [batch_size, 1], Dtype: 'int32' or 'int64'.
         """
-        if isinstance(preds, (paddle.Tensor, paddle.base.core.eager.Tensor)):
-            preds = np.array(preds)
-        elif not _is_numpy_(preds):
-            raise ValueError("The 'preds' must be a numpy ndarray or Tensor.")
+        if self._accumulate_on_device:
+            preds = _to_tensor_input(preds, 'preds').flatten()
+            labels = _to_tensor_input(labels, 'labels').flatten()
+            # rint(pred) == 1 <=> 0.5 < pred < 1.5 (round half to even)
+            pos = labels == 1
+            tp = paddle.logical_and(
+                pos, paddle.logical_and(preds > 0.5, preds < 1.5)
+            )
+            num_pos = paddle.sum(paddle.cast(pos, 'int64'))
+            num_tp = paddle.sum(paddle.cast(tp, 'int64'))
+            self.tp = self.tp + num_tp
+            self.fn = self.fn + (num_pos - num_tp)
+            return
 
-        if isinstance(labels, (paddle.Tensor, paddle.base.core.eager.Tensor)):
-            labels = np.array(labels)
-        elif not _is_numpy_(labels):
-            raise ValueError("The 'labels' must be a numpy ndarray or Tensor.")
+        preds = _to_numpy_input(preds, 'preds').reshape(-1)
+        labels = _to_numpy_input(labels, 'labels').reshape(-1)
 
-        sample_num = labels.shape[0]
         preds = np.rint(preds).astype("int32")
-
-        for i in range(sample_num):
-            pred = preds[i]
-            label = labels[i]
-            if label == 1:
-                if pred == label:
-                    self.tp += 1
-                else:
-                    self.fn += 1
+        pos = labels == 1
+        num_pos = int(np.count_nonzero(pos))
+        num_tp = int(np.count_nonzero(pos & (preds == 1)))
+        self.tp += num_tp
+        self.fn += num_pos - num_tp
 
     def accumulate(self):
         """
@@ -574,15 +716,34 @@ class Recall(Metric):
         Returns:
             A scaler float: results of the calculated Recall.
         """
-        recall = self.tp + self.fn
-        return float(self.tp) / recall if recall != 0 else 0.0
+        tp, fn = int(self.tp), int(self.fn)
+        recall = tp + fn
+        return float(tp) / recall if recall != 0 else 0.0
+
+    def state(self):
+        """
+        Returns the true positive and false negative count.
+        """
+        return np.array([int(self.tp), int(self.fn)], dtype="float64")
+
+    def set_state(self, state):
+        """
+        Overwrites the true positive and false negative count.
+        """
+        self.reset()
+        self.tp = self.tp + int(state[0])
+        self.fn = self.fn + int(state[1])
 
     def reset(self):
         """
         Resets all of the metric state.
         """
-        self.tp = 0
-        self.fn = 0
+        if self._accumulate_on_device:
+            self.tp = paddle.zeros([], dtype='int64')
+            self.fn = paddle.zeros([], dtype='int64')
+        else:
+            self.tp = 0  # true positive
+            self.fn = 0  # false negative
 
     def name(self):
         """
@@ -595,7 +756,6 @@ class Auc(Metric):
     """
     The auc metric is for binary classification.
     Refer to https://en.wikipedia.org/wiki/Receiver_operating_characteristic#Area_under_the_curve.
-    Please notice that the auc metric is implemented with python, which may be a little bit slow.
 
     The `auc` function creates four local variables, `true_positives`,
     `true_negatives`, `false_positives` and `false_negatives` that are used to
@@ -613,6 +773,11 @@ class Auc(Metric):
             'ROC' or 'PR' for the Precision-Recall-curve. Default is 'ROC'.
         name (str, optional): String name of the metric instance. Default
             is `auc`.
+        accumulate_on_device (bool, optional): Whether to keep the positive
+            and negative histograms as Tensors on the device of the inputs.
+            If True, inputs of :code:`update` are not fetched to host, the
+            histograms are only fetched in :code:`accumulate`. Default is
+            False.
 
     "NOTE: only implement the ROC curve type via Python now."
 
@@ -673,16 +838,20 @@ class Auc(Metric):
     """
 
     def __init__(
-        self, curve='ROC', num_thresholds=4095, name='auc', *args, **kwargs
+        self,
+        curve='ROC',
+        num_thresholds=4095,
+        name='auc',
+        *args,
+        accumulate_on_device=False,
+        **kwargs,
     ):
         super().__init__(*args, **kwargs)
         self._curve = curve
         self._num_thresholds = num_thresholds
-
-        _num_pred_buckets = num_thresholds + 1
-        self._stat_pos = np.zeros(_num_pred_buckets)
-        self._stat_neg = np.zeros(_num_pred_buckets)
+        self._accumulate_on_device = accumulate_on_device
         self._name = name
+        self.reset()
 
     def update(self, preds, labels):
         """
@@ -696,24 +865,33 @@ class Auc(Metric):
                 (batch_size, 1), labels[i] is either o or 1,
                 representing the label of the instance i.
         """
-        if isinstance(labels, (paddle.Tensor, paddle.base.core.eager.Tensor)):
-            labels = np.array(labels)
-        elif not _is_numpy_(labels):
-            raise ValueError("The 'labels' must be a numpy ndarray or Tensor.")
-
-        if isinstance(preds, (paddle.Tensor, paddle.base.core.eager.Tensor)):
-            preds = np.array(preds)
-        elif not _is_numpy_(preds):
-            raise ValueError("The 'preds' must be a numpy ndarray or Tensor.")
-
-        for i, lbl in enumerate(labels):
-            value = preds[i, 1]
-            bin_idx = int(value * self._num_thresholds)
-            assert bin_idx <= self._num_thresholds
-            if lbl:
-                self._stat_pos[bin_idx] += 1.0
-            else:
-                self._stat_neg[bin_idx] += 1.0
+        _num_pred_buckets = self._num_thresholds + 1
+        if self._accumulate_on_device:
+            labels = _to_tensor_input(labels, 'labels').flatten()
+            preds = _to_tensor_input(preds, 'preds')
+            bin_idx = paddle.cast(preds[:, 1] * self._num_thresholds, 'int64')
+            # NOTE: paddle.bincount fetches the range of inputs to host, add
+            #       to the fixed size histograms by scatter instead
+            bin_idx = paddle.clip(bin_idx, 0, self._num_thresholds)
+            pos = paddle.cast(labels != 0, 'int64')
+            self._stat_pos = paddle.put_along_axis(
+                self._stat_pos, bin_idx, pos, 0, 'add', broadcast=False
+            )
+            self._stat_neg = paddle.put_along_axis(
+                self._stat_neg, bin_idx, 1 - pos, 0, 'add', broadcast=False
+            )
+            return
+
+        labels = _to_numpy_input(labels, 'labels').reshape(-1)
+        preds = _to_numpy_input(preds, 'preds')
+
+        bin_idx = (preds[:, 1] * self._num_thresholds).astype("int64")
+        assert bin_idx.size == 0 or bin_idx.max() <= self._num_thresholds
+        pos = labels.astype("bool")
+        self._stat_pos += np.bincount(bin_idx[pos], minlength=_num_pred_buckets)
+        self._stat_neg += np.bincount(
+            bin_idx[~pos], minlength=_num_pred_buckets
+        )
 
     @staticmethod
     def trapezoid_area(x1, x2, y1, y2):
@@ -726,32 +904,46 @@ class Auc(Metric):
         Return:
             float: the area under auc curve
         """
-        tot_pos = 0.0
-        tot_neg = 0.0
-        auc = 0.0
-
-        idx = self._num_thresholds
-        while idx >= 0:
-            tot_pos_prev = tot_pos
-            tot_neg_prev = tot_neg
-            tot_pos += self._stat_pos[idx]
-            tot_neg += self._stat_neg[idx]
-            auc += self.trapezoid_area(
-                tot_neg, tot_neg_prev, tot_pos, tot_pos_prev
-            )
-            idx -= 1
+        stat_pos = np.array(self._stat_pos, dtype="float64")
+        stat_neg = np.array(self._stat_neg, dtype="float64")
+        return float(_auc_from_histograms(stat_pos, stat_neg))
 
-        return (
-            auc / tot_pos / tot_neg if tot_pos > 0.0 and tot_neg > 0.0 else 0.0
+    def state(self):
+        """
+        Returns the positive and negative histograms concatenated.
+        """
+        return np.concatenate(
+            (
+                np.array(self._stat_pos, dtype="float64"),
+                np.array(self._stat_neg, dtype="float64"),
+            )
         )
 
+    def set_state(self, state):
+        """
+        Overwrites the positive and negative histograms.
+        """
+        _num_pred_buckets = self._num_thresholds + 1
+        stat_pos = np.asarray(state[:_num_pred_buckets], dtype="float64")
+        stat_neg = np.asarray(state[_num_pred_buckets:], dtype="float64")
+        if self._accumulate_on_device:
+            self._stat_pos = paddle.to_tensor(stat_pos.astype("int64"))
+            self._stat_neg = paddle.to_tensor(stat_neg.astype("int64"))
+        else:
+            self._stat_pos = stat_pos
+            self._stat_neg = stat_neg
+
     def reset(self):
         """
         Reset states and result
         """
         _num_pred_buckets = self._num_thresholds + 1
-        self._stat_pos = np.zeros(_num_pred_buckets)
-        self._stat_neg = np.zeros(_num_pred_buckets)
+        if self._accumulate_on_device:
+            self._stat_pos = paddle.zeros([_num_pred_buckets], dtype='int64')
+            self._stat_neg = paddle.zeros([_num_pred_buckets], dtype='int64')
+        else:
+            self._stat_pos = np.zeros(_num_pred_buckets)
+            self._stat_neg = np.zeros(_num_pred_buckets)
 
     def name(self):
         """
@@ -760,6 +952,491 @@ class Auc(Metric):
         return self._name
 
 
+class ConfusionMatrix(Metric):
+    """
+    Confusion matrix for multi-class classification task. The element at
+    row i and column j of the confusion matrix is the number of instances
+    whose label is class i and prediction is class j.
+
+    The states are a compact array of shape [num_classes, num_classes],
+    which can be merged across dataloader workers and ranks by
+    :code:`merge_state` and :code:`paddle.metric.all_reduce_metrics`.
+
+    Args:
+        num_classes (int): Number of classes.
+        name (str, optional): String name of the metric instance.
+            Default is `confusion_matrix`.
+
+    Examples:
+        .. code-block:: python
+
+            >>> import numpy as np
+            >>> import paddle
+
+            >>> x = paddle.to_tensor(np.array([
+            ...     [0.1, 0.2, 0.7],
+            ...     [0.1, 0.6, 0.3],
+            ...     [0.5, 0.2, 0.3],
+            ...     [0.1, 0.8, 0.1]]))
+            >>> y = paddle.to_tensor(np.array([[2], [1], [0], [2]]))
+
+            >>> m = paddle.metric.ConfusionMatrix(num_classes=3)
+            >>> m.update(*m.compute(x, y))
+            >>> print(m.accumulate())
+            [[1 0 0]
+             [0 1 0]
+             [0 1 1]]
+    """
+
+    def __init__(self, num_classes, name='confusion_matrix', *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._num_classes = num_classes
+        self._name = name
+        self.reset()
+
+    def compute(self, pred, label, *args):
+        """
+        Compute the predicted class of each instance.
+
+        Args:
+            pred (Tensor): The predicted value is a Tensor with dtype
+                float32 or float64. Shape is [batch_size, num_classes].
+            label (Tensor): The ground truth value is Tensor with dtype
+                int64. Shape is [batch_size, 1], or [batch_size, num_classes]
+                in one hot representation.
+
+        Return:
+            tuple: Predicted class and label, both are Tensors with shape
+                [batch_size, 1].
+        """
+        pred = paddle.argmax(pred, axis=-1, keepdim=True)
+        return pred, _label_to_index(label)
+
+    def update(self, pred, label, *args):
+        """
+        Update the confusion matrix with the outputs of :code:`compute`.
+
+        Args:
+            pred (Tensor|numpy.ndarray): Predicted class with shape
+                [batch_size, 1].
+            label (Tensor|numpy.ndarray): Label with shape [batch_size, 1].
+        """
+        pred = _to_numpy_input(pred, 'pred').reshape(-1).astype("int64")
+        label = _to_numpy_input(label, 'label').reshape(-1).astype("int64")
+        num_classes = self._num_classes
+        self._confusion += np.bincount(
+            label * num_classes + pred, minlength=num_classes * num_classes
+        ).reshape(num_classes, num_classes)
+
+    def reset(self):
+        """
+        Resets all of the metric state.
+        """
+        self._confusion = np.zeros(
+            (self._num_classes, self._num_classes), dtype="int64"
+        )
+
+    def accumulate(self):
+        """
+        Returns the confusion matrix.
+
+        Return:
+            numpy.ndarray: The confusion matrix with shape
+                [num_classes, num_classes].
+        """
+        return self._confusion.copy()
+
+    def state(self):
+        """
+        Returns the flattened confusion matrix.
+        """
+        return self._confusion.reshape(-1).astype("float64")
+
+    def set_state(self, state):
+        """
+        Overwrites the confusion matrix by the flattened one.
+        """
+        self._confusion = (
+            np.asarray(state)
+            .astype("int64")
+            .reshape(self._num_classes, self._num_classes)
+        )
+
+    def name(self):
+        """
+        Returns metric name
+        """
+        return self._name
+
+
+class PrecisionRecallF1(Metric):
+    """
+    Precision, recall and F1 score for multi-class and multi-label
+    classification task, which are averaged over classes.
+
+    For multi-class task, the top-k predicted classes of each instance are
+    regarded as positive predictions, top-1 is the common case. For
+    multi-label task, classes whose predicted probability is not less than
+    :code:`threshold` are regarded as positive predictions.
+
+    The states are the per-class true positive, false positive and false
+    negative counts, which can be merged across dataloader workers and
+    ranks by :code:`merge_state` and :code:`paddle.metric.all_reduce_metrics`.
+
+    Args:
+        num_classes (int): Number of classes.
+        average (str, optional): The averaging method, 'macro' computes
+            the metrics for each class and takes the unweighted mean,
+            'micro' computes the metrics from the total counts of all
+            classes. Default is 'macro'.
+        multi_label (bool, optional): Whether it is multi-label task.
+            Default is False.
+        topk (int, optional): Number of top predicted classes regarded as
+            positive predictions in multi-class task. Default is 1.
+        threshold (float, optional): The probability threshold for positive
+            predictions in multi-label task. Default is 0.5.
+        name (str, optional): String name of the metric instance. Default
+            is None, metric names are `precision`, `recall` and `f1` with
+            :code:`average` as suffix.
+
+    Examples:
+        .. code-block:: python
+
+            >>> import numpy as np
+            >>> import paddle
+
+            >>> x = paddle.to_tensor(np.array([
+            ...     [0.1, 0.2, 0.7],
+            ...     [0.1, 0.6, 0.3],
+            ...     [0.5, 0.2, 0.3],
+            ...     [0.1, 0.8, 0.1]]))
+            >>> y = paddle.to_tensor(np.array([[2], [1], [0], [2]]))
+
+            >>> m = paddle.metric.PrecisionRecallF1(num_classes=3, average='micro')
+            >>> m.update(*m.compute(x, y))
+            >>> print(m.accumulate())
+            [0.75, 0.75, 0.75]
+    """
+
+    def __init__(
+        self,
+        num_classes,
+        average='macro',
+        multi_label=False,
+        topk=1,
+        threshold=0.5,
+        name=None,
+        *args,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        if average not in ['macro', 'micro']:
+            raise ValueError(
+                f"The 'average' must be 'macro' or 'micro', but received {average}."
+            )
+        self._num_classes = num_classes
+        self._average = average
+        self._multi_label = multi_label
+        self._topk = topk
+        self._threshold = threshold
+        self._init_name(name)
+        self.reset()
+
+    def compute(self, pred, label, *args):
+        """
+        Compute the positive predictions.
+
+        Args:
+            pred (Tensor): The predicted value is a Tensor with dtype
+                float32 or float64. Shape is [batch_size, num_classes].
+            label (Tensor): The ground truth value is Tensor. For multi-class
+                task, dtype is int64 and shape is [batch_size, 1], or
+                [batch_size, num_classes] in one hot representation. For
+                multi-label task, shape is [batch_size, num_classes], whose
+                elements are 0 or 1.
+
+        Return:
+            tuple: For multi-class task, the top-k predicted classes with
+                shape [batch_size, topk] and label with shape [batch_size, 1].
+                For multi-label task, the positive prediction mask with shape
+                [batch_size, num_classes] and label.
+        """
+        if self._multi_label:
+            return paddle.cast(pred >= self._threshold, 'int32'), label
+        _, pred = paddle.topk(pred, k=self._topk)
+        return pred, _label_to_index(label)
+
+    def update(self, pred, label, *args):
+        """
+        Update the per-class counts with the outputs of :code:`compute`.
+
+        Args:
+            pred (Tensor|numpy.ndarray): The top-k predicted classes for
+                multi-class task, or the positive prediction mask for
+                multi-label task.
+            label (Tensor|numpy.ndarray): The label.
+        """
+        pred = _to_numpy_input(pred, 'pred')
+        label = _to_numpy_input(label, 'label')
+        num_classes = self._num_classes
+
+        if self._multi_label:
+            pred = pred.reshape(-1, num_classes).astype("bool")
+            label = label.reshape(-1, num_classes).astype("bool")
+            tp = np.count_nonzero(pred & label, axis=0)
+            num_pred = np.count_nonzero(pred, axis=0)
+            num_label = np.count_nonzero(label, axis=0)
+        else:
+            pred = pred.reshape(-1, pred.shape[-1]).astype("int64")
+            label = label.reshape(-1).astype("int64")
+            hit = np.any(pred == label[:, np.newaxis], axis=-1)
+            tp = np.bincount(label[hit], minlength=num_classes)
+            num_pred = np.bincount(pred.reshape(-1), minlength=num_classes)
+            num_label = np.bincount(label, minlength=num_classes)
+
+        self._tp += tp
+        self._fp += num_pred - tp
+        self._fn += num_label - tp
+
+    def reset(self):
+        """
+        Resets all of the metric state.
+        """
+        self._tp = np.zeros(self._num_classes, dtype="int64")
+        self._fp = np.zeros(self._num_classes, dtype="int64")
+        self._fn = np.zeros(self._num_classes, dtype="int64")
+
+    def accumulate(self):
+        """
+        Computes and returns the averaged precision, recall and F1 score.
+
+        Return:
+            list: [precision, recall, f1].
+        """
+        tp, fp, fn = self._tp, self._fp, self._fn
+        if self._average == 'micro':
+            tp, fp, fn = tp.sum(), fp.sum(), fn.sum()
+
+        precision = _safe_divide(tp, tp + fp)
+        recall = _safe_divide(tp, tp + fn)
+        f1 = _safe_divide(2 * precision * recall, precision + recall)
+        return [
+            float(np.mean(precision)),
+            float(np.mean(recall)),
+            float(np.mean(f1)),
+        ]
+
+    def state(self):
+        """
+        Returns the per-class true positive, false positive and false
+        negative counts concatenated.
+        """
+        return np.concatenate((self._tp, self._fp, self._fn)).astype("float64")
+
+    def set_state(self, state):
+        """
+        Overwrites the per-class true positive, false positive and false
+        negative counts.
+        """
+        tp, fp, fn = np.split(np.asarray(state).astype("int64"), 3)
+        self._tp, self._fp, self._fn = tp, fp, fn
+
+    def _init_name(self, name):
+        if name is None:
+            self._name = [
+                f'{n}_{self._average}' for n in ['precision', 'recall', 'f1']
+            ]
+        else:
+            self._name = [f'{name}_{n}' for n in ['precision', 'recall', 'f1']]
+
+    def name(self):
+        """
+        Return name of metric instance.
+        """
+        return self._name
+
+
+class MultiLabelAuc(Metric):
+    """
+    The auc metric for multi-label classification task, the ROC AUC of each
+    class is computed as a binary classification task in the same way as
+    :code:`paddle.metric.Auc`.
+
+    The states are the per-class positive and negative histograms over
+    prediction buckets, which can be merged across dataloader workers and
+    ranks by :code:`merge_state` and :code:`paddle.metric.all_reduce_metrics`.
+
+    Args:
+        num_classes (int): Number of classes.
+        num_thresholds (int, optional): The number of thresholds to use when
+            discretizing the roc curve. Default is 4095.
+        average (str|None, optional): The averaging method, 'macro' takes the
+            unweighted mean of AUC of classes which have both positive and
+            negative instances, 'micro' computes AUC from histograms summed
+            over classes, None returns AUC of each class. Default is 'macro'.
+        name (str, optional): String name of the metric instance. Default
+            is `multi_label_auc`.
+
+    Examples:
+        .. code-block:: python
+
+            >>> import numpy as np
+            >>> import paddle
+
+            >>> m = paddle.metric.MultiLabelAuc(num_classes=4)
+
+            >>> preds = np.random.random(size=(8, 4))
+            >>> labels = np.random.randint(2, size=(8, 4))
+
+            >>> m.update(preds=preds, labels=labels)
+            >>> res = m.accumulate()
+    """
+
+    def __init__(
+        self,
+        num_classes,
+        num_thresholds=4095,
+        average='macro',
+        name='multi_label_auc',
+        *args,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        if average not in ['macro', 'micro', None]:
+            raise ValueError(
+                f"The 'average' must be 'macro', 'micro' or None, but received {average}."
+            )
+        self._num_classes = num_classes
+        self._num_thresholds = num_thresholds
+        self._average = average
+        self._name = name
+        self.reset()
+
+    def update(self, preds, labels):
+        """
+        Update the per-class histograms with the given predictions and labels.
+
+        Args:
+            preds (Tensor|numpy.ndarray): The predicted probabilities with
+                shape [batch_size, num_classes].
+            labels (Tensor|numpy.ndarray): The labels with shape
+                [batch_size, num_classes], whose elements are 0 or 1.
+        """
+        preds = _to_numpy_input(preds, 'preds')
+        labels = _to_numpy_input(labels, 'labels')
+        num_classes = self._num_classes
+        _num_pred_buckets = self._num_thresholds + 1
+
+        preds = preds.reshape(-1, num_classes)
+        pos = labels.reshape(-1, num_classes).astype("bool")
+        bin_idx = (preds * self._num_thresholds).astype("int64")
+        assert bin_idx.size == 0 or bin_idx.max() <= self._num_thresholds
+        bin_idx += np.arange(num_classes) * _num_pred_buckets
+
+        minlength = num_classes * _num_pred_buckets
+        self._stat_pos += np.bincount(
+            bin_idx[pos], minlength=minlength
+        ).reshape(num_classes, _num_pred_buckets)
+        self._stat_neg += np.bincount(
+            bin_idx[~pos], minlength=minlength
+        ).reshape(num_classes, _num_pred_buckets)
+
+    def accumulate(self):
+        """
+        Return the area (a float score) under auc curve
+
+        Return:
+            float|list: The averaged AUC, or AUC of each class if
+                :code:`average` is None.
+        """
+        if self._average == 'micro':
+            return float(
+                _auc_from_histograms(
+                    self._stat_pos.sum(axis=0), self._stat_neg.sum(axis=0)
+                )
+            )
+
+        auc = _auc_from_histograms(self._stat_pos, self._stat_neg)
+        if self._average is None:
+            return auc.tolist()
+        valid = np.logical_and(
+            self._stat_pos.sum(axis=-1) > 0, self._stat_neg.sum(axis=-1) > 0
+        )
+        return float(auc[valid].mean()) if valid.any() else 0.0
+
+    def reset(self):
+        """
+        Reset states and result
+        """
+        shape = (self._num_classes, self._num_thresholds + 1)
+        self._stat_pos = np.zeros(shape)
+        self._stat_neg = np.zeros(shape)
+
+    def state(self):
+        """
+        Returns the per-class positive and negative histograms concatenated.
+        """
+        return np.concatenate(
+            (self._stat_pos.reshape(-1), self._stat_neg.reshape(-1))
+        )
+
+    def set_state(self, state):
+        """
+        Overwrites the per-class positive and negative histograms.
+        """
+        shape = (self._num_classes, self._num_thresholds + 1)
+        stat_pos, stat_neg = np.split(np.asarray(state, dtype="float64"), 2)
+        self._stat_pos = stat_pos.reshape(shape)
+        self._stat_neg = stat_neg.reshape(shape)
+
+    def name(self):
+        """
+        Returns metric name
+        """
+        return self._name
+
+
+def all_reduce_metrics(metrics, group=None):
+    """
+    Sums up the states of metrics over all ranks in :code:`group`, so that
+    :code:`accumulate` of each metric returns the result over data of all
+    ranks. States of all metrics are concatenated and reduced by only one
+    all-reduce, which is much cheaper than gathering predictions and labels
+    of all ranks.
+
+    Args:
+        metrics (Metric|list[Metric]): Metrics whose :code:`state` and
+            :code:`set_state` are implemented.
+        group (Group, optional): The communication group. Default is None,
+            which means the global group.
+
+    Examples:
+        .. code-block:: python
+
+            >>> # doctest: +REQUIRES(env: DISTRIBUTED)
+            >>> import numpy as np
+            >>> import paddle
+            >>> import paddle.distributed as dist
+
+            >>> dist.init_parallel_env()
+            >>> m = paddle.metric.Precision()
+            >>> m.update(np.random.random(size=(8, 1)), np.random.randint(2, size=(8, 1)))
+            >>> paddle.metric.all_reduce_metrics(m)
+            >>> res = m.accumulate()
+    """
+    if isinstance(metrics, Metric):
+        metrics = [metrics]
+    if len(metrics) == 0 or paddle.distributed.get_world_size(group) <= 1:
+        return
+
+    states = [m.state() for m in metrics]
+    sections = np.cumsum([len(st) for st in states])[:-1]
+    buffer = paddle.to_tensor(np.concatenate(states).astype("float64"))
+    paddle.distributed.all_reduce(buffer, group=group)
+    for m, st in zip(metrics, np.split(buffer.numpy(), sections)):
+        m.set_state(st)
+
+
 def accuracy(input, label, k=1, correct=None, total=None, name=None):
     """
     accuracy layer.
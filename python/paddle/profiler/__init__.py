@@ -22,7 +22,9 @@ from .profiler import (
     export_protobuf,
     make_scheduler,
 )
-from .profiler_statistic import SortedKeys
+from .profiler_diff import compare_profiler_results
+from .profiler_statistic import SortedKeys, StreamingSummary
+from .timer import StepSampler
 from .utils import RecordEvent, load_profiler_result
 
 __all__ = [
@@ -35,5 +37,8 @@ __all__ = [
     'RecordEvent',
     'load_profiler_result',
     'SortedKeys',
+    'StreamingSummary',
+    'StepSampler',
+    'compare_profiler_results',
     'SummaryView',
 ]
@@ -39,7 +39,7 @@ from .profiler_statistic import (
     _build_table,
     gen_layer_flops,
 )
-from .timer import benchmark
+from .timer import StepSampler, benchmark
 from .utils import RecordEvent, wrap_optimizers
 
 
@@ -360,6 +360,8 @@ class Profiler:
         profile_memory (bool, optional): If it is True, collect tensor memory allocation and release information. Default: False.
         custom_device_types (list, optional): If targets contain profiler.ProfilerTarget.CUSTOM_DEVICE, custom_device_types select the custom device type for profiling. The default value represents all custom devices will be selected.
         with_flops (bool, optional): If it is True, the flops of the op will be calculated. Default: False.
+        step_sampler (StepSampler, optional): If it is set, the steps are sampled by the :ref:`StepSampler <api_paddle_profiler_StepSampler>` to report percentiles
+            of step costs with low overhead, usually together with ``timer_only`` for always-on monitoring. Default: None.
 
     Examples:
         1. profiling range [2, 5).
@@ -485,6 +487,7 @@ class Profiler:
         emit_nvtx: Optional[bool] = False,
         custom_device_types: Optional[list] = [],
         with_flops: Optional[bool] = False,
+        step_sampler: Optional[StepSampler] = None,
     ):
         supported_targets = _get_supported_targets()
         if targets:
@@ -547,6 +550,7 @@ class Profiler:
         self.profile_memory = profile_memory
         self.with_flops = with_flops
         self.emit_nvtx = emit_nvtx
+        self.step_sampler = step_sampler
 
     def __enter__(self):
         self.start()
@@ -580,6 +584,8 @@ class Profiler:
 
         '''
         # Timing only without profiling.
+        if self.step_sampler is not None:
+            benchmark().register_hook('step_sampler', self.step_sampler)
         benchmark().begin()
         if not self.timer_only or self.emit_nvtx:
             utils._is_profiler_used = True
@@ -628,6 +634,8 @@ class Profiler:
                 ... prof.stop()
         '''
         benchmark().end()
+        if self.step_sampler is not None:
+            benchmark().remove_hook('step_sampler')
         if self.timer_only:
             return
         if self.record_shapes or self.with_flops:
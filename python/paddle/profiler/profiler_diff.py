@@ -0,0 +1,415 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import json
+import sys
+
+from paddle.base.core import TracerEventType
+
+from .profiler_statistic import EventSummary, StatisticData, wrap_tree
+
+__all__ = []
+
+_TIME_METRICS = ('cpu_time', 'gpu_time')
+
+
+class DiffItem:
+    r"""
+    Difference of an operator, kernel, layer or memory event between the base
+    and the target profiles. Metrics are per step if the profiles are
+    normalized by steps, a missing side is regarded as zeros.
+    """
+
+    def __init__(self, category, name, base, target):
+        self.category = category
+        self.name = name
+        self.in_base = base is not None
+        self.in_target = target is not None
+        self.base = base or dict.fromkeys((target or {}).keys(), 0)
+        self.target = target or dict.fromkeys(self.base.keys(), 0)
+        self.deltas = {
+            metric: self.target[metric] - self.base[metric]
+            for metric in self.base
+        }
+        self.significant = {}
+        self.status = 'unchanged'
+
+    def ratio(self, metric):
+        r"""
+        Returns the relative change of metric, or inf if it is 0 in base.
+        """
+        if self.base[metric] == 0:
+            return 0.0 if self.deltas[metric] == 0 else float('inf')
+        return self.deltas[metric] / self.base[metric]
+
+    def _judge(self, rel_threshold, min_time_delta, min_memory_delta):
+        for metric, delta in self.deltas.items():
+            if metric == 'call':
+                continue
+            min_delta = (
+                min_time_delta if metric in _TIME_METRICS else min_memory_delta
+            )
+            if abs(delta) >= min_delta and abs(delta) >= rel_threshold * abs(
+                self.base[metric]
+            ):
+                self.significant[metric] = delta
+        if any(delta > 0 for delta in self.significant.values()):
+            self.status = 'regression'
+        elif self.significant:
+            self.status = 'improvement'
+        elif 'call' in self.deltas and abs(
+            self.deltas['call']
+        ) > rel_threshold * max(self.base['call'], 1):
+            self.status = 'changed'
+
+    def to_dict(self):
+        return {
+            'category': self.category,
+            'name': self.name,
+            'status': self.status,
+            'in_base': self.in_base,
+            'in_target': self.in_target,
+            'base': self.base,
+            'target': self.target,
+            'deltas': self.deltas,
+            'significant': sorted(self.significant),
+        }
+
+
+class ProfilerDiff:
+    r"""
+    Result of :ref:`compare_profiler_results <api_paddle_profiler_compare_profiler_results>`,
+    which holds the ``DiffItem`` of every aligned entry.
+    """
+
+    def __init__(self, items, base_steps, target_steps):
+        self.items = items
+        self.base_steps = base_steps
+        self.target_steps = target_steps
+
+    def _filter(self, status):
+        return [item for item in self.items if item.status == status]
+
+    def regressions(self):
+        r"""
+        Returns the items significantly slower or using more memory in target.
+        """
+        return self._filter('regression')
+
+    def improvements(self):
+        r"""
+        Returns the items significantly faster or using less memory in target.
+        """
+        return self._filter('improvement')
+
+    @property
+    def has_regression(self):
+        return any(item.status == 'regression' for item in self.items)
+
+    def to_dict(self):
+        return {
+            'base_steps': self.base_steps,
+            'target_steps': self.target_steps,
+            'items': [item.to_dict() for item in self.items],
+        }
+
+    def table(self, row_limit=20, time_unit='ms', show_unchanged=False):
+        r"""
+        Returns the text tables of differences for every category, ranked by
+        the largest absolute change of time or memory.
+
+        Args:
+            row_limit(int, optional): Max number of rows of every table. Default: 20.
+            time_unit(str, optional): Unit of time, can be 's', 'ms', 'us' or 'ns'. Default: 'ms'.
+            show_unchanged(bool, optional): Whether to list items without significant changes.
+                Default: False.
+        """
+        scale = {'s': 1e9, 'ms': 1e6, 'us': 1e3, 'ns': 1}[time_unit]
+        result = [
+            f'Base steps: {self.base_steps}, target steps: {self.target_steps}, '
+            f'time unit: {time_unit}, memory unit: MB'
+        ]
+
+        def format_value(metric, value):
+            if metric in _TIME_METRICS:
+                return f'{value / scale:.3f}'
+            if metric == 'call':
+                return f'{value:.2f}'
+            return f'{value / 1024 / 1024:.3f}'
+
+        def format_ratio(ratio):
+            if ratio == float('inf'):
+                return 'new'
+            return f'{ratio * 100:+.2f}%'
+
+        categories = []
+        for item in self.items:
+            if item.category not in categories:
+                categories.append(item.category)
+        for category in categories:
+            items = [
+                item
+                for item in self.items
+                if item.category == category
+                and (show_unchanged or item.status != 'unchanged')
+            ]
+            if not items:
+                continue
+            metrics = [m for m in items[0].deltas if m != 'call']
+            items.sort(
+                key=lambda item: max(abs(item.deltas[m]) for m in metrics),
+                reverse=True,
+            )
+            headers = ['Name', 'Status']
+            if 'call' in items[0].deltas:
+                headers.append('Calls')
+            for metric in metrics:
+                headers.extend([metric, 'Delta', 'Ratio'])
+            row_format = '{:<48}  {:<12}' + '  {:>14}' * (len(headers) - 2)
+            header = row_format.format(*headers)
+            result.append('')
+            result.append(f"{category.replace('_', ' ').title()} Diff")
+            result.append('-' * len(header))
+            result.append(header)
+            result.append('-' * len(header))
+            for item in items[:row_limit]:
+                name = item.name
+                if len(name) > 48:
+                    name = '...' + name[-45:]
+                row = [name, item.status]
+                if 'call' in item.deltas:
+                    row.append(
+                        f"{format_value('call', item.base['call'])}->"
+                        f"{format_value('call', item.target['call'])}"
+                    )
+                for metric in metrics:
+                    row.extend(
+                        [
+                            format_value(metric, item.target[metric]),
+                            format_value(metric, item.deltas[metric]),
+                            format_ratio(item.ratio(metric)),
+                        ]
+                    )
+                result.append(row_format.format(*row))
+        return '\n'.join(result)
+
+
+def _load_statistic_data(profile):
+    if isinstance(profile, StatisticData):
+        return profile
+    if isinstance(profile, str):
+        from .utils import load_profiler_result
+
+        profile = load_profiler_result(profile)
+    return StatisticData(profile.get_data(), profile.get_extra_info())
+
+
+def _collect_call_path_items(node_trees):
+    r"""
+    Aggregate layers, and operators and kernels within layers, by their call
+    paths made of the names of enclosing layers.
+    """
+    node_statistic_trees, _ = wrap_tree(node_trees)
+    items = {'layer': {}, 'operator': {}, 'kernel': {}}
+
+    def add(category, key, node, item_class):
+        if key not in items[category]:
+            items[category][key] = item_class(key)
+        items[category][key].add_item(node)
+
+    for root_statistic_node in node_statistic_trees.values():
+        stack = [(child, '') for child in root_statistic_node.children_node]
+        while stack:
+            node, path = stack.pop()
+            if node.type == TracerEventType.Forward:
+                path = f'{path}/{node.name}'
+                add('layer', path, node, EventSummary.GeneralItem)
+            elif node.type == TracerEventType.Operator:
+                op_path = f'{path}/{node.name}'
+                add('operator', op_path, node, EventSummary.GeneralItem)
+                for runtimenode in node.runtime_node:
+                    for devicenode in runtimenode.device_node:
+                        if devicenode.type == TracerEventType.Kernel:
+                            add(
+                                'kernel',
+                                f'{op_path}/{devicenode.name}',
+                                devicenode,
+                                EventSummary.DeviceItem,
+                            )
+            for child in node.children_node:
+                stack.append((child, path))
+    return items
+
+
+def _time_metrics(item, num_steps):
+    return {
+        'call': item.call / num_steps,
+        'cpu_time': item.cpu_time / num_steps,
+        'gpu_time': item.gpu_time / num_steps,
+    }
+
+
+def _collect_metrics(statistic_data, by_call_path, normalize_by_steps):
+    num_steps = statistic_data.time_range_summary.call_times[
+        TracerEventType.ProfileStep
+    ]
+    divisor = max(num_steps, 1) if normalize_by_steps else 1
+    event_summary = statistic_data.event_summary
+    categories = {
+        'model': event_summary.model_perspective_items,
+        'userdefined': event_summary.userdefined_items,
+    }
+    if by_call_path:
+        categories.update(_collect_call_path_items(statistic_data.node_trees))
+    else:
+        categories['operator'] = event_summary.items
+        categories['kernel'] = event_summary.kernel_items
+
+    metrics = {
+        category: {
+            name: _time_metrics(item, divisor) for name, item in items.items()
+        }
+        for category, items in categories.items()
+    }
+
+    memory_summary = statistic_data.memory_summary
+    metrics['memory'] = {
+        f'{place}/{name}': {
+            'allocation_size': item.allocation_size / divisor,
+            'increase_size': item.increase_size / divisor,
+        }
+        for place, items in memory_summary.allocated_items.items()
+        for name, item in items.items()
+    }
+    metrics['peak_memory'] = {
+        place: {
+            'peak_allocated': peak,
+            'peak_reserved': memory_summary.peak_reserved_values[place],
+        }
+        for place, peak in memory_summary.peak_allocation_values.items()
+    }
+    return metrics, num_steps
+
+
+def compare_profiler_results(
+    base,
+    target,
+    by_call_path=False,
+    normalize_by_steps=True,
+    rel_threshold=0.05,
+    min_time_delta=10000,
+    min_memory_delta=1024 * 1024,
+):
+    r"""
+    Compare two profiling results, e.g. before and after upgrading Paddle or
+    changing a model, to find out performance regressions. Operators, kernels,
+    model perspectives (Forward, Backward, ...), user defined events and
+    memory events are aligned by name, and the differences of their calls,
+    CPU time, GPU time and memory are reported.
+
+    A change of a metric is significant if its absolute value is at least
+    ``rel_threshold`` of the base value, and at least ``min_time_delta`` for
+    time or ``min_memory_delta`` for memory, which filters out the noise of
+    small events. An item whose significant changes include an increase is a
+    regression, otherwise it is an improvement.
+
+    Args:
+        base(str|ProfilerResult|StatisticData): The base profile, a str is regarded as the
+            path of a file saved by :ref:`export_protobuf <api_paddle_profiler_export_protobuf>`.
+        target(str|ProfilerResult|StatisticData): The profile to compare with base.
+        by_call_path(bool, optional): If True, operators and kernels are aligned by their call paths
+            made of the names of enclosing layers besides their names, and the layers are compared
+            as well. Default: False.
+        normalize_by_steps(bool, optional): If True, calls, time and allocated memory are divided by
+            the number of profiled steps, so that profiles of different steps can be compared.
+            Default: True.
+        rel_threshold(float, optional): The minimum relative change to be significant. Default: 0.05.
+        min_time_delta(int, optional): The minimum change of time in ns to be significant. Default: 10000.
+        min_memory_delta(int, optional): The minimum change of memory in bytes to be significant.
+            Default: 1MB.
+
+    Returns:
+        ProfilerDiff: The differences, whose ``regressions()`` lists the regressions and ``table()``
+        formats the differences.
+
+    Examples:
+        .. code-block:: python
+
+            >>> # doctest: +SKIP('profiles are needed')
+            >>> import paddle.profiler as profiler
+            >>> diff = profiler.compare_profiler_results(
+            ...     'base.paddle_trace.pb', 'target.paddle_trace.pb'
+            ... )
+            >>> print(diff.table(time_unit='us'))
+            >>> for item in diff.regressions():
+            ...     print(item.category, item.name, item.significant)
+    """
+    base_metrics, base_steps = _collect_metrics(
+        _load_statistic_data(base), by_call_path, normalize_by_steps
+    )
+    target_metrics, target_steps = _collect_metrics(
+        _load_statistic_data(target), by_call_path, normalize_by_steps
+    )
+    items = []
+    for category, base_items in base_metrics.items():
+        target_items = target_metrics[category]
+        for name in list(base_items) + [
+            name for name in target_items if name not in base_items
+        ]:
+            item = DiffItem(
+                category, name, base_items.get(name), target_items.get(name)
+            )
+            item._judge(rel_threshold, min_time_delta, min_memory_delta)
+            items.append(item)
+    return ProfilerDiff(items, base_steps, target_steps)
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(
+        description='Compare two profiles saved by paddle.profiler.export_protobuf, '
+        'exit with 1 if there are regressions.'
+    )
+    parser.add_argument('base', help='the base profile')
+    parser.add_argument('target', help='the profile to compare with base')
+    parser.add_argument('--by_call_path', action='store_true')
+    parser.add_argument('--rel_threshold', type=float, default=0.05)
+    parser.add_argument(
+        '--min_time_delta', type=float, default=10.0, help='in us'
+    )
+    parser.add_argument(
+        '--min_memory_delta', type=float, default=1.0, help='in MB'
+    )
+    parser.add_argument('--time_unit', default='ms')
+    parser.add_argument('--row_limit', type=int, default=20)
+    parser.add_argument('--json', help='save the differences as json')
+    args = parser.parse_args(args)
+
+    diff = compare_profiler_results(
+        args.base,
+        args.target,
+        by_call_path=args.by_call_path,
+        rel_threshold=args.rel_threshold,
+        min_time_delta=args.min_time_delta * 1e3,
+        min_memory_delta=args.min_memory_delta * 1024 * 1024,
+    )
+    print(diff.table(row_limit=args.row_limit, time_unit=args.time_unit))
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(diff.to_dict(), f)
+    return 1 if diff.has_regression else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
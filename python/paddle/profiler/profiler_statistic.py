@@ -19,6 +19,7 @@ from paddle.base.core import TracerEventType, TracerMemEventType
 from paddle.utils.flops import flops
 
 from .statistic_helper import (
+    Histogram,
     intersection_ranges,
     merge_ranges,
     merge_self_ranges,
@@ -154,6 +155,13 @@ class HostStatisticNode:
         return getattr(self.hostnode, name)
 
 
+def _is_communication_node(hostnode):
+    return hostnode.type == TracerEventType.Communication or (
+        hostnode.type == TracerEventType.Operator
+        and any(name in hostnode.name.lower() for name in _CommunicationOpName)
+    )
+
+
 def traverse_tree(nodetrees):
     results = collections.defaultdict(list)
     for thread_id, rootnode in nodetrees.items():
@@ -870,6 +878,432 @@ class StatisticData:
         self.memory_summary.parse(node_trees)
 
 
+class StreamingSummary:
+    r"""
+    Aggregate profiling results window by window, e.g. every cycle of the
+    profiler scheduler, and keep only bounded summary state, which is useful
+    for long captures whose node trees do not fit into memory, or for
+    printing summaries while training continues.
+
+    Unlike ``StatisticData``, which wraps the whole node trees and walks
+    them once for every kind of summary, every window is consumed in a single
+    traversal and can be released afterwards. Time of events is accumulated
+    into log-scaled histograms of fixed size, so that percentiles of every
+    operator, kernel and model perspective are reported besides the total,
+    average, min and max time.
+
+    An instance can be used as ``on_trace_ready`` of :ref:`Profiler <api_paddle_profiler_Profiler>` directly.
+
+    Args:
+        on_summary(Callable, optional): Called with this object after every window is added.
+            Default: None.
+        max_items(int, optional): Maximum number of distinct names kept for each kind of items,
+            events with names beyond are aggregated to the item named ``Others``. Default: 10000.
+
+    Examples:
+        .. code-block:: python
+
+            >>> import paddle
+            >>> import paddle.profiler as profiler
+
+            >>> summary = profiler.StreamingSummary()
+            >>> with profiler.Profiler(
+            ...     targets=[profiler.ProfilerTarget.CPU],
+            ...     scheduler=profiler.make_scheduler(closed=1, ready=1, record=2, repeat=2),
+            ...     on_trace_ready=summary,
+            ... ) as p:
+            ...     for iter in range(8):
+            ...         x = paddle.randn([32, 32])
+            ...         y = paddle.matmul(x, x)
+            ...         p.step()
+            >>> operators = summary.get_summary()['operator']
+            >>> # doctest: +SKIP('the time varies')
+            >>> print(summary.table(row_limit=5))
+    """
+
+    class Item:
+        def __init__(self, name):
+            self.name = name
+            self.call = 0
+            self.cpu_time = Histogram()
+            self.gpu_time = Histogram()
+
+        def add(self, cpu_time=None, gpu_time=None):
+            self.call += 1
+            if cpu_time is not None:
+                self.cpu_time.add(cpu_time)
+            if gpu_time is not None:
+                self.gpu_time.add(gpu_time)
+
+        def to_dict(self):
+            result = {'name': self.name, 'call': self.call}
+            for prefix, hist in (
+                ('cpu', self.cpu_time),
+                ('gpu', self.gpu_time),
+            ):
+                if hist.count == 0:
+                    continue
+                result[f'{prefix}_total'] = hist.total
+                result[f'{prefix}_avg'] = hist.avg
+                result[f'{prefix}_min'] = hist.min
+                result[f'{prefix}_max'] = hist.max
+                for q in (50, 95, 99):
+                    result[f'{prefix}_p{q}'] = hist.percentile(q)
+            return result
+
+    _model_perspective_names = {
+        TracerEventType.Forward: 'Forward',
+        TracerEventType.Backward: 'Backward',
+        TracerEventType.Optimization: 'Optimization',
+        TracerEventType.Dataloader: 'Dataloader',
+    }
+
+    def __init__(self, on_summary=None, max_items=10000):
+        self.on_summary = on_summary
+        self.max_items = max_items
+        self.reset()
+
+    def reset(self):
+        r"""
+        Drop all aggregated results.
+        """
+        self.num_windows = 0
+        self.num_steps = 0
+        self.cpu_range_sum = collections.defaultdict(int)
+        self.gpu_range_sum = collections.defaultdict(
+            lambda: collections.defaultdict(int)
+        )
+        self.call_times = collections.defaultdict(int)
+        self.communication_time = 0
+        self.computation_time = 0
+        self.overlap_time = 0
+        self.operator_items = {}
+        self.kernel_items = {}
+        self.model_perspective_items = {}
+        self.userdefined_items = {}
+        self.memory_manipulation_items = {}
+        self.memory_summary = MemorySummary()
+
+    def __call__(self, prof):
+        if prof.profiler_result:
+            self.add(prof.profiler_result.get_data())
+
+    def _get_item(self, items, name):
+        if name not in items:
+            if len(items) >= self.max_items:
+                name = 'Others'
+            if name not in items:
+                items[name] = StreamingSummary.Item(name)
+        return items[name]
+
+    def add(self, nodetrees):
+        r"""
+        Aggregate node trees of a window, which map thread ids to root nodes
+        like ``ProfilerResult.get_data()``. Time ranges are merged within the
+        window, so windows are expected not to overlap in time.
+        """
+        window = {
+            'cpu': collections.defaultdict(list),
+            'gpu': collections.defaultdict(list),
+            'communication': [],
+            'computation': [],
+        }
+        for rootnode in nodetrees.values():
+            self._add_thread(rootnode, window)
+
+        for event_type, time_ranges in window['cpu'].items():
+            self.cpu_range_sum[event_type] += sum_ranges(
+                merge_self_ranges(time_ranges, is_sorted=False)
+            )
+        for (device_id, event_type), time_ranges in window['gpu'].items():
+            self.gpu_range_sum[device_id][event_type] += sum_ranges(
+                merge_self_ranges(time_ranges, is_sorted=False)
+            )
+        communication_range = merge_self_ranges(
+            window['communication'], is_sorted=False
+        )
+        computation_range = merge_self_ranges(
+            window['computation'], is_sorted=False
+        )
+        self.communication_time += sum_ranges(communication_range)
+        self.computation_time += sum_ranges(computation_range)
+        self.overlap_time += sum_ranges(
+            intersection_ranges(
+                communication_range, computation_range, is_sorted=True
+            )
+        )
+        self.num_windows += 1
+        if self.on_summary:
+            self.on_summary(self)
+
+    def _add_thread(self, rootnode, window):
+        # post-order traversal, children are done before their parent so that
+        # device time is accumulated upwards without wrapping the nodes. frame
+        # is [node, index of next child, gpu time, under communication,
+        # under model perspective]
+        stack = [[rootnode, 0, 0, False, False]]
+        while stack:
+            frame = stack[-1]
+            node, index = frame[0], frame[1]
+            if index < len(node.children_node):
+                frame[1] += 1
+                child = node.children_node[index]
+                stack.append(
+                    [
+                        child,
+                        0,
+                        0,
+                        frame[3] or _is_communication_node(child),
+                        frame[4] or child.type in self._model_perspective_names,
+                    ]
+                )
+                continue
+            stack.pop()
+            if not stack:  # skip root node
+                break
+            parent_frame = stack[-1]
+            gpu_time = frame[2] + self._add_device_time(node, frame[3], window)
+            parent_frame[2] += gpu_time
+            self._add_host_node(
+                node, parent_frame[0], gpu_time, parent_frame[4], window
+            )
+
+    def _add_device_time(self, hostnode, under_communication, window):
+        gpu_time = 0
+        for runtimenode in hostnode.runtime_node:
+            window['cpu'][runtimenode.type].append(
+                (runtimenode.start_ns, runtimenode.end_ns)
+            )
+            self.call_times[runtimenode.type] += 1
+            for devicenode in runtimenode.device_node:
+                time_range = (devicenode.start_ns, devicenode.end_ns)
+                window['gpu'][(devicenode.device_id, devicenode.type)].append(
+                    time_range
+                )
+                self.call_times[devicenode.type] += 1
+                if devicenode.type != TracerEventType.Kernel:
+                    continue
+                duration = devicenode.end_ns - devicenode.start_ns
+                gpu_time += duration
+                self._get_item(self.kernel_items, devicenode.name).add(
+                    gpu_time=duration
+                )
+                kernel_name = devicenode.name.lower()
+                if (
+                    under_communication
+                    or 'nccl' in kernel_name
+                    or 'xccl' in kernel_name
+                ):
+                    window['communication'].append(time_range)
+                else:
+                    window['computation'].append(time_range)
+        return gpu_time
+
+    def _add_host_node(
+        self, hostnode, parent, gpu_time, under_model_perspective, window
+    ):
+        cpu_time = hostnode.end_ns - hostnode.start_ns
+        window['cpu'][hostnode.type].append(
+            (hostnode.start_ns, hostnode.end_ns)
+        )
+        self.call_times[hostnode.type] += 1
+        if _is_communication_node(hostnode):
+            window['communication'].append((hostnode.start_ns, hostnode.end_ns))
+
+        if hostnode.type == TracerEventType.Operator:
+            self._get_item(self.operator_items, hostnode.name).add(
+                cpu_time, gpu_time
+            )
+        elif hostnode.type in (
+            TracerEventType.UserDefined,
+            TracerEventType.PythonUserDefined,
+        ):
+            name = hostnode.name.lower()
+            if 'memcpy' in name or 'memorycopy' in name or 'memset' in name:
+                self._get_item(
+                    self.memory_manipulation_items, hostnode.name
+                ).add(cpu_time, gpu_time)
+            elif hostnode.type == TracerEventType.PythonUserDefined:
+                self._get_item(self.userdefined_items, hostnode.name).add(
+                    cpu_time, gpu_time
+                )
+        elif hostnode.type == TracerEventType.ProfileStep:
+            self.num_steps += 1
+            self._get_item(self.model_perspective_items, 'ProfileStep').add(
+                cpu_time, gpu_time
+            )
+        elif (
+            hostnode.type in self._model_perspective_names
+            and not under_model_perspective
+        ):
+            # only the outermost model perspective node is counted
+            self._get_item(
+                self.model_perspective_items,
+                self._model_perspective_names[hostnode.type],
+            ).add(cpu_time, gpu_time)
+
+        if hostnode.type != TracerEventType.OperatorInner:
+            self.memory_summary._analyse_node_memory(hostnode.name, hostnode)
+        if parent.type == TracerEventType.Operator:
+            self.memory_summary._analyse_node_memory(parent.name, hostnode)
+
+    def get_summary(self):
+        r"""
+        Returns the aggregated results so far as a dict of python objects,
+        time is in ns.
+        """
+
+        def items_to_dict(items):
+            return {name: item.to_dict() for name, item in items.items()}
+
+        memory = {}
+        for place in set(self.memory_summary.allocated_items) | set(
+            self.memory_summary.reserved_items
+        ):
+            events = collections.defaultdict(dict)
+            for memory_type, items in (
+                ('allocated', self.memory_summary.allocated_items[place]),
+                ('reserved', self.memory_summary.reserved_items[place]),
+            ):
+                for name, item in items.items():
+                    events[name][memory_type] = {
+                        'allocation_count': item.allocation_count,
+                        'free_count': item.free_count,
+                        'allocation_size': item.allocation_size,
+                        'free_size': item.free_size,
+                        'increase_size': item.increase_size,
+                    }
+            memory[place] = {
+                'peak_allocated': self.memory_summary.peak_allocation_values[
+                    place
+                ],
+                'peak_reserved': self.memory_summary.peak_reserved_values[
+                    place
+                ],
+                'events': dict(events),
+            }
+
+        return {
+            'num_windows': self.num_windows,
+            'num_steps': self.num_steps,
+            'cpu_time_range': {
+                event_type.name: value
+                for event_type, value in self.cpu_range_sum.items()
+            },
+            'gpu_time_range': {
+                device_id: {
+                    event_type.name: value
+                    for event_type, value in device_range_sum.items()
+                }
+                for device_id, device_range_sum in self.gpu_range_sum.items()
+            },
+            'call_times': {
+                event_type.name: value
+                for event_type, value in self.call_times.items()
+            },
+            'distributed': {
+                'communication': self.communication_time,
+                'computation': self.computation_time,
+                'overlap': self.overlap_time,
+            },
+            'model_perspective': items_to_dict(self.model_perspective_items),
+            'operator': items_to_dict(self.operator_items),
+            'kernel': items_to_dict(self.kernel_items),
+            'userdefined': items_to_dict(self.userdefined_items),
+            'memory_manipulation': items_to_dict(
+                self.memory_manipulation_items
+            ),
+            'memory': memory,
+        }
+
+    def table(
+        self, sorted_by=SortedKeys.CPUTotal, row_limit=100, time_unit='ms'
+    ):
+        r"""
+        Returns the summary tables of model perspective, operators and
+        kernels aggregated so far, with percentiles of time.
+
+        Args:
+            sorted_by(SortedKeys, optional): How to rank operators, kernels are always ranked by
+                the corresponding GPU key. Default: SortedKeys.CPUTotal.
+            row_limit(int, optional): Max number of rows of every table. Default: 100.
+            time_unit(str, optional): Unit of time, can be 's', 'ms', 'us' or 'ns'. Default: 'ms'.
+        """
+        scale = {'s': 1e9, 'ms': 1e6, 'us': 1e3, 'ns': 1}[time_unit]
+        sort_keys = {
+            SortedKeys.CPUTotal: ('cpu_time', 'total'),
+            SortedKeys.CPUAvg: ('cpu_time', 'avg'),
+            SortedKeys.CPUMax: ('cpu_time', 'max'),
+            SortedKeys.CPUMin: ('cpu_time', 'min'),
+            SortedKeys.GPUTotal: ('gpu_time', 'total'),
+            SortedKeys.GPUAvg: ('gpu_time', 'avg'),
+            SortedKeys.GPUMax: ('gpu_time', 'max'),
+            SortedKeys.GPUMin: ('gpu_time', 'min'),
+        }
+        headers = ['Name', 'Calls', 'Total', 'Avg', 'P50', 'P95', 'P99', 'Max']
+        row_format = '{:<48}' + '  {:>12}' * (len(headers) - 1)
+
+        def format_time(time):
+            if time == float('inf'):
+                return '-'
+            return f'{time / scale:.2f}'
+
+        result = [
+            f'Steps: {self.num_steps}, windows: {self.num_windows}, '
+            f'time unit: {time_unit}'
+        ]
+
+        def append_table(title, items, hist_name, attr):
+            if not items:
+                return
+            items = sorted(
+                items.values(),
+                key=lambda item: getattr(getattr(item, hist_name), attr),
+                reverse=attr != 'min',
+            )[:row_limit]
+            header = row_format.format(*headers)
+            result.append(title)
+            result.append('-' * len(header))
+            result.append(header)
+            result.append('-' * len(header))
+            for item in items:
+                hist = getattr(item, hist_name)
+                name = item.name
+                if len(name) > 48:
+                    name = name[:45] + '...'
+                result.append(
+                    row_format.format(
+                        name,
+                        item.call,
+                        format_time(hist.total),
+                        format_time(hist.avg),
+                        format_time(hist.percentile(50)),
+                        format_time(hist.percentile(95)),
+                        format_time(hist.percentile(99)),
+                        format_time(hist.max),
+                    )
+                )
+            result.append('')
+
+        hist_name, attr = sort_keys[sorted_by]
+        append_table(
+            'Model Summary (CPU)',
+            self.model_perspective_items,
+            'cpu_time',
+            'total',
+        )
+        append_table(
+            f'Operator Summary ({hist_name[:3].upper()})',
+            self.operator_items,
+            hist_name,
+            attr,
+        )
+        append_table(
+            'Kernel Summary (GPU)', self.kernel_items, 'gpu_time', attr
+        )
+        return '\n'.join(result)
+
+
 def _build_table(
     statistic_data,
     sorted_by=SortedKeys.CPUTotal,
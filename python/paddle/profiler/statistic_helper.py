@@ -12,6 +12,94 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import math
+
+
+class Histogram:
+    r"""
+    Histogram of non-negative values, e.g. durations in ns, kept in log-scaled
+    buckets. Every power of two is divided into ``sub_buckets`` buckets, so the
+    relative error of percentiles is at most ``1 / sub_buckets``, and the
+    number of buckets never exceeds ``sub_buckets * (max_exponent + 1) + 1``
+    however many values are added. Only non-empty buckets are stored.
+    """
+
+    def __init__(self, sub_buckets=8, max_exponent=48):
+        self.sub_buckets = sub_buckets
+        self.max_index = sub_buckets * (max_exponent + 1)
+        self.buckets = {}
+        self.count = 0
+        self.total = 0
+        self.min = float('inf')
+        self.max = 0
+
+    def _index(self, value):
+        if value < 1:
+            return 0
+        # value = mantissa * 2 ** exponent, mantissa in [0.5, 1)
+        mantissa, exponent = math.frexp(value)
+        index = (
+            (exponent - 1) * self.sub_buckets
+            + int((mantissa * 2 - 1) * self.sub_buckets)
+            + 1
+        )
+        return min(index, self.max_index)
+
+    def _lower_bound(self, index):
+        if index == 0:
+            return 0
+        exponent, sub_bucket = divmod(index - 1, self.sub_buckets)
+        return 2**exponent * (1 + sub_bucket / self.sub_buckets)
+
+    def add(self, value, count=1):
+        index = self._index(value)
+        self.buckets[index] = self.buckets.get(index, 0) + count
+        self.count += count
+        self.total += value * count
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other):
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def reset(self):
+        self.buckets.clear()
+        self.count = 0
+        self.total = 0
+        self.min = float('inf')
+        self.max = 0
+
+    @property
+    def avg(self):
+        return self.total / self.count if self.count else 0
+
+    def percentile(self, q):
+        r"""
+        Returns the estimated q-th percentile, q in [0, 100], or 0 if empty.
+        """
+        if self.count == 0:
+            return 0
+        if q <= 0:
+            return self.min
+        if q >= 100:
+            return self.max
+        rank = max(1, math.ceil(self.count * q / 100))
+        cumulative = 0
+        for index in sorted(self.buckets):
+            cumulative += self.buckets[index]
+            if cumulative >= rank:
+                break
+        # middle of the bucket, clamped to the values seen
+        value = (self._lower_bound(index) + self._lower_bound(index + 1)) / 2
+        return min(max(value, self.min), self.max)
+
 
 def sum_ranges(ranges):
     result = 0
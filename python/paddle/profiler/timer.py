@@ -12,9 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import contextlib
+import json
+import os
+import time
 import timeit
 from collections import OrderedDict
 
+from .statistic_helper import Histogram
+
 
 class Stack:
     """
@@ -299,6 +305,297 @@ class TimerHook(Hook):
         )
 
 
+def _get_device_synchronize():
+    import paddle
+
+    place = paddle.framework._current_expected_place()
+    if isinstance(
+        place, (paddle.CUDAPlace, paddle.XPUPlace, paddle.CustomPlace)
+    ):
+        return lambda: paddle.device.synchronize(place)
+    return None
+
+
+class StepSampler(Hook):
+    r"""
+    A low-overhead step profiler which can be left on in production. Every
+    ``sample_interval`` steps, one step is timed and its costs are added to
+    histograms of fixed size, from which percentiles are reported. The
+    costs of a sampled step are:
+
+    - reader_cost: the time waiting for the DataLoader.
+    - dispatch_cost: the host time of the step besides reader_cost and
+      collective_cost, in which operators are dispatched to the device.
+    - device_cost: the time waiting for the device to finish the work of the
+      step after dispatching, the device is synchronized only at the start
+      and the end of sampled steps. It is 0 on CPU.
+    - collective_cost: the time spent in :meth:`collective` blocks.
+    - batch_cost: the time of the whole step.
+
+    Other steps only increase a counter, so the overhead mainly comes from
+    the synchronization of the device twice every ``sample_interval`` steps.
+
+    The statistics can be pulled by :meth:`get_stats`, or written to a local
+    file in Prometheus text format or JSON by :meth:`export`, which is also
+    done every ``export_interval`` sampled steps if ``export_path`` is set.
+
+    Args:
+        sample_interval(int, optional): One of every ``sample_interval`` steps is sampled. Default: 100.
+        sync_device(bool, optional): Whether to synchronize the device at the end of sampled steps
+            to measure device_cost. Default: True.
+        export_path(str, optional): The file to which statistics are written. Default: None.
+        export_format(str, optional): The format of the file, can be 'prometheus' or 'json'.
+            Default: 'prometheus'.
+        export_interval(int, optional): The statistics are written every ``export_interval``
+            sampled steps. Default: 10.
+        labels(dict, optional): Labels added to the metrics in Prometheus text format,
+            e.g. ``{'rank': '0'}``. Default: None.
+
+    Examples:
+        .. code-block:: python
+
+            >>> import paddle
+            >>> import paddle.profiler as profiler
+
+            >>> sampler = profiler.StepSampler(sample_interval=10)
+            >>> with profiler.Profiler(timer_only=True, step_sampler=sampler) as p:
+            ...     for iter in range(100):
+            ...         x = paddle.randn([32, 32])
+            ...         y = paddle.matmul(x, x)
+            ...         p.step()
+            >>> stats = sampler.get_stats()
+            >>> print(stats['sampled_steps'])
+            10
+    """
+
+    _costs = (
+        'reader_cost',
+        'dispatch_cost',
+        'device_cost',
+        'collective_cost',
+        'batch_cost',
+    )
+
+    def __init__(
+        self,
+        sample_interval=100,
+        sync_device=True,
+        export_path=None,
+        export_format='prometheus',
+        export_interval=10,
+        labels=None,
+    ):
+        if not isinstance(sample_interval, int) or sample_interval <= 0:
+            raise ValueError(
+                f"sample_interval should be a positive integer, but received {sample_interval}."
+            )
+        if export_format not in ('prometheus', 'json'):
+            raise ValueError(
+                f"export_format should be 'prometheus' or 'json', but received {export_format}."
+            )
+        self.sample_interval = sample_interval
+        self.sync_device = sync_device
+        self.export_path = export_path
+        self.export_format = export_format
+        self.export_interval = export_interval
+        self.labels = dict(labels or {})
+        self._synchronize = None
+        self.reset()
+
+    def reset(self):
+        r"""
+        Drop all sampled statistics.
+        """
+        self.histograms = {name: Histogram() for name in self._costs}
+        self.total_steps = 0
+        self.sampled_steps = 0
+        self._sampling = False
+        self._step_start = 0
+        self._reader_start = 0
+        self._reader_cost = 0
+        self._collective_cost = 0
+
+    def _start_step(self, synchronized=False):
+        self._sampling = self.total_steps % self.sample_interval == 0
+        if self._sampling:
+            # drain the work queued by previous unsampled steps, otherwise it
+            # is counted in the costs of this step
+            if self._synchronize is not None and not synchronized:
+                self._synchronize()
+            self._reader_cost = 0
+            self._collective_cost = 0
+            self._step_start = time.perf_counter_ns()
+
+    def begin(self, benchmark):
+        if self.sync_device:
+            self._synchronize = _get_device_synchronize()
+        self._start_step()
+
+    def before_reader(self, benchmark):
+        if self._sampling:
+            self._reader_start = time.perf_counter_ns()
+
+    def after_reader(self, benchmark):
+        if self._sampling:
+            self._reader_cost += time.perf_counter_ns() - self._reader_start
+
+    @contextlib.contextmanager
+    def collective(self):
+        r"""
+        A context manager for timing collective communication in the current
+        step, the device is synchronized before and after the block in sampled
+        steps, so that the time of the communication on device is included.
+
+        Examples:
+            .. code-block:: python
+
+                >>> # doctest: +REQUIRES(env:DISTRIBUTED)
+                >>> import paddle
+                >>> import paddle.distributed as dist
+                >>> import paddle.profiler as profiler
+
+                >>> dist.init_parallel_env()
+                >>> sampler = profiler.StepSampler()
+                >>> with profiler.Profiler(timer_only=True, step_sampler=sampler) as p:
+                ...     for iter in range(100):
+                ...         x = paddle.randn([32, 32])
+                ...         with sampler.collective():
+                ...             dist.all_reduce(x)
+                ...         p.step()
+        """
+        if not self._sampling:
+            yield
+            return
+        if self._synchronize is not None:
+            self._synchronize()
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            if self._synchronize is not None:
+                self._synchronize()
+            self._collective_cost += time.perf_counter_ns() - start
+
+    def after_step(self, benchmark):
+        synchronized = self._sampling
+        if self._sampling:
+            dispatch_end = time.perf_counter_ns()
+            if self._synchronize is not None:
+                self._synchronize()
+            step_end = time.perf_counter_ns()
+            batch_cost = step_end - self._step_start
+            for name, value in (
+                ('reader_cost', self._reader_cost),
+                (
+                    'dispatch_cost',
+                    dispatch_end
+                    - self._step_start
+                    - self._reader_cost
+                    - self._collective_cost,
+                ),
+                ('device_cost', step_end - dispatch_end),
+                ('collective_cost', self._collective_cost),
+                ('batch_cost', batch_cost),
+            ):
+                self.histograms[name].add(max(value, 0))
+            self.sampled_steps += 1
+            if (
+                self.export_path is not None
+                and self.sampled_steps % self.export_interval == 0
+            ):
+                self.export()
+        self.total_steps += 1
+        self._start_step(synchronized)
+
+    def end(self, benchmark):
+        if self.export_path is not None and self.sampled_steps > 0:
+            self.export()
+        self._sampling = False
+
+    def get_stats(self):
+        r"""
+        Returns the statistics of sampled steps, time is in seconds.
+
+        Returns:
+            dict: The numbers of total and sampled steps, and the count, average,
+            p50, p95, p99 and max of every cost.
+        """
+        stats = {
+            'total_steps': self.total_steps,
+            'sampled_steps': self.sampled_steps,
+        }
+        for name, hist in self.histograms.items():
+            stats[name] = {
+                'count': hist.count,
+                'sum': hist.total / 1e9,
+                'avg': hist.avg / 1e9,
+                'p50': hist.percentile(50) / 1e9,
+                'p95': hist.percentile(95) / 1e9,
+                'p99': hist.percentile(99) / 1e9,
+                'max': hist.max / 1e9,
+            }
+        return stats
+
+    def _to_prometheus(self, stats):
+        def format_labels(extra=None):
+            labels = dict(self.labels)
+            labels.update(extra or {})
+            if not labels:
+                return ''
+            items = ','.join(f'{k}="{v}"' for k, v in labels.items())
+            return '{' + items + '}'
+
+        lines = [
+            '# HELP paddle_step_total Total number of steps.',
+            '# TYPE paddle_step_total counter',
+            f'paddle_step_total{format_labels()} {stats["total_steps"]}',
+        ]
+        for name in self._costs:
+            metric = f'paddle_step_{name}_seconds'
+            lines.append(
+                f'# HELP {metric} The {name} of sampled steps in seconds.'
+            )
+            lines.append(f'# TYPE {metric} summary')
+            for q in (50, 95, 99):
+                quantile = format_labels({'quantile': str(q / 100)})
+                lines.append(f'{metric}{quantile} {stats[name][f"p{q}"]}')
+            lines.append(f'{metric}_sum{format_labels()} {stats[name]["sum"]}')
+            lines.append(
+                f'{metric}_count{format_labels()} {stats[name]["count"]}'
+            )
+        return '\n'.join(lines) + '\n'
+
+    def export(self, path=None, format=None):
+        r"""
+        Writes the statistics to a file, which is replaced atomically so that
+        it can be read by other processes at any time, e.g. the textfile
+        collector of Prometheus node exporter.
+
+        Args:
+            path(str, optional): The file to write to. Default: None, ``export_path`` is used.
+            format(str, optional): 'prometheus' or 'json'. Default: None, ``export_format`` is used.
+        """
+        path = path or self.export_path
+        format = format or self.export_format
+        if path is None:
+            raise ValueError("The path to export step statistics is not set.")
+        stats = self.get_stats()
+        if format == 'json':
+            content = json.dumps(stats)
+        elif format == 'prometheus':
+            content = self._to_prometheus(stats)
+        else:
+            raise ValueError(
+                f"format should be 'prometheus' or 'json', but received {format}."
+            )
+        dir_name = os.path.dirname(os.path.abspath(path))
+        os.makedirs(dir_name, exist_ok=True)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+
+
 class TimeAverager:
     """
     Record the cost of every step and count the average.
@@ -360,6 +657,12 @@ class Benchmark:
         self.current_event = None
         self.events = Stack()
 
+    def register_hook(self, name, hook):
+        self.hooks[name] = hook
+
+    def remove_hook(self, name):
+        self.hooks.pop(name, None)
+
     def step(self, num_samples=None):
         """
         Record the statistic for the current step. It will be called in
@@ -12,15 +12,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import heapq
 import itertools
 import logging
+import mmap
 import multiprocessing
+import os
+import pickle
 import random
+import struct
 import sys
 import warnings
 from itertools import zip_longest
 from queue import Queue
-from threading import Thread
+from threading import Event, Semaphore, Thread
 
 from paddle.base.reader import QUEUE_GET_TIMEOUT
 
@@ -42,17 +47,29 @@ else:
     fork_context = multiprocessing
 
 
-def cache(reader):
+def cache(reader, cache_file=None, memory_limit=None):
     """
-    Cache the reader data into memory.
+    Cache the reader data into memory, or into a file on disk.
 
     Be careful that this method may take long time to process,
-    and consume lots of memory. :code:`reader()` would only
-    call once.
+    and consume lots of memory if :code:`cache_file` is None.
+    :code:`reader()` would only call once.
+
+    If :code:`cache_file` is set, samples are pickled into the file while
+    the first pass over the decorated reader, and later passes read samples
+    from the memory-mapped file instead of calling :code:`reader()` again.
+    If :code:`cache_file` already exists, it is regarded as a complete cache
+    of :code:`reader` and :code:`reader()` would never be called.
 
     Args:
         reader (generator): a reader object which yields
             data each time.
+        cache_file (str, optional): path of the file to cache data into.
+            Default None, which means caching all data into memory.
+        memory_limit (int, optional): only useful when :code:`cache_file` is
+            set, the maximum bytes of pickled samples which are also kept in
+            memory, so that they are not deserialized from file again.
+            Default None, which means keeping no sample in memory.
 
     Returns:
         generator: a decorated reader object which yields data from cached memory.
@@ -75,6 +92,9 @@ def cache(reader):
             1
             2
     """
+    if cache_file is not None:
+        return _disk_cache(reader, cache_file, memory_limit)
+
     all_data = tuple(reader())
 
     def __impl__():
@@ -83,6 +103,86 @@ def cache(reader):
     return __impl__
 
 
+# every record of the disk cache is the length of the pickled sample followed
+# by the pickled sample
+_CACHE_RECORD_HEADER = struct.Struct('<Q')
+
+
+def _disk_cache(reader, cache_file, memory_limit):
+    # samples kept in memory, keyed by their index in the cache file. Samples
+    # are always replayed sequentially, an evicting policy like LRU would
+    # drop every sample right before it is read again, so samples are
+    # admitted until memory_limit is reached and kept afterwards.
+    hot_samples = {}
+    hot_bytes = [0]
+
+    def _admit(idx, sample, nbytes):
+        if memory_limit and hot_bytes[0] + nbytes <= memory_limit:
+            hot_samples[idx] = sample
+            hot_bytes[0] += nbytes
+
+    def _write_cache():
+        # write into a temporary file and rename it when the pass finishes,
+        # so that an interrupted pass never leaves a partial cache file.
+        # Samples admitted in this pass are published only with the file,
+        # an interrupted pass or a reader yielding different samples in
+        # another pass must not leave stale samples in memory.
+        tmp_file = f'{cache_file}.{os.getpid()}.tmp'
+        pass_samples = {}
+        pass_bytes = 0
+        try:
+            with open(tmp_file, 'wb') as f:
+                for idx, sample in enumerate(reader()):
+                    data = pickle.dumps(
+                        sample, protocol=pickle.HIGHEST_PROTOCOL
+                    )
+                    f.write(_CACHE_RECORD_HEADER.pack(len(data)))
+                    f.write(data)
+                    if memory_limit and pass_bytes + len(data) <= memory_limit:
+                        pass_samples[idx] = sample
+                        pass_bytes += len(data)
+                    yield sample
+            os.replace(tmp_file, cache_file)
+            hot_samples.clear()
+            hot_samples.update(pass_samples)
+            hot_bytes[0] = pass_bytes
+        finally:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+
+    def _read_cache():
+        with open(cache_file, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                buf = memoryview(mm)
+                try:
+                    idx, offset = 0, 0
+                    while offset < len(buf):
+                        (size,) = _CACHE_RECORD_HEADER.unpack_from(buf, offset)
+                        offset += _CACHE_RECORD_HEADER.size
+                        if idx in hot_samples:
+                            yield hot_samples[idx]
+                        else:
+                            # unpickle from the mapped pages directly
+                            # without copying the record into bytes
+                            sample = pickle.loads(buf[offset : offset + size])
+                            _admit(idx, sample, size)
+                            yield sample
+                        offset += size
+                        idx += 1
+                finally:
+                    buf.release()
+
+    def __impl__():
+        if os.path.exists(cache_file):
+            yield from _read_cache()
+        else:
+            yield from _write_cache()
+
+    return __impl__
+
+
 def map_readers(func, *readers):
     """
     Creates a data reader that outputs return value of function using
@@ -399,7 +499,9 @@ class XmapEndSignal:
     pass
 
 
-def xmap_readers(mapper, reader, process_num, buffer_size, order=False):
+def xmap_readers(
+    mapper, reader, process_num, buffer_size, order=False, use_process=False
+):
     """
     Use multi-threads to map samples from reader by a mapper defined by user.
 
@@ -410,10 +512,19 @@ def xmap_readers(mapper, reader, process_num, buffer_size, order=False):
         buffer_size (int): size of the queue to read data in.
         order (bool): whether to keep the data order from original reader.
             Default False.
+        use_process (bool): whether to map samples by a pool of
+            ``process_num`` processes instead of threads, which is faster
+            for CPU-bound mappers. ``mapper`` and samples must be picklable.
+            Default False.
 
     Returns:
         callable: a decorated reader with data mapping.
     """
+    if use_process:
+        return _xmap_process_readers(
+            mapper, reader, process_num, buffer_size, order
+        )
+
     end = XmapEndSignal()
 
     # define a worker to read samples from reader to in_queue
@@ -422,10 +533,14 @@ def xmap_readers(mapper, reader, process_num, buffer_size, order=False):
             in_queue.put(i)
         in_queue.put(end)
 
-    # define a worker to read samples from reader to in_queue with order flag
-    def order_read_worker(reader, in_queue):
+    # define a worker to read samples from reader to in_queue with order flag,
+    # the number of samples in flight is bounded by in_flight, so that the
+    # reorder buffer in xreader does not grow without limit when some samples
+    # are much slower to map than others
+    def order_read_worker(reader, in_queue, in_flight):
         in_order = 0
         for i in reader():
+            in_flight.acquire()
             in_queue.put((in_order, i))
             in_order += 1
         in_queue.put(end)
@@ -442,16 +557,13 @@ def xmap_readers(mapper, reader, process_num, buffer_size, order=False):
         out_queue.put(end)
 
     # define a worker to handle samples from in_queue by mapper
-    # and put mapped samples into out_queue by order
-    def order_handle_worker(in_queue, out_queue, mapper, out_order):
+    # and put mapped samples with their order into out_queue
+    def order_handle_worker(in_queue, out_queue, mapper):
         ins = in_queue.get()
         while not isinstance(ins, XmapEndSignal):
             order, sample = ins
             r = mapper(sample)
-            while order != out_order[0]:
-                pass
-            out_queue.put(r)
-            out_order[0] += 1
+            out_queue.put((order, r))
             ins = in_queue.get()
         in_queue.put(end)
         out_queue.put(end)
@@ -459,19 +571,16 @@ def xmap_readers(mapper, reader, process_num, buffer_size, order=False):
     def xreader():
         in_queue = Queue(buffer_size)
         out_queue = Queue(buffer_size)
-        out_order = [0]
+        in_flight = Semaphore(buffer_size + process_num)
         # start a read worker in a thread
         target = order_read_worker if order else read_worker
-        t = Thread(target=target, args=(reader, in_queue))
+        args = (reader, in_queue, in_flight) if order else (reader, in_queue)
+        t = Thread(target=target, args=args)
         t.daemon = True
         t.start()
         # start several handle_workers
         target = order_handle_worker if order else handle_worker
-        args = (
-            (in_queue, out_queue, mapper, out_order)
-            if order
-            else (in_queue, out_queue, mapper)
-        )
+        args = (in_queue, out_queue, mapper)
         workers = []
         for i in range(process_num):
             worker = Thread(target=target, args=args)
@@ -480,17 +589,66 @@ def xmap_readers(mapper, reader, process_num, buffer_size, order=False):
         for w in workers:
             w.start()
 
-        sample = out_queue.get()
-        while not isinstance(sample, XmapEndSignal):
-            yield sample
+        if not order:
             sample = out_queue.get()
-        finish = 1
+            while not isinstance(sample, XmapEndSignal):
+                yield sample
+                sample = out_queue.get()
+            finish = 1
+            while finish < process_num:
+                sample = out_queue.get()
+                if isinstance(sample, XmapEndSignal):
+                    finish += 1
+                else:
+                    yield sample
+            return
+
+        # reorder buffer of mapped samples keyed by their order, samples are
+        # yielded as soon as all samples before them are yielded
+        reorder_buffer = []
+        out_order = 0
+        finish = 0
         while finish < process_num:
-            sample = out_queue.get()
-            if isinstance(sample, XmapEndSignal):
+            ins = out_queue.get()
+            if isinstance(ins, XmapEndSignal):
                 finish += 1
-            else:
+                continue
+            heapq.heappush(reorder_buffer, ins)
+            while reorder_buffer and reorder_buffer[0][0] == out_order:
+                _, sample = heapq.heappop(reorder_buffer)
+                out_order += 1
+                in_flight.release()
+                yield sample
+
+    return xreader
+
+
+def _xmap_process_readers(mapper, reader, process_num, buffer_size, order):
+    def xreader():
+        # at most buffer_size + process_num samples are sent to the pool and
+        # not yet yielded, the pool consumes samples from its own thread
+        in_flight = Semaphore(buffer_size + process_num)
+        stopped = Event()
+
+        def throttled_reader():
+            for sample in reader():
+                in_flight.acquire()
+                if stopped.is_set():
+                    return
+                yield sample
+
+        pool = fork_context.Pool(process_num)
+        try:
+            imap = pool.imap if order else pool.imap_unordered
+            for sample in imap(mapper, throttled_reader()):
+                in_flight.release()
                 yield sample
+        finally:
+            # wake up throttled_reader if it is waiting for in_flight
+            stopped.set()
+            in_flight.release()
+            pool.terminate()
+            pool.join()
 
     return xreader
 
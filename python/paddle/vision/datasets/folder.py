@@ -12,7 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
 import os
+import warnings
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
 from PIL import Image
 
@@ -40,7 +43,130 @@ def has_valid_extension(filename, extensions):
     return filename.lower().endswith(extensions)
 
 
-def make_dataset(dir, class_to_idx, extensions, is_valid_file=None):
+_INDEX_VERSION = 2
+
+
+def _list_dir(path, known):
+    # NOTE: a directory whose mtime is unchanged since it was indexed has
+    #       the same entries, reuse them instead of listing it again
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+    entry = known.get(os.path.abspath(path))
+    if entry is not None and entry[0] == mtime:
+        return entry
+
+    files, dirs = [], []
+    try:
+        with os.scandir(path) as it:
+            for e in it:
+                try:
+                    is_dir = e.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    dirs.append(e.name)
+                else:
+                    files.append(e.name)
+    except OSError:
+        return None
+    return mtime, sorted(files), sorted(dirs)
+
+
+def _walk_dirs(tops, index_file=None, num_threads=None):
+    """Lists directory trees with a thread pool.
+
+    Args:
+        tops (list[str]): root directories of trees to list
+        index_file (str, optional): file to load and save the index of
+            listed directories
+        num_threads (int, optional): number of threads to list directories
+
+    Returns:
+        list[list[tuple[str, list[str]]]]: (dirpath, filenames) of each tree
+            in the order of ``sorted(os.walk(top, followlinks=True))``
+    """
+    known = _load_index(index_file) if index_file else {}
+    entries = {}
+    results = [[] for _ in tops]
+    with ThreadPoolExecutor(num_threads) as pool:
+        pending = {
+            pool.submit(_list_dir, top, known): (i, top)
+            for i, top in enumerate(tops)
+        }
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                i, path = pending.pop(future)
+                entry = future.result()
+                if entry is None:
+                    continue
+                entries[os.path.abspath(path)] = entry
+                _, files, dirs = entry
+                results[i].append((path, files))
+                for name in dirs:
+                    sub = os.path.join(path, name)
+                    pending[pool.submit(_list_dir, sub, known)] = (i, sub)
+
+    if index_file:
+        # keep the entries of other trees sharing the index file
+        prefixes = tuple(os.path.join(os.path.abspath(top), '') for top in tops)
+        index = {
+            path: entry
+            for path, entry in known.items()
+            if not os.path.join(path, '').startswith(prefixes)
+        }
+        index.update(entries)
+        if index != known:
+            _save_index(index_file, index)
+    for result in results:
+        result.sort(key=lambda x: x[0])
+    return results
+
+
+def _load_index(index_file):
+    if not os.path.exists(index_file):
+        return {}
+    try:
+        with open(index_file, 'r', encoding='utf-8') as f:
+            index = json.load(f)
+        if index.get('version') != _INDEX_VERSION:
+            return {}
+        return {
+            path: (mtime, files, dirs)
+            for path, (mtime, files, dirs) in index['dirs'].items()
+        }
+    except Exception as e:
+        warnings.warn(f"Failed to load directory index {index_file}: {e}")
+        return {}
+
+
+def _save_index(index_file, entries):
+    # NOTE: write to a temporary file and rename, so that ranks building
+    #       the same dataset concurrently never read a partial index
+    tmp_file = f'{index_file}.{os.getpid()}.tmp'
+    try:
+        dirname = os.path.dirname(index_file)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({'version': _INDEX_VERSION, 'dirs': entries}, f)
+        os.replace(tmp_file, index_file)
+    except OSError as e:
+        warnings.warn(f"Failed to save directory index {index_file}: {e}")
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+
+
+def make_dataset(
+    dir,
+    class_to_idx,
+    extensions,
+    is_valid_file=None,
+    index_file=None,
+    num_threads=None,
+):
     images = []
     dir = os.path.expanduser(dir)
 
@@ -49,12 +175,19 @@ def make_dataset(dir, class_to_idx, extensions, is_valid_file=None):
         def is_valid_file(x):
             return has_valid_extension(x, extensions)
 
+    targets = []
     for target in sorted(class_to_idx.keys()):
         d = os.path.join(dir, target)
-        if not os.path.isdir(d):
-            continue
-        for root, _, fnames in sorted(os.walk(d, followlinks=True)):
-            for fname in sorted(fnames):
+        if os.path.isdir(d):
+            targets.append(target)
+    trees = _walk_dirs(
+        [os.path.join(dir, target) for target in targets],
+        index_file,
+        num_threads,
+    )
+    for target, tree in zip(targets, trees):
+        for root, fnames in tree:
+            for fname in fnames:
                 path = os.path.join(root, fname)
                 if is_valid_file(path):
                     item = (path, class_to_idx[target])
@@ -88,6 +221,13 @@ class DatasetFolder(Dataset):
         is_valid_file (Callable, optional): A function that takes path of a file
             and check if the file is a valid file. Both :attr:`extensions` and
             :attr:`is_valid_file` should not be passed. Default: None.
+        index_file (str, optional): Path of a file to persist the directory index
+            in. If set, directories unmodified since the index was saved are not
+            listed again, which makes later constructions on the same tree, e.g.
+            in other ranks, much faster. Datasets of different roots can share
+            the same index file. Default: None.
+        num_threads (int, optional): Number of threads to list directories with.
+            Default: None, use the default of ``ThreadPoolExecutor``.
 
     Returns:
         :ref:`api_paddle_io_Dataset`. An instance of DatasetFolder.
@@ -211,6 +351,8 @@ class DatasetFolder(Dataset):
         extensions=None,
         transform=None,
         is_valid_file=None,
+        index_file=None,
+        num_threads=None,
     ):
         self.root = root
         self.transform = transform
@@ -218,7 +360,12 @@ class DatasetFolder(Dataset):
             extensions = IMG_EXTENSIONS
         classes, class_to_idx = self._find_classes(self.root)
         samples = make_dataset(
-            self.root, class_to_idx, extensions, is_valid_file
+            self.root,
+            class_to_idx,
+            extensions,
+            is_valid_file,
+            index_file=index_file,
+            num_threads=num_threads,
         )
         if len(samples) == 0:
             raise (
@@ -328,6 +475,13 @@ class ImageFolder(Dataset):
         is_valid_file (Callable, optional): A function that takes path of a file
             and check if the file is a valid file. Both :attr:`extensions` and
             :attr:`is_valid_file` should not be passed. Default: None.
+        index_file (str, optional): Path of a file to persist the directory index
+            in. If set, directories unmodified since the index was saved are not
+            listed again, which makes later constructions on the same tree, e.g.
+            in other ranks, much faster. Datasets of different roots can share
+            the same index file. Default: None.
+        num_threads (int, optional): Number of threads to list directories with.
+            Default: None, use the default of ``ThreadPoolExecutor``.
 
     Returns:
         :ref:`api_paddle_io_Dataset`. An instance of ImageFolder.
@@ -438,6 +592,8 @@ class ImageFolder(Dataset):
         extensions=None,
         transform=None,
         is_valid_file=None,
+        index_file=None,
+        num_threads=None,
     ):
         self.root = root
         if extensions is None:
@@ -451,8 +607,9 @@ class ImageFolder(Dataset):
             def is_valid_file(x):
                 return has_valid_extension(x, extensions)
 
-        for root, _, fnames in sorted(os.walk(path, followlinks=True)):
-            for fname in sorted(fnames):
+        (tree,) = _walk_dirs([path], index_file, num_threads)
+        for root, fnames in tree:
+            for fname in fnames:
                 f = os.path.join(root, fname)
                 if is_valid_file(f):
                     samples.append(f)
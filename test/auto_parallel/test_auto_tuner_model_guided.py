@@ -0,0 +1,90 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from paddle.distributed.auto_tuner.cost_model import get_relative_cost
+from paddle.distributed.auto_tuner.tuner import AutoTuner
+
+
+def get_tuner_cfg(search_algo):
+    return {
+        "dp_degree": "auto",
+        "mp_degree": "auto",
+        "pp_degree": "auto",
+        "vpp_degree": "auto",
+        "micro_batch_size": "auto",
+        "sharding_degree": "auto",
+        "sharding_stage": "auto",
+        "use_recompute": "auto",
+        "recompute_granularity": "auto",
+        "task_limit": 100,
+        "num_gpus": 16,
+        "nodes": 2,
+        "gpus_per_node": 8,
+        "model_cfg": {
+            "hidden_size": 2048,
+            "global_batch_size": 64,
+            "num_layers": 24,
+            "num_attention_heads": 16,
+            "vocab_size": 50304,
+        },
+        "metric_cfg": {
+            "name": "interval_samples_per_second",
+            "OptimizationDirection": "Maximize",
+        },
+        "search_algo": {"name": search_algo},
+    }
+
+
+class TestModelGuidedSearch(unittest.TestCase):
+    def test_search(self):
+        tuner_cfg = get_tuner_cfg("model_guided")
+        tuner = AutoTuner(tuner_cfg)
+        all_tasks = tuner.algo.all_tasks
+        self.assertGreater(len(all_tasks), 0)
+
+        # without history, the candidate of the lowest cost comes first
+        min_cost = min(get_relative_cost(cfg, tuner_cfg) for cfg in all_tasks)
+        cfg = tuner.search_once()
+        self.assertAlmostEqual(get_relative_cost(cfg, tuner_cfg), min_cost)
+
+        searched = []
+        while cfg is not None and len(searched) < 10:
+            key = tuple(sorted(cfg.items(), key=lambda kv: kv[0]))
+            self.assertNotIn(key, searched)
+            searched.append(key)
+            cfg = dict(cfg)
+            cfg["interval_samples_per_second"] = 100.0 / get_relative_cost(
+                cfg, tuner_cfg
+            )
+            cfg["time"] = 1
+            tuner.add_cfg(cfg)
+            cfg = tuner.search_once()
+
+    def test_search_batch(self):
+        tuner = AutoTuner(get_tuner_cfg("model_guided"))
+        trials = tuner.search_batch(list(range(40)))
+        self.assertEqual(len(trials), 2)
+        self.assertEqual(trials[0][1], list(range(16)))
+        self.assertEqual(trials[1][1], list(range(16, 32)))
+        self.assertNotEqual(trials[0][0], trials[1][0])
+
+        tuner = AutoTuner(get_tuner_cfg("grid"))
+        trials = tuner.search_batch(list(range(16)))
+        self.assertEqual(len(trials), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
 import tempfile
 import unittest
 
@@ -20,6 +21,19 @@ import numpy as np
 
 import paddle
 import paddle.distributed as dist
+from paddle.distributed.checkpoint.load_state_dict import (
+    ChunkIndex,
+    get_metadata_list,
+    not_overlap,
+)
+from paddle.distributed.checkpoint.metadata import (
+    LocalTensorIndex,
+    LocalTensorMetadata,
+)
+from paddle.distributed.checkpoint.save_state_dict import (
+    balance_replicated_tensors,
+    split_into_files,
+)
 from paddle.distributed.checkpoint.utils import (
     flatten_state_dict,
     unflatten_state_dict,
@@ -157,6 +171,93 @@ class TestDistCheckpointUtils(test_base.CommunicationTestDistBase):
 
         ckpt_dir_tmp.cleanup()
 
+    def test_balance_replicated_tensors(self):
+        w1 = LocalTensorIndex("w1", (0, 0))
+        w2_0 = LocalTensorIndex("w2", (0, 0))
+        w2_1 = LocalTensorIndex("w2", (1, 0))
+        w3 = LocalTensorIndex("w3", (0,))
+        owners = balance_replicated_tensors(
+            [
+                (0, {w1: 64, w2_0: 16, w3: 8}),
+                (1, {w1: 64, w2_1: 16, w3: 8}),
+            ]
+        )
+        self.assertEqual(owners, {w1: 0, w2_0: 0, w2_1: 1, w3: 1})
+
+    def test_split_into_files(self):
+        sizes = {LocalTensorIndex(f"w{i}", (0,)): i + 1 for i in range(5)}
+        groups = split_into_files(sizes, 2)
+        self.assertEqual(len(groups), 2)
+        self.assertEqual(sorted(sum(groups, [])), sorted(sizes))
+        loads = [sum(sizes[index] for index in group) for group in groups]
+        self.assertLessEqual(abs(loads[0] - loads[1]), 1)
+        self.assertEqual(len(split_into_files(sizes, 10)), 5)
+
+    def test_save_multiple_files(self):
+        ckpt_dir_tmp = tempfile.TemporaryDirectory()
+        ckpt_dir = ckpt_dir_tmp.name
+        state_dict = {
+            "w1": paddle.to_tensor([1, 2]),
+            "w2": paddle.to_tensor([3, 4, 5]),
+            "w3": paddle.to_tensor([6]),
+        }
+        dist.save_state_dict(state_dict, ckpt_dir, num_files_per_rank=2)
+        self.assertEqual(
+            sorted(os.listdir(ckpt_dir)),
+            ["0.metadata", "0_0_0.distcp", "0_0_1.distcp"],
+        )
+        # the second checkpoint is written in background from a snapshot
+        future = dist.save_state_dict(
+            state_dict, ckpt_dir, num_files_per_rank=2, async_save=True
+        )
+        state_dict["w1"].set_value(paddle.to_tensor([0, 0]))
+        future.result()
+        self.assertTrue(os.path.exists(os.path.join(ckpt_dir, "1.metadata")))
+        metadata = paddle.load(os.path.join(ckpt_dir, "1.metadata"))
+        file_name = metadata.storage_metadata[LocalTensorIndex("w1", (0,))]
+        loaded = paddle.load(os.path.join(ckpt_dir, file_name))
+        np.testing.assert_equal(loaded["w1"].numpy(), [1, 2])
+        ckpt_dir_tmp.cleanup()
+
+    def test_chunk_index(self):
+        chunks = [
+            LocalTensorMetadata((i * 4, j * 3), (4, 3))
+            for i in range(8)
+            for j in range(2)
+        ]
+        index = ChunkIndex(chunks)
+        for offset, shape in [
+            ((0, 0), (32, 6)),
+            ((5, 2), (6, 1)),
+            ((8, 3), (4, 3)),
+            ((31, 0), (1, 1)),
+        ]:
+            chunk = LocalTensorMetadata(offset, shape)
+            expected = [c for c in chunks if not not_overlap(chunk, c)]
+            self.assertEqual(
+                sorted(c.global_offset for c in index.query(chunk)),
+                sorted(c.global_offset for c in expected),
+            )
+
+    def test_load_sliced_state_dict(self):
+        ckpt_dir_tmp = tempfile.TemporaryDirectory()
+        ckpt_dir = ckpt_dir_tmp.name
+        w1 = paddle.arange(32, dtype="float32").reshape([4, 8])
+        step = paddle.to_tensor(7.0)
+        dist.save_state_dict({"w1": w1, "step": step}, ckpt_dir)
+        metadata_list = get_metadata_list(ckpt_dir)
+        self.assertIs(get_metadata_list(ckpt_dir), metadata_list)
+
+        state_dict = {
+            "w1": paddle.zeros([4, 8], dtype="float32"),
+            "step": paddle.zeros([], dtype="float32"),
+        }
+        dist.load_state_dict(state_dict, ckpt_dir)
+        np.testing.assert_equal(state_dict["w1"].numpy(), w1.numpy())
+        self.assertEqual(state_dict["step"].shape, [])
+        np.testing.assert_equal(state_dict["step"].numpy(), step.numpy())
+        ckpt_dir_tmp.cleanup()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+import tempfile
 import unittest
 from collections import Counter
 
@@ -27,6 +29,8 @@ from test_fetch_feed import Linear, Pool2D
 import paddle
 from paddle import base
 from paddle.jit.dy2static import convert_to_static
+from paddle.jit.dy2static.compile_cache import CompileCache, get_compile_cache
+from paddle.jit.dy2static.program_translator import FunctionCache
 
 
 class TestCacheProgram(Dy2StTestBase):
@@ -181,5 +185,44 @@ class TestToOutputWithCache(Dy2StTestBase):
         self.assertEqual(ret.numpy(), 5050)
 
 
+class TestCompileCache(Dy2StTestBase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        paddle.jit.set_compile_cache(None)
+        self.temp_dir.cleanup()
+
+    def test_persistent_cache(self):
+        paddle.jit.set_compile_cache(self.temp_dir.name)
+        compile_cache = get_compile_cache()
+        static_func = FunctionCache().convert_with_cache(sum_under_while)
+        self.assertEqual(compile_cache.stats()['writes'], 1)
+        self.assertEqual(len(os.listdir(self.temp_dir.name)), 1)
+
+        # a new function cache, as in a new process, loads the transformed code
+        cached_func = FunctionCache().convert_with_cache(sum_under_while)
+        self.assertEqual(compile_cache.stats()['hits'], 1)
+        self.assertEqual(
+            paddle.jit.to_static(cached_func)(100).numpy(),
+            paddle.jit.to_static(static_func)(100).numpy(),
+        )
+
+    def test_eviction(self):
+        source_codes = [f"def f{i}():\n    return {i}\n" for i in range(3)]
+        compile_cache = CompileCache(self.temp_dir.name)
+        compile_cache.save(source_codes[0], simple_func, "", {})
+        (entry_file,) = os.listdir(self.temp_dir.name)
+        size = os.path.getsize(os.path.join(self.temp_dir.name, entry_file))
+        compile_cache.max_size = size * 2
+        compile_cache.save(source_codes[1], simple_func, "", {})
+        compile_cache.load(source_codes[0])
+        compile_cache.save(source_codes[2], simple_func, "", {})
+        stats = compile_cache.stats()
+        self.assertEqual(stats['evictions'], 1)
+        self.assertIsNotNone(compile_cache.load(source_codes[0]))
+        self.assertIsNone(compile_cache.load(source_codes[1]))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -158,6 +158,45 @@ class TestAudioBackends(unittest.TestCase):
         if os.path.exists(wave_wav_path):
             os.remove(wave_wav_path)
 
+    def test_wave_backend_subtypes(self):
+        wave_backend = paddle.audio.backends.wave_backend
+        wave_wav_path = os.path.join(os.getcwd(), "wave_subtype_test.wav")
+        data = np.random.uniform(-0.5, 0.5, size=(4000, 2))
+        for subtype in ["PCM_U8", "PCM_16", "PCM_24", "PCM_32", "FLOAT"]:
+            soundfile.write(wave_wav_path, data, self.sr, subtype=subtype)
+            expected, _ = soundfile.read(
+                wave_wav_path, dtype="float32", always_2d=True
+            )
+            expected = expected.T
+
+            wav_info = paddle.audio.info(wave_wav_path)
+            self.assertEqual(wav_info.num_samples, 4000)
+            self.assertEqual(wav_info.num_channels, 2)
+
+            wav_data, sr = paddle.audio.load(wave_wav_path)
+            self.assertEqual(sr, self.sr)
+            np.testing.assert_allclose(wav_data, expected, atol=1e-6)
+
+            wav_data, _ = paddle.audio.load(
+                wave_wav_path, frame_offset=1000, num_frames=500
+            )
+            np.testing.assert_allclose(
+                wav_data, expected[:, 1000:1500], atol=1e-6
+            )
+            wav_data, _ = paddle.audio.load(wave_wav_path, frame_offset=3000)
+            np.testing.assert_allclose(wav_data, expected[:, 3000:], atol=1e-6)
+
+            chunks = list(wave_backend.stream(wave_wav_path, 1500, overlap=500))
+            self.assertEqual(len(chunks), 4)
+            for i, chunk in enumerate(chunks):
+                np.testing.assert_allclose(
+                    chunk, expected[:, i * 1000 : i * 1000 + 1500], atol=1e-6
+                )
+
+        with self.assertRaises(ValueError):
+            next(wave_backend.stream(wave_wav_path, 1000, overlap=1000))
+        os.remove(wave_wav_path)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import itertools
+import os
+import tempfile
 import unittest
 
 import numpy as np
@@ -115,6 +117,56 @@ class TestAudioDatasets(unittest.TestCase):
         self.assertTrue(elem[0].shape[0] == params)
         self.assertTrue(0 <= elem[1] <= 2)
 
+    def test_feature_cache_and_collate(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        sample_rate = 16000
+        files = []
+        for i, num_frames in enumerate([8000, 8000, 6000]):
+            file = os.path.join(temp_dir.name, f'{i}.wav')
+            waveform = paddle.uniform([1, num_frames], min=-0.5, max=0.5)
+            paddle.audio.save(file, waveform, sample_rate)
+            files.append(file)
+        labels = [0, 1, 2]
+        AudioClassificationDataset = (
+            paddle.audio.datasets.dataset.AudioClassificationDataset
+        )
+
+        dataset = AudioClassificationDataset(
+            files, labels, feat_type='mfcc', n_mfcc=40
+        )
+        expected = [dataset[i][0].numpy() for i in range(3)]
+        # the extractor is built once and reused
+        extractor = dataset.get_feature_extractor(sample_rate)
+        dataset[0]
+        self.assertIs(dataset.get_feature_extractor(sample_rate), extractor)
+
+        cache_dir = os.path.join(temp_dir.name, 'cache')
+        dataset = AudioClassificationDataset(
+            files,
+            labels,
+            feat_type='mfcc',
+            feat_cache_dir=cache_dir,
+            n_mfcc=40,
+        )
+        for _ in range(2):
+            for i in range(3):
+                np.testing.assert_allclose(
+                    dataset[i][0].numpy(), expected[i], rtol=1e-5
+                )
+        self.assertEqual(len(os.listdir(cache_dir)), 3)
+
+        dataset = AudioClassificationDataset(
+            files, labels, feat_type='mfcc', collate_feat=True, n_mfcc=40
+        )
+        feats, batch_labels = dataset.collate_fn([dataset[0], dataset[1]])
+        self.assertEqual(feats.shape[0], 2)
+        np.testing.assert_allclose(feats[0].numpy(), expected[0], rtol=1e-5)
+        np.testing.assert_allclose(feats[1].numpy(), expected[1], rtol=1e-5)
+        np.testing.assert_array_equal(batch_labels.numpy(), [0, 1])
+        feats, _ = dataset.collate_fn([dataset[0], dataset[2]])
+        self.assertEqual(feats.shape, [2, *expected[0].shape])
+        temp_dir.cleanup()
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -19,6 +19,7 @@ import numpy as np
 
 from paddle.io import (
     BatchSampler,
+    BucketBatchSampler,
     Dataset,
     RandomSampler,
     Sampler,
@@ -313,5 +314,89 @@ class TestWeightedRandomSampler(unittest.TestCase):
             self.assertTrue(True)
 
 
+class TestBucketBatchSampler(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(2024)
+        self.lengths = np.random.randint(1, 64, size=[1000])
+
+    def test_batch_size(self):
+        bs = BucketBatchSampler(
+            self.lengths, batch_size=16, num_replicas=1, rank=0
+        )
+        batches = list(bs)
+        self.assertEqual(len(batches), len(bs))
+        self.assertEqual(
+            sorted(i for b in batches for i in b), list(range(1000))
+        )
+        # samples are sorted by length without shuffle
+        flat_lengths = self.lengths[[i for b in batches for i in b]]
+        self.assertTrue(np.all(np.diff(flat_lengths) >= 0))
+
+        bs = BucketBatchSampler(
+            self.lengths, batch_size=16, drop_last=True, num_replicas=1, rank=0
+        )
+        self.assertTrue(all(len(b) == 16 for b in bs))
+
+    def test_max_tokens(self):
+        bs = BucketBatchSampler(
+            self.lengths,
+            max_tokens=256,
+            shuffle=True,
+            pool_size=100,
+            num_replicas=1,
+            rank=0,
+        )
+        batches = list(bs)
+        self.assertEqual(
+            sorted(i for b in batches for i in b), list(range(1000))
+        )
+        for b in batches:
+            self.assertLessEqual(len(b) * self.lengths[b].max(), 256)
+
+    def test_distributed(self):
+        nranks = 4
+        samplers = [
+            BucketBatchSampler(
+                self.lengths,
+                batch_size=16,
+                shuffle=True,
+                num_replicas=nranks,
+                rank=rank,
+            )
+            for rank in range(nranks)
+        ]
+        for epoch in range(2):
+            for sampler in samplers:
+                sampler.set_epoch(epoch)
+            batches = [list(sampler) for sampler in samplers]
+            self.assertEqual(len({len(b) for b in batches}), 1)
+            indices = [
+                i for rank_batches in batches for b in rank_batches for i in b
+            ]
+            self.assertEqual(set(indices), set(range(1000)))
+
+        # same epoch gives the same batches
+        samplers[0].set_epoch(1)
+        self.assertEqual(list(samplers[0]), batches[0])
+
+    def test_len(self):
+        configs = [
+            {'batch_size': 16},
+            {'batch_size': 16, 'drop_last': True, 'shuffle': True},
+            {'max_tokens': 256},
+            {'max_tokens': 256, 'shuffle': True, 'pool_size': 100},
+        ]
+        for config in configs:
+            for nranks in [1, 3]:
+                bs = BucketBatchSampler(
+                    self.lengths, num_replicas=nranks, rank=0, **config
+                )
+                for epoch in range(3):
+                    bs.set_epoch(epoch)
+                    num_batches = len(bs)
+                    self.assertEqual(len(bs), num_batches)
+                    self.assertEqual(len(list(bs)), num_batches)
+
+
 if __name__ == '__main__':
     unittest.main()
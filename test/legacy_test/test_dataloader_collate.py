@@ -0,0 +1,155 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle.io import PadCollateFn
+from paddle.io.dataloader.collate import _SchemaCollateFn, default_collate_fn
+
+
+def assert_batch_equal(test_case, x, y):
+    if isinstance(x, dict):
+        test_case.assertEqual(list(x.keys()), list(y.keys()))
+        for k in x:
+            assert_batch_equal(test_case, x[k], y[k])
+    elif isinstance(x, list):
+        test_case.assertEqual(len(x), len(y))
+        for a, b in zip(x, y):
+            assert_batch_equal(test_case, a, b)
+    elif isinstance(x, np.ndarray):
+        test_case.assertEqual(x.dtype, y.dtype)
+        np.testing.assert_array_equal(x, y)
+    elif isinstance(x, paddle.Tensor):
+        np.testing.assert_array_equal(x.numpy(), y.numpy())
+    else:
+        test_case.assertEqual(x, y)
+
+
+def make_sample(i, dtype='float32'):
+    return {
+        'image': np.full([3, 8, 8], i, dtype=dtype),
+        'label': i,
+        'name': f'sample_{i}',
+        'tensor': paddle.full([2], i, dtype='float32'),
+        'nested': [np.arange(i, i + 4), {'score': float(i)}],
+    }
+
+
+class TestSchemaCollateFn(unittest.TestCase):
+    def test_same_as_default(self):
+        for reuse_buffer in [False, True]:
+            collate_fn = _SchemaCollateFn(reuse_buffer=reuse_buffer)
+            for batch_size in [4, 4, 3]:
+                batch = [make_sample(i) for i in range(batch_size)]
+                assert_batch_equal(
+                    self, collate_fn(batch), default_collate_fn(batch)
+                )
+
+    def test_reuse_buffer(self):
+        collate_fn = _SchemaCollateFn(reuse_buffer=True)
+        out = collate_fn([make_sample(i) for i in range(4)])
+        image = out['image']
+        out = collate_fn([make_sample(i + 4) for i in range(4)])
+        self.assertIs(out['image'], image)
+        np.testing.assert_array_equal(out['image'][:, 0, 0, 0], [4, 5, 6, 7])
+
+    def test_schema_changed(self):
+        collate_fn = _SchemaCollateFn(reuse_buffer=True)
+        batch = [make_sample(i) for i in range(4)]
+        collate_fn(batch)
+
+        # dtype of field changed
+        batch = [make_sample(i, dtype='int64') for i in range(4)]
+        assert_batch_equal(self, collate_fn(batch), default_collate_fn(batch))
+
+        # fields changed
+        batch = [(np.ones([2]) * i, i) for i in range(4)]
+        assert_batch_equal(self, collate_fn(batch), default_collate_fn(batch))
+
+        # fields number not same among samples
+        batch = [(np.ones([2]), 1), (np.ones([2]), 1, 2)]
+        with self.assertRaises(RuntimeError):
+            collate_fn(batch)
+
+    def test_ndarray_subclass(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            mm = np.memmap(
+                os.path.join(temp_dir, 'data.bin'),
+                dtype='float32',
+                mode='w+',
+                shape=(8, 3),
+            )
+            mm[:] = np.arange(24).reshape([8, 3])
+            for reuse_buffer in [False, True]:
+                collate_fn = _SchemaCollateFn(reuse_buffer=reuse_buffer)
+                for start in [0, 4]:
+                    batch = [(mm[i], i) for i in range(start, start + 4)]
+                    out = collate_fn(batch)
+                    expected = default_collate_fn(batch)
+                    self.assertIsInstance(out[0], np.ndarray)
+                    self.assertEqual(out[0].shape, (4, 3))
+                    assert_batch_equal(self, out, expected)
+            del mm
+
+    def test_plain_sample(self):
+        collate_fn = _SchemaCollateFn()
+        batch = [np.ones([2]) * i for i in range(4)]
+        assert_batch_equal(self, collate_fn(batch), default_collate_fn(batch))
+        assert_batch_equal(self, collate_fn([1, 2, 3]), np.array([1, 2, 3]))
+
+
+class TestPadCollateFn(unittest.TestCase):
+    def test_dict(self):
+        batch = [
+            {'ids': np.arange(1, 4), 'label': 0},
+            {'ids': np.arange(1, 6), 'label': 1},
+        ]
+        out = PadCollateFn(pad_fields=['ids'], buckets=[4, 8, 16])(batch)
+        np.testing.assert_array_equal(
+            out['ids'],
+            [[1, 2, 3, 0, 0, 0, 0, 0], [1, 2, 3, 4, 5, 0, 0, 0]],
+        )
+        np.testing.assert_array_equal(
+            out['ids_mask'],
+            [[1, 1, 1, 0, 0, 0, 0, 0], [1, 1, 1, 1, 1, 0, 0, 0]],
+        )
+        np.testing.assert_array_equal(out['label'], [0, 1])
+
+    def test_tuple(self):
+        batch = [
+            (np.ones([3, 2], dtype='float32'), 0),
+            (np.ones([5, 2], dtype='float32'), 1),
+        ]
+        feat, label, mask = PadCollateFn(pad_value=-1, pad_to_multiple_of=4)(
+            batch
+        )
+        self.assertEqual(feat.shape, (2, 8, 2))
+        self.assertEqual(feat.dtype, np.float32)
+        self.assertTrue(np.all(feat[0, 3:] == -1))
+        np.testing.assert_array_equal(label, [0, 1])
+        np.testing.assert_array_equal(mask.sum(axis=-1), [3, 5])
+
+    def test_array(self):
+        batch = [np.arange(2), np.arange(3)]
+        padded = PadCollateFn(return_mask=False)(batch)
+        np.testing.assert_array_equal(padded, [[0, 1, 0], [0, 1, 2]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle.io import DataLoader, Dataset, Subset
+
+
+class ArrayDataset(Dataset):
+    def __init__(self, num_samples, return_batch=False):
+        self.images = np.arange(num_samples * 4, dtype='float32').reshape(
+            [num_samples, 4]
+        )
+        self.labels = np.arange(num_samples, dtype='int64').reshape(
+            [num_samples, 1]
+        )
+        self.return_batch = return_batch
+        self.getitems_calls = 0
+
+    def __getitem__(self, idx):
+        raise AssertionError("__getitem__ should not be called")
+
+    def __getitems__(self, indices):
+        self.getitems_calls += 1
+        if self.return_batch:
+            return [self.images[indices], self.labels[indices]]
+        return [(self.images[i], self.labels[i]) for i in indices]
+
+    def __len__(self):
+        return len(self.images)
+
+
+def identity_collate(batch):
+    return batch
+
+
+class TestDatasetGetitems(unittest.TestCase):
+    def check_loader(self, dataset, num_workers, collate_fn=None):
+        paddle.disable_static()
+        loader = DataLoader(
+            dataset,
+            batch_size=4,
+            shuffle=True,
+            num_workers=num_workers,
+            collate_fn=collate_fn,
+        )
+        labels = []
+        for images, label in loader:
+            self.assertEqual(images.shape, [4, 4])
+            np.testing.assert_array_equal(
+                images.numpy()[:, 0], label.numpy()[:, 0] * 4
+            )
+            labels.extend(label.numpy().flatten().tolist())
+        self.assertEqual(sorted(labels), list(range(len(dataset))))
+
+    def test_sample_list(self):
+        for num_workers in [0, 2]:
+            self.check_loader(ArrayDataset(32), num_workers)
+
+    def test_collated_batch(self):
+        # a batch collated by dataset is passed through by collate_fn
+        for num_workers in [0, 2]:
+            self.check_loader(
+                ArrayDataset(32, return_batch=True),
+                num_workers,
+                collate_fn=identity_collate,
+            )
+
+    def test_subset(self):
+        dataset = ArrayDataset(32)
+        subset = Subset(dataset, indices=list(range(0, 32, 2)))
+        samples = subset.__getitems__([0, 1, 2])
+        self.assertEqual([label[0] for _, label in samples], [0, 2, 4])
+        self.assertEqual(dataset.getitems_calls, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
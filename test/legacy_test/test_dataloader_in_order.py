@@ -0,0 +1,66 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle.io import DataLoader, Dataset
+
+
+class SlowSampleDataset(Dataset):
+    def __init__(self, sample_num, slow_idx):
+        self.sample_num = sample_num
+        self.slow_idx = slow_idx
+
+    def __getitem__(self, idx):
+        if idx == self.slow_idx:
+            time.sleep(1)
+        return np.array([idx], dtype='int64')
+
+    def __len__(self):
+        return self.sample_num
+
+
+class TestDataLoaderInOrder(unittest.TestCase):
+    def run_loader(self, in_order):
+        paddle.disable_static()
+        loader = DataLoader(
+            SlowSampleDataset(64, slow_idx=0),
+            batch_size=4,
+            num_workers=2,
+            in_order=in_order,
+        )
+        it = iter(loader)
+        batches = [batch.numpy().flatten().tolist() for batch in it]
+        return batches, it.dispatch_stats
+
+    def test_in_order(self):
+        batches, stats = self.run_loader(in_order=True)
+        self.assertEqual(sum(batches, []), list(range(64)))
+        self.assertGreater(stats['stalls'], 0)
+
+    def test_not_in_order(self):
+        batches, stats = self.run_loader(in_order=False)
+        self.assertEqual(sorted(sum(batches, [])), list(range(64)))
+        # the slow first batch does not block other batches
+        self.assertNotEqual(batches[0][0], 0)
+        self.assertEqual(stats['stalls'], 0)
+        self.assertGreater(stats['stragglers'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
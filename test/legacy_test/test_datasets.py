@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
 import os
 import shutil
 import tempfile
@@ -71,6 +72,44 @@ class TestFolderDatasets(unittest.TestCase):
 
         assert len(loader) == 4
 
+    def test_index_file(self):
+        index_dir = tempfile.mkdtemp()
+        index_file = os.path.join(index_dir, 'index.json')
+        dataset_folder = DatasetFolder(
+            self.data_dir, index_file=index_file, num_threads=2
+        )
+        self.assertTrue(os.path.exists(index_file))
+        cached = DatasetFolder(self.data_dir, index_file=index_file)
+        self.assertEqual(cached.samples, dataset_folder.samples)
+
+        fake_img = (np.random.random((32, 32, 3)) * 255).astype('uint8')
+        sub_dir = os.path.join(self.data_dir, 'class_1', 'sub')
+        os.makedirs(sub_dir)
+        cv2.imwrite(os.path.join(sub_dir, 'new.jpg'), fake_img)
+        updated = DatasetFolder(self.data_dir, index_file=index_file)
+        self.assertEqual(len(updated), 5)
+        self.assertEqual(
+            updated.samples[-1][0], os.path.join(sub_dir, 'new.jpg')
+        )
+
+        loader = ImageFolder(self.data_dir, index_file=index_file)
+        self.assertEqual(loader.samples, [s[0] for s in updated.samples])
+
+        # datasets of different roots share the index file
+        val_dir = tempfile.mkdtemp()
+        os.makedirs(os.path.join(val_dir, 'class_0'))
+        cv2.imwrite(os.path.join(val_dir, 'class_0', 'val.jpg'), fake_img)
+        val = DatasetFolder(val_dir, index_file=index_file)
+        self.assertEqual(len(val), 1)
+        with open(index_file) as f:
+            indexed = json.load(f)['dirs']
+        for root in [self.data_dir, val_dir]:
+            self.assertIn(
+                os.path.join(os.path.abspath(root), 'class_0'), indexed
+            )
+        shutil.rmtree(val_dir)
+        shutil.rmtree(index_dir)
+
     def test_transform(self):
         def fake_transform(img):
             return img
@@ -13,7 +13,10 @@
 # limitations under the License.
 
 import functools
+import os
+import pickle
 import sys
+import tempfile
 import time
 import unittest
 
@@ -129,6 +132,65 @@ class TestShuffle(unittest.TestCase):
             self.assertEqual(total, 10)
 
 
+class TestCache(unittest.TestCase):
+    def test_memory_cache(self):
+        cached = paddle.reader.cache(reader_creator_10(0))
+        for _ in range(2):
+            self.assertEqual(list(cached()), list(range(10)))
+
+    def test_disk_cache(self):
+        num_calls = [0]
+
+        def reader():
+            num_calls[0] += 1
+            yield from reader_creator_10(0)()
+
+        for memory_limit in (None, 32):
+            num_calls[0] = 0
+            with tempfile.TemporaryDirectory() as cache_dir:
+                cache_file = os.path.join(cache_dir, 'cache')
+                cached = paddle.reader.cache(
+                    reader, cache_file=cache_file, memory_limit=memory_limit
+                )
+                # an interrupted pass leaves no cache file
+                for sample in cached():
+                    break
+                self.assertFalse(os.path.exists(cache_file))
+
+                for _ in range(3):
+                    self.assertEqual(list(cached()), list(range(10)))
+                self.assertTrue(os.path.exists(cache_file))
+                self.assertEqual(num_calls[0], 2)
+
+    def test_disk_cache_changing_reader(self):
+        # the reader yields different samples in every pass, the samples
+        # kept in memory must match the cache file of the finished pass
+        num_calls = [0]
+
+        def reader():
+            num_calls[0] += 1
+            for i in range(10):
+                yield i + num_calls[0] * 100
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache_file = os.path.join(cache_dir, 'cache')
+            # the interrupted pass alone would use up memory_limit
+            memory_limit = 6 * len(
+                pickle.dumps(100, protocol=pickle.HIGHEST_PROTOCOL)
+            )
+            cached = paddle.reader.cache(
+                reader, cache_file=cache_file, memory_limit=memory_limit
+            )
+            for i, sample in enumerate(cached()):
+                if i == 5:
+                    break
+            self.assertFalse(os.path.exists(cache_file))
+            expected = list(cached())
+            self.assertEqual(expected, list(range(200, 210)))
+            for _ in range(2):
+                self.assertEqual(list(cached()), expected)
+
+
 class TestXmap(unittest.TestCase):
     def test_xmap(self):
         def mapper(x):
@@ -153,6 +215,30 @@ class TestXmap(unittest.TestCase):
                             self.assertEqual(e, mapper(idx))
 
 
+def xmap_mapper(x):
+    return x + 1
+
+
+class TestXmapProcess(unittest.TestCase):
+    def test_xmap_process(self):
+        if sys.platform == 'win32':
+            return
+        for order in (True, False):
+            for size in (1, 4):
+                reader = paddle.reader.xmap_readers(
+                    xmap_mapper,
+                    reader_creator_10(0),
+                    4,
+                    size,
+                    order,
+                    use_process=True,
+                )
+                result = list(reader())
+                if not order:
+                    result.sort()
+                self.assertEqual(result, [xmap_mapper(i) for i in range(10)])
+
+
 class TestMultiProcessReader(unittest.TestCase):
     def setup(self):
         self.samples = []
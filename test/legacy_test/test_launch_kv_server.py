@@ -0,0 +1,91 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import threading
+import unittest
+import urllib.error
+import urllib.request
+
+from paddle.distributed.fleet.launch_utils import find_free_ports
+from paddle.distributed.launch.utils.kv_server import KVServer
+
+
+class TestKVServer(unittest.TestCase):
+    def setUp(self):
+        port = list(find_free_ports(1))[0]
+        self.endpoint = f"http://127.0.0.1:{port}"
+        self.server = KVServer(port)
+        self.server.start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def request(self, method, path, data=None):
+        req = urllib.request.Request(
+            self.endpoint + path, data=data, method=method
+        )
+        try:
+            with urllib.request.urlopen(req) as r:
+                body = r.read()
+                return r.status, json.loads(body) if body else None
+        except urllib.error.HTTPError as e:
+            return e.code, None
+
+    def test_prefix(self):
+        for key in ['/a/1', '/a/2', '/ab/1', '/b/1']:
+            self.assertEqual(self.request('PUT', key, b'v')[0], 200)
+        code, ret = self.request('GET', '/a/')
+        self.assertEqual(code, 200)
+        self.assertEqual(sorted(ret), ['/a/1', '/a/2'])
+        self.assertEqual(len(self.request('GET', '/a')[1]), 3)
+        self.assertEqual(self.request('GET', '/c')[0], 404)
+
+        self.assertEqual(self.request('DELETE', '/a/1')[0], 200)
+        self.assertEqual(self.request('DELETE', '/a/1')[0], 404)
+        self.assertEqual(list(self.request('GET', '/a/')[1]), ['/a/2'])
+
+    def test_put_and_wait(self):
+        size = 16
+        results = [None] * size
+
+        def put_and_wait(rank):
+            results[rank] = self.request(
+                'POST',
+                f'/job/{rank}?prefix=/job/&size={size}&timeout=30',
+                str(rank).encode(),
+            )
+
+        threads = [
+            threading.Thread(target=put_and_wait, args=(rank,))
+            for rank in range(size)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        expected = {f'/job/{rank}': str(rank) for rank in range(size)}
+        for code, ret in results:
+            self.assertEqual(code, 200)
+            self.assertEqual(ret, expected)
+
+        code, ret = self.request('GET', f'/job/?size={size}')
+        self.assertEqual(ret, expected)
+        code, _ = self.request('GET', f'/job/?size={size + 1}&timeout=0.1')
+        self.assertEqual(code, 408)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -284,6 +284,19 @@ class TestPrecision(unittest.TestCase):
         self.assertEqual(m.fp, 0.0)
         self.assertEqual(m.accumulate(), 0.0)
 
+    def test_accumulate_on_device(self):
+        x = np.random.random(size=(64, 1))
+        y = np.random.randint(2, size=(64, 1))
+
+        m = paddle.metric.Precision()
+        m_device = paddle.metric.Precision(accumulate_on_device=True)
+        m.update(x, y)
+        m_device.update(paddle.to_tensor(x), paddle.to_tensor(y))
+        self.assertAlmostEqual(m.accumulate(), m_device.accumulate())
+
+        m_device.reset()
+        self.assertEqual(m_device.accumulate(), 0.0)
+
 
 class TestRecall(unittest.TestCase):
     def test_1d(self):
@@ -307,6 +320,19 @@ class TestRecall(unittest.TestCase):
         self.assertEqual(m.fn, 0.0)
         self.assertEqual(m.accumulate(), 0.0)
 
+    def test_accumulate_on_device(self):
+        x = np.random.random(size=(64, 1))
+        y = np.random.randint(2, size=(64, 1))
+
+        m = paddle.metric.Recall()
+        m_device = paddle.metric.Recall(accumulate_on_device=True)
+        m.update(x, y)
+        m_device.update(paddle.to_tensor(x), paddle.to_tensor(y))
+        self.assertAlmostEqual(m.accumulate(), m_device.accumulate())
+
+        m_device.reset()
+        self.assertEqual(m_device.accumulate(), 0.0)
+
 
 class TestAuc(unittest.TestCase):
     def test_auc_numpy(self):
@@ -355,6 +381,163 @@ class TestAuc(unittest.TestCase):
         m.reset()
         self.assertEqual(m.accumulate(), 0.0)
 
+    def test_auc_accumulate_on_device(self):
+        class1_preds = np.random.random(size=(256, 1))
+        # predictions on the first and the last bucket
+        class1_preds[:2, 0] = [0.0, 1.0]
+        preds = np.concatenate((1 - class1_preds, class1_preds), axis=1)
+        labels = np.random.randint(2, size=(256, 1))
+
+        m = paddle.metric.Auc()
+        m_device = paddle.metric.Auc(accumulate_on_device=True)
+        for i in range(0, 256, 64):
+            m.update(preds[i : i + 64], labels[i : i + 64])
+            m_device.update(
+                paddle.to_tensor(preds[i : i + 64]),
+                paddle.to_tensor(labels[i : i + 64]),
+            )
+        self.assertAlmostEqual(m.accumulate(), m_device.accumulate())
+        np.testing.assert_array_equal(m.state(), m_device.state())
+
+        m_device.reset()
+        self.assertEqual(m_device.accumulate(), 0.0)
+
+        # accumulate_on_device is keyword-only, positional args are kept
+        m = paddle.metric.Auc('ROC', 255, 'my_auc')
+        self.assertEqual(m.name(), 'my_auc')
+        self.assertFalse(m._accumulate_on_device)
+
+
+class TestMergeState(unittest.TestCase):
+    def test_merge_state(self):
+        class1_preds = np.random.random(size=(128, 1))
+        preds = np.concatenate((1 - class1_preds, class1_preds), axis=1)
+        labels = np.random.randint(2, size=(128, 1))
+
+        for metric_cls in [
+            paddle.metric.Precision,
+            paddle.metric.Recall,
+            paddle.metric.Auc,
+        ]:
+            m = metric_cls()
+            m_merged = metric_cls()
+            pred_input = (
+                class1_preds if metric_cls != paddle.metric.Auc else preds
+            )
+            m.update(pred_input, labels)
+            for i in range(0, 128, 32):
+                m_part = metric_cls()
+                m_part.update(pred_input[i : i + 32], labels[i : i + 32])
+                m_merged.merge_state(m_part.state())
+            self.assertAlmostEqual(m.accumulate(), m_merged.accumulate())
+
+
+class TestConfusionMatrix(unittest.TestCase):
+    def test_main(self):
+        x = paddle.to_tensor(
+            np.array(
+                [
+                    [0.1, 0.2, 0.7],
+                    [0.1, 0.6, 0.3],
+                    [0.5, 0.2, 0.3],
+                    [0.1, 0.8, 0.1],
+                ]
+            )
+        )
+        y = paddle.to_tensor(np.array([[2], [1], [0], [2]]))
+        m = paddle.metric.ConfusionMatrix(num_classes=3)
+        m.update(*m.compute(x, y))
+        expected = np.array([[1, 0, 0], [0, 1, 0], [0, 1, 1]])
+        np.testing.assert_array_equal(m.accumulate(), expected)
+
+        m_merged = paddle.metric.ConfusionMatrix(num_classes=3)
+        m_merged.merge_state(m.state())
+        m_merged.merge_state(m.state())
+        np.testing.assert_array_equal(m_merged.accumulate(), expected * 2)
+
+        m.reset()
+        self.assertEqual(m.accumulate().sum(), 0)
+
+
+class TestPrecisionRecallF1(unittest.TestCase):
+    def setUp(self):
+        self.num_classes = 5
+        self.pred = np.random.random(size=(64, self.num_classes))
+        self.label = np.random.randint(self.num_classes, size=(64, 1))
+
+    def reference(self, pred_mask, label_mask, average):
+        tp = (pred_mask & label_mask).sum(axis=0).astype('float64')
+        fp = (pred_mask & ~label_mask).sum(axis=0).astype('float64')
+        fn = (~pred_mask & label_mask).sum(axis=0).astype('float64')
+        if average == 'micro':
+            tp, fp, fn = tp.sum(), fp.sum(), fn.sum()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            precision = np.nan_to_num(tp / (tp + fp))
+            recall = np.nan_to_num(tp / (tp + fn))
+            f1 = np.nan_to_num(2 * precision * recall / (precision + recall))
+        return [np.mean(precision), np.mean(recall), np.mean(f1)]
+
+    def test_multi_class_topk(self):
+        label_mask = np.eye(self.num_classes)[self.label.reshape(-1)] > 0
+        for topk in [1, 2]:
+            top_idx = np.argsort(-self.pred, axis=-1)[:, :topk]
+            pred_mask = np.zeros_like(label_mask)
+            np.put_along_axis(pred_mask, top_idx, True, axis=-1)
+            for average in ['macro', 'micro']:
+                m = paddle.metric.PrecisionRecallF1(
+                    self.num_classes, average=average, topk=topk
+                )
+                m.update(
+                    *m.compute(
+                        paddle.to_tensor(self.pred),
+                        paddle.to_tensor(self.label),
+                    )
+                )
+                np.testing.assert_allclose(
+                    m.accumulate(),
+                    self.reference(pred_mask, label_mask, average),
+                )
+
+    def test_multi_label(self):
+        label = np.random.randint(2, size=self.pred.shape)
+        for average in ['macro', 'micro']:
+            m = paddle.metric.PrecisionRecallF1(
+                self.num_classes, average=average, multi_label=True
+            )
+            m.update(
+                *m.compute(paddle.to_tensor(self.pred), paddle.to_tensor(label))
+            )
+            np.testing.assert_allclose(
+                m.accumulate(),
+                self.reference(self.pred >= 0.5, label > 0, average),
+            )
+            self.assertEqual(
+                m.name(),
+                [f'{n}_{average}' for n in ['precision', 'recall', 'f1']],
+            )
+
+
+class TestMultiLabelAuc(unittest.TestCase):
+    def test_main(self):
+        num_classes = 4
+        preds = np.random.random(size=(256, num_classes))
+        labels = np.random.randint(2, size=(256, num_classes))
+
+        m = paddle.metric.MultiLabelAuc(num_classes, average=None)
+        m.update(preds, labels)
+        res = m.accumulate()
+        for c in range(num_classes):
+            auc = paddle.metric.Auc()
+            auc.update(
+                np.stack((1 - preds[:, c], preds[:, c]), axis=1),
+                labels[:, c : c + 1],
+            )
+            self.assertAlmostEqual(res[c], auc.accumulate())
+
+        m_macro = paddle.metric.MultiLabelAuc(num_classes)
+        m_macro.merge_state(m.state())
+        self.assertAlmostEqual(m_macro.accumulate(), np.mean(res))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,139 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import pickle
+import tempfile
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle.io import DataLoader, MmapDataset, MmapDatasetWriter, PadCollateFn
+
+
+class TestMmapDataset(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'dataset')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write_fixed(self, num_samples):
+        with MmapDatasetWriter(self.path) as writer:
+            for i in range(num_samples):
+                image = np.full([3, 4], i, dtype='float32')
+                writer.write((image, np.array([i], dtype='int64')))
+
+    def test_fixed_fields(self):
+        self.write_fixed(20)
+        dataset = MmapDataset(self.path)
+        self.assertEqual(len(dataset), 20)
+        image, label = dataset[-1]
+        self.assertEqual(image.shape, (3, 4))
+        self.assertEqual(image.dtype, np.float32)
+        self.assertFalse(image.flags.writeable)
+        self.assertEqual(label[0], 19)
+        samples = dataset.__getitems__([3, 1, 7])
+        self.assertIsInstance(samples, list)
+        self.assertEqual(samples[0][0].shape, (3, 4))
+        self.assertEqual([label[0] for _, label in samples], [3, 1, 7])
+        with self.assertRaises(IndexError):
+            dataset[20]
+
+    def test_ragged_fields(self):
+        with MmapDatasetWriter(self.path, ragged_fields=['ids']) as writer:
+            for i in range(10):
+                writer.write({'ids': np.arange(i + 1), 'label': i})
+        dataset = MmapDataset(self.path)
+        sample = dataset[4]
+        np.testing.assert_array_equal(sample['ids'], np.arange(5))
+        self.assertEqual(sample['label'], 4)
+        samples = dataset.__getitems__([0, 9])
+        self.assertIsInstance(samples, list)
+        self.assertEqual(len(samples[1]['ids']), 10)
+
+    def test_shape_mismatch(self):
+        writer = MmapDatasetWriter(self.path)
+        writer.write({'ids': np.arange(3)})
+        with self.assertRaises(ValueError):
+            writer.write({'ids': np.arange(4)})
+
+    def test_incomplete(self):
+        with self.assertRaises(ValueError):
+            MmapDataset(self.temp_dir.name)
+
+    def test_list_samples(self):
+        with MmapDatasetWriter(self.path) as writer:
+            for i in range(4):
+                writer.write([np.arange(3), np.array([i])])
+        sample = MmapDataset(self.path)[1]
+        self.assertIsInstance(sample, list)
+        self.assertEqual(sample[1][0], 1)
+
+    def test_overwrite(self):
+        self.write_fixed(4)
+        self.assertEqual(len(MmapDataset(self.path)), 4)
+        # the old meta is removed until the new dataset is written
+        with self.assertRaises(RuntimeError):
+            with MmapDatasetWriter(self.path) as writer:
+                writer.write((np.zeros([3, 4], dtype='float32'), np.array([0])))
+                raise RuntimeError('interrupted')
+        with self.assertRaises(ValueError):
+            MmapDataset(self.path)
+        self.write_fixed(8)
+        self.assertEqual(len(MmapDataset(self.path)), 8)
+        self.assertEqual(os.listdir(self.path).count('meta.json'), 1)
+        self.assertFalse(any(f.endswith('.tmp') for f in os.listdir(self.path)))
+
+    def test_pickle(self):
+        self.write_fixed(4)
+        dataset = MmapDataset(self.path)
+        dataset[0]
+        dataset = pickle.loads(pickle.dumps(dataset))
+        self.assertIsNone(dataset._arrays)
+        self.assertEqual(dataset[2][1][0], 2)
+
+    def test_dataloader(self):
+        paddle.disable_static()
+        self.write_fixed(32)
+        dataset = MmapDataset(self.path)
+        for num_workers in [0, 2]:
+            loader = DataLoader(
+                dataset, batch_size=8, shuffle=True, num_workers=num_workers
+            )
+            labels = []
+            for images, label in loader:
+                self.assertEqual(images.shape, [8, 3, 4])
+                labels.extend(label.numpy().flatten().tolist())
+            self.assertEqual(sorted(labels), list(range(32)))
+
+    def test_dataloader_ragged(self):
+        paddle.disable_static()
+        with MmapDatasetWriter(self.path, ragged_fields=[0]) as writer:
+            for i in range(16):
+                writer.write((np.arange(i % 4 + 1), np.array([i])))
+        loader = DataLoader(
+            MmapDataset(self.path),
+            batch_size=4,
+            collate_fn=PadCollateFn(pad_fields=[0]),
+        )
+        for ids, label, mask in loader:
+            self.assertEqual(ids.shape, [4, 4])
+            self.assertEqual(mask.shape, [4, 4])
+
+
+if __name__ == '__main__':
+    unittest.main()
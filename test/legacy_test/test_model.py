@@ -953,6 +953,127 @@ class TestModelFunction(unittest.TestCase):
             np.testing.assert_almost_equal(losses[0], losses[1], decimal=4)
             np.testing.assert_almost_equal(losses[0], losses[2], decimal=4)
 
+    def test_fit_deferred_logging(self):
+        dim = 20
+        data = np.random.random(size=(40, dim)).astype(np.float32)
+        label = np.random.randint(0, 10, size=(40, 1)).astype(np.int64)
+
+        class EpochLogs(paddle.callbacks.Callback):
+            def __init__(self):
+                self.logs = []
+
+            def on_epoch_end(self, epoch, logs=None):
+                self.logs.append(dict(logs))
+
+        def fit(deferred_logging):
+            base.enable_dygraph(paddle.set_device('cpu'))
+            self.set_seed()
+            net = MyModel()
+            optim = paddle.optimizer.SGD(
+                learning_rate=0.001, parameters=net.parameters()
+            )
+            inputs = [InputSpec([None, dim], 'float32', 'x')]
+            labels = [InputSpec([None, 1], 'int64', 'label')]
+            model = Model(net, inputs, labels)
+            model.prepare(
+                optim,
+                loss=CrossEntropyLoss(reduction="sum"),
+                metrics=Accuracy(),
+            )
+            callback = EpochLogs()
+            model.fit(
+                paddle.io.TensorDataset([data, label]),
+                batch_size=4,
+                epochs=2,
+                log_freq=3,
+                shuffle=False,
+                verbose=0,
+                callbacks=[callback],
+                deferred_logging=deferred_logging,
+            )
+            base.disable_dygraph()
+            return callback.logs
+
+        expected = fit(False)
+        for logs, expected_logs in zip(fit(True), expected):
+            np.testing.assert_allclose(logs['loss'], expected_logs['loss'])
+            self.assertEqual(logs['acc'], expected_logs['acc'])
+
+    def test_sharded_evaluate_predict(self):
+        dim = 20
+        data = np.random.random(size=(10, dim)).astype(np.float32)
+        label = np.random.randint(0, 10, size=(10, 1)).astype(np.int64)
+        dataset = paddle.io.TensorDataset([data, label])
+
+        base.enable_dygraph(paddle.set_device('cpu'))
+        self.set_seed()
+        net = MyModel()
+        inputs = [InputSpec([None, dim], 'float32', 'x')]
+        labels = [InputSpec([None, 1], 'int64', 'label')]
+        model = Model(net, inputs, labels)
+        model.prepare(loss=CrossEntropyLoss(), metrics=Accuracy())
+
+        expected = model.evaluate(dataset, batch_size=4, verbose=0)
+        result = model.evaluate(dataset, batch_size=4, verbose=0, sharded=True)
+        self.assertEqual(result['acc'], expected['acc'])
+
+        output_dir = tempfile.mkdtemp()
+        outputs = model.predict(
+            dataset,
+            batch_size=4,
+            stack_outputs=True,
+            verbose=0,
+            sharded=True,
+            output_dir=output_dir,
+        )
+        saved = paddle.load(
+            os.path.join(output_dir, 'predict.rank0.pdout'), return_numpy=True
+        )
+        self.assertEqual(len(saved), len(outputs))
+        np.testing.assert_allclose(saved[0], outputs[0])
+        with self.assertRaises(ValueError):
+            model.predict(dataset, verbose=0, output_dir=output_dir)
+        shutil.rmtree(output_dir)
+
+        class StopEval(paddle.callbacks.Callback):
+            def on_eval_batch_end(self, step, logs=None):
+                raise RuntimeError('stop eval')
+
+            def on_predict_batch_end(self, step, logs=None):
+                raise RuntimeError('stop predict')
+
+        # sharded state must not leak into later calls after a failure
+        with self.assertRaises(RuntimeError):
+            model.evaluate(
+                dataset, verbose=0, sharded=True, callbacks=[StopEval()]
+            )
+        self.assertFalse(model._sharded_eval)
+        self.assertIsNone(model._adapter._local_samples)
+        self.assertIsNone(model._test_dataloader)
+        with self.assertRaises(RuntimeError):
+            model.predict(
+                dataset, verbose=0, sharded=True, callbacks=[StopEval()]
+            )
+        self.assertFalse(model._sharded_eval)
+        self.assertIsNone(model._adapter._local_samples)
+        self.assertIsNone(model._test_dataloader)
+        base.disable_dygraph()
+
+    def test_num_local_samples(self):
+        from paddle.hapi.model import _num_local_samples
+
+        # 10 samples are padded to 12 for 3 ranks, the 2 padded samples
+        # are in the last batch of rank 2
+        dataset = list(range(10))
+        num_samples = []
+        for rank in range(3):
+            sampler = DistributedBatchSampler(
+                dataset, batch_size=2, num_replicas=3, rank=rank
+            )
+            loader = paddle.io.DataLoader(dataset, batch_sampler=sampler)
+            num_samples.append(_num_local_samples(loader))
+        self.assertEqual(num_samples, [4, 4, 2])
+
 
 class TestModelWithLRScheduler(unittest.TestCase):
     def test_fit_by_step(self):
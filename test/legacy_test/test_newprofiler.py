@@ -12,8 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
 import os
 import tempfile
+import time
 import unittest
 
 import numpy as np
@@ -413,6 +415,83 @@ class TestTimerOnly(unittest.TestCase):
             p.step()
         p.stop()
 
+    def test_step_sampler(self):
+        dataset = RandomDataset(20 * 4)
+        simple_net = SimpleNet()
+        loader = DataLoader(dataset, batch_size=4, drop_last=True)
+        temp_dir = tempfile.TemporaryDirectory()
+        export_path = os.path.join(temp_dir.name, 'step.prom')
+        sampler = profiler.StepSampler(
+            sample_interval=4,
+            export_path=export_path,
+            export_interval=2,
+            labels={'rank': '0'},
+        )
+        with profiler.Profiler(timer_only=True, step_sampler=sampler) as p:
+            for image, label in loader():
+                out = simple_net(image)
+                loss = F.cross_entropy(out, label)
+                with sampler.collective():
+                    avg_loss = paddle.mean(loss)
+                avg_loss.backward()
+                p.step()
+        self.assertNotIn('step_sampler', profiler.timer.benchmark().hooks)
+
+        stats = sampler.get_stats()
+        self.assertEqual(stats['total_steps'], 20)
+        self.assertEqual(stats['sampled_steps'], 5)
+        for name in [
+            'reader_cost',
+            'dispatch_cost',
+            'device_cost',
+            'collective_cost',
+            'batch_cost',
+        ]:
+            self.assertEqual(stats[name]['count'], 5)
+            self.assertLessEqual(stats[name]['p50'], stats[name]['p99'])
+            self.assertLessEqual(stats[name]['p99'], stats[name]['max'])
+        self.assertGreater(stats['reader_cost']['sum'], 0)
+        self.assertGreater(stats['collective_cost']['sum'], 0)
+        self.assertLessEqual(
+            stats['reader_cost']['sum'] + stats['collective_cost']['sum'],
+            stats['batch_cost']['sum'],
+        )
+
+        with open(export_path) as f:
+            content = f.read()
+        self.assertIn('paddle_step_total{rank="0"} 20', content)
+        self.assertIn(
+            'paddle_step_batch_cost_seconds{rank="0",quantile="0.99"}',
+            content,
+        )
+        json_path = os.path.join(temp_dir.name, 'step.json')
+        sampler.export(json_path, 'json')
+        with open(json_path) as f:
+            self.assertEqual(json.load(f), stats)
+        temp_dir.cleanup()
+
+    def test_step_sampler_queued_work(self):
+        queued = [0.0]
+
+        def synchronize():
+            time.sleep(queued[0])
+            queued[0] = 0.0
+
+        sampler = profiler.StepSampler(sample_interval=4, sync_device=False)
+        sampler._synchronize = synchronize
+        sampler.begin(None)
+        for _ in range(12):
+            # the host runs ahead of the device, every step queues 20ms work
+            queued[0] += 0.02
+            sampler.after_step(None)
+        sampler.end(None)
+
+        # work queued by unsampled steps is not counted in sampled steps
+        stats = sampler.get_stats()
+        self.assertEqual(stats['sampled_steps'], 3)
+        self.assertLess(stats['device_cost']['max'], 0.04)
+        self.assertLess(stats['batch_cost']['max'], 0.04)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1128,6 +1128,32 @@ class TestAsyncSaveLoad(unittest.TestCase):
         with self.assertRaises(ValueError):
             paddle.async_save(layer_state_dict, static_save_path)
 
+    def test_async_save_staging(self):
+        layer, _ = self.build_and_train_model()
+        path = os.path.join(self.temp_dir.name, "staging.pdparams")
+        state_dict = layer.state_dict()
+        expected = {k: v.numpy() for k, v in state_dict.items()}
+
+        # the checkpoint is a snapshot of tensors at the time of async_save
+        future = paddle.async_save(state_dict, path)
+        with paddle.no_grad():
+            for value in state_dict.values():
+                value.set_value(paddle.zeros_like(value))
+        self.assertEqual(future.result(), path)
+        self.assertEqual(os.listdir(self.temp_dir.name), ["staging.pdparams"])
+        for key, value in paddle.load(path).items():
+            np.testing.assert_array_equal(value.numpy(), expected[key])
+
+        # staging buffers are reused by the following saves to the same path
+        futures = [paddle.async_save(state_dict, path) for _ in range(3)]
+        paddle.clear_async_save_task_queue()
+        self.assertTrue(all(f.done() for f in futures))
+        for key, value in paddle.load(path).items():
+            self.assertEqual(value.name, state_dict[key].name)
+            np.testing.assert_array_equal(
+                value.numpy(), np.zeros_like(expected[key])
+            )
+
 
 class TestSaveLoadProgram(unittest.TestCase):
     def test_save_load_program(self):
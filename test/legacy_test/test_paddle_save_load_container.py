@@ -0,0 +1,100 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+from io import BytesIO
+
+import numpy as np
+
+import paddle
+from paddle.framework.io_container import _LazyContainerDict
+
+
+class TestSaveLoadTensorContainer(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'model.pdparams')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_state_dict(self):
+        layer = paddle.nn.Linear(4, 3)
+        opt = paddle.optimizer.Adam(parameters=layer.parameters())
+        layer(paddle.rand([2, 4])).mean().backward()
+        opt.step()
+        obj = {'model': layer.state_dict(), 'opt': opt.state_dict()}
+        paddle.save(obj, self.path, use_tensor_container=True)
+
+        loaded = paddle.load(self.path)
+        for key, value in layer.state_dict().items():
+            np.testing.assert_array_equal(
+                loaded['model'][key].numpy(), value.numpy()
+            )
+            self.assertEqual(loaded['model'][key].name, value.name)
+        new_layer = paddle.nn.Linear(4, 3)
+        new_layer.set_state_dict(loaded['model'])
+        np.testing.assert_array_equal(
+            new_layer.weight.numpy(), layer.weight.numpy()
+        )
+        new_opt = paddle.optimizer.Adam(parameters=new_layer.parameters())
+        new_opt.set_state_dict(loaded['opt'])
+
+    def test_mmap(self):
+        obj = {
+            'x': paddle.arange(12, dtype='float32').reshape([3, 4]),
+            'y': np.ones([2, 2], dtype='int64'),
+            'step': 10,
+            'nested': [paddle.zeros([0]), (1.5, 'a')],
+        }
+        paddle.save(obj, self.path, use_tensor_container=True)
+        loaded = paddle.load(self.path, mmap=True, return_numpy=True)
+        self.assertIsInstance(loaded, _LazyContainerDict)
+        self.assertEqual(sorted(loaded), ['nested', 'step', 'x', 'y'])
+        np.testing.assert_array_equal(
+            loaded['x'], np.arange(12, dtype='float32').reshape([3, 4])
+        )
+        self.assertEqual(loaded['step'], 10)
+        self.assertEqual(loaded['nested'][0].shape, (0,))
+        self.assertEqual(loaded['nested'][1], (1.5, 'a'))
+
+        loaded = paddle.load(self.path, mmap=True)
+        self.assertIsInstance(loaded['x'], paddle.Tensor)
+        np.testing.assert_array_equal(loaded['y'], obj['y'])
+
+    def test_memory_buffer(self):
+        buffer = BytesIO()
+        x = paddle.rand([5, 6])
+        paddle.save(x, buffer, use_tensor_container=True)
+        paddle.save({'step': 1}, buffer, use_tensor_container=True)
+        buffer.seek(0)
+        np.testing.assert_array_equal(paddle.load(buffer).numpy(), x.numpy())
+        self.assertEqual(paddle.load(buffer), {'step': 1})
+
+    def test_errors(self):
+        with self.assertRaises(TypeError):
+            paddle.save(
+                {'layer': paddle.nn.Linear(2, 2)},
+                self.path,
+                use_tensor_container=True,
+            )
+        with self.assertRaises(TypeError):
+            paddle.save({}, self.path, use_tensor_container=1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,223 @@
+# Copyright (c) 2024 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from test_profiler_statistic import (
+    DevicePythonNode,
+    HostPythonNode,
+    MemPythonNode,
+)
+
+from paddle import profiler
+from paddle.profiler import profiler_statistic
+
+
+def build_profile(num_steps, ops, allocated):
+    r"""
+    ops is a list of (layer name, operator name, cpu time, kernel time) run
+    in every step, allocated is the bytes allocated by the first operator.
+    """
+    root_node = HostPythonNode(
+        'Root Node',
+        profiler.TracerEventType.UserDefined,
+        0,
+        float('inf'),
+        1000,
+        1001,
+    )
+    start = 0
+    for step in range(num_steps):
+        step_node = HostPythonNode(
+            f'ProfileStep#{step}',
+            profiler.TracerEventType.ProfileStep,
+            start,
+            start + 1000,
+            1000,
+            1001,
+        )
+        root_node.children_node.append(step_node)
+        layer_nodes = {}
+        time = start
+        for i, (layer, op, cpu_time, gpu_time) in enumerate(ops):
+            if layer not in layer_nodes:
+                layer_nodes[layer] = HostPythonNode(
+                    layer,
+                    profiler.TracerEventType.Forward,
+                    time,
+                    start + 900,
+                    1000,
+                    1001,
+                )
+                step_node.children_node.append(layer_nodes[layer])
+            op_node = HostPythonNode(
+                op,
+                profiler.TracerEventType.Operator,
+                time,
+                time + cpu_time,
+                1000,
+                1001,
+            )
+            launch_node = HostPythonNode(
+                'cudalaunchkernel',
+                profiler.TracerEventType.CudaRuntime,
+                time,
+                time + 1,
+                1000,
+                1001,
+            )
+            launch_node.device_node.append(
+                DevicePythonNode(
+                    f'{op}_kernel',
+                    profiler.TracerEventType.Kernel,
+                    time,
+                    time + gpu_time,
+                    0,
+                    0,
+                    0,
+                )
+            )
+            op_node.runtime_node.append(launch_node)
+            if i == 0:
+                op_node.mem_node.append(
+                    MemPythonNode(
+                        time,
+                        0,
+                        profiler_statistic.TracerMemEventType.Allocate,
+                        1000,
+                        1001,
+                        allocated,
+                        'place(gpu:0)',
+                        allocated,
+                        allocated,
+                        allocated * (step + 1),
+                        allocated * (step + 1),
+                    )
+                )
+            layer_nodes[layer].children_node.append(op_node)
+            time += cpu_time
+        start += 1000
+    return profiler_statistic.StatisticData(
+        {'thread1001': root_node},
+        {},
+    )
+
+
+class TestProfilerDiff(unittest.TestCase):
+    def setUp(self):
+        self.base = build_profile(
+            2,
+            [
+                ('Encoder', 'matmul', 100, 200),
+                ('Encoder', 'add', 10, 10),
+                ('Decoder', 'matmul', 100, 200),
+                ('Decoder', 'relu', 20, 20),
+            ],
+            1000,
+        )
+        self.target = build_profile(
+            4,
+            [
+                ('Encoder', 'matmul', 100, 200),
+                ('Encoder', 'add', 11, 10),
+                ('Decoder', 'matmul', 200, 100),
+                ('Decoder', 'gelu', 40, 40),
+            ],
+            3000,
+        )
+
+    def get_item(self, diff, category, name):
+        for item in diff.items:
+            if item.category == category and item.name == name:
+                return item
+        raise KeyError(name)
+
+    def test_compare_by_name(self):
+        diff = profiler.compare_profiler_results(
+            self.base,
+            self.target,
+            min_time_delta=5,
+            min_memory_delta=100,
+        )
+        self.assertEqual(diff.base_steps, 2)
+        self.assertEqual(diff.target_steps, 4)
+
+        matmul = self.get_item(diff, 'operator', 'matmul')
+        self.assertEqual(matmul.base['call'], 2)
+        self.assertEqual(matmul.target['call'], 2)
+        self.assertEqual(matmul.deltas['cpu_time'], 100)
+        self.assertEqual(matmul.deltas['gpu_time'], -100)
+        self.assertEqual(matmul.status, 'regression')
+        self.assertEqual(sorted(matmul.significant), ['cpu_time', 'gpu_time'])
+
+        # 10% slower but below min_time_delta
+        self.assertEqual(
+            self.get_item(diff, 'operator', 'add').status, 'unchanged'
+        )
+
+        relu = self.get_item(diff, 'operator', 'relu')
+        self.assertFalse(relu.in_target)
+        self.assertEqual(relu.status, 'improvement')
+        gelu = self.get_item(diff, 'operator', 'gelu')
+        self.assertFalse(gelu.in_base)
+        self.assertEqual(gelu.status, 'regression')
+        self.assertEqual(gelu.ratio('cpu_time'), float('inf'))
+
+        kernel = self.get_item(diff, 'kernel', 'matmul_kernel')
+        self.assertEqual(kernel.deltas['gpu_time'], -100)
+        self.assertEqual(kernel.status, 'improvement')
+
+        memory = self.get_item(diff, 'memory', 'place(gpu:0)/matmul')
+        self.assertEqual(memory.base['allocation_size'], 1000)
+        self.assertEqual(memory.target['allocation_size'], 3000)
+        self.assertEqual(memory.status, 'regression')
+        peak = self.get_item(diff, 'peak_memory', 'place(gpu:0)')
+        self.assertEqual(peak.deltas['peak_allocated'], 12000 - 2000)
+
+        self.assertTrue(diff.has_regression)
+        self.assertIn(gelu, diff.regressions())
+        self.assertIn(relu, diff.improvements())
+        self.assertEqual(len(diff.to_dict()['items']), len(diff.items))
+        print(diff.table(time_unit='ns'))
+
+    def test_compare_by_call_path(self):
+        diff = profiler.compare_profiler_results(
+            self.base,
+            self.target,
+            by_call_path=True,
+            min_time_delta=5,
+        )
+        encoder_matmul = self.get_item(diff, 'operator', '/Encoder/matmul')
+        self.assertEqual(encoder_matmul.status, 'unchanged')
+        decoder_matmul = self.get_item(diff, 'operator', '/Decoder/matmul')
+        self.assertEqual(decoder_matmul.status, 'regression')
+        self.assertEqual(
+            self.get_item(
+                diff, 'kernel', '/Decoder/matmul/matmul_kernel'
+            ).status,
+            'improvement',
+        )
+        self.assertEqual(
+            self.get_item(diff, 'layer', '/Encoder').status, 'unchanged'
+        )
+        print(diff.table(time_unit='ns', show_unchanged=True))
+
+    def test_identical(self):
+        diff = profiler.compare_profiler_results(self.base, self.base)
+        self.assertFalse(diff.has_regression)
+        self.assertTrue(all(item.status == 'unchanged' for item in diff.items))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1044,6 +1044,200 @@ class TestProfilerStatistic(unittest.TestCase):
                 )
             )
 
+    def test_streaming_summary(self):
+        def build_window(offset):
+            root_node = HostPythonNode(
+                'Root Node',
+                profiler.TracerEventType.UserDefined,
+                0,
+                float('inf'),
+                1000,
+                1001,
+            )
+            profilerstep_node = HostPythonNode(
+                'ProfileStep#1',
+                profiler.TracerEventType.ProfileStep,
+                offset,
+                offset + 400,
+                1000,
+                1001,
+            )
+            forward_node = HostPythonNode(
+                'Net',
+                profiler.TracerEventType.Forward,
+                offset + 10,
+                offset + 100,
+                1000,
+                1001,
+            )
+            conv2d_node = HostPythonNode(
+                'conv2d',
+                profiler.TracerEventType.Operator,
+                offset + 20,
+                offset + 50,
+                1000,
+                1001,
+            )
+            conv2d_launchkernel = HostPythonNode(
+                'cudalaunchkernel',
+                profiler.TracerEventType.CudaRuntime,
+                offset + 30,
+                offset + 35,
+                1000,
+                1001,
+            )
+            conv2d_kernel = DevicePythonNode(
+                'conv2d_kernel',
+                profiler.TracerEventType.Kernel,
+                offset + 40,
+                offset + 90,
+                0,
+                0,
+                0,
+            )
+            allreduce_node = HostPythonNode(
+                'allreduce',
+                profiler.TracerEventType.Operator,
+                offset + 60,
+                offset + 80,
+                1000,
+                1001,
+            )
+            allreduce_launchkernel = HostPythonNode(
+                'cudalaunchkernel',
+                profiler.TracerEventType.CudaRuntime,
+                offset + 62,
+                offset + 64,
+                1000,
+                1001,
+            )
+            allreduce_kernel = DevicePythonNode(
+                'nccl_allreduce_kernel',
+                profiler.TracerEventType.Kernel,
+                offset + 80,
+                offset + 120,
+                0,
+                0,
+                1,
+            )
+            backward_node = HostPythonNode(
+                'Gradient Backward',
+                profiler.TracerEventType.Backward,
+                offset + 150,
+                offset + 300,
+                1000,
+                1001,
+            )
+            root_node.children_node.append(profilerstep_node)
+            profilerstep_node.children_node.extend(
+                [forward_node, backward_node]
+            )
+            forward_node.children_node.extend([conv2d_node, allreduce_node])
+            conv2d_node.runtime_node.append(conv2d_launchkernel)
+            conv2d_launchkernel.device_node.append(conv2d_kernel)
+            allreduce_node.runtime_node.append(allreduce_launchkernel)
+            allreduce_launchkernel.device_node.append(allreduce_kernel)
+            return {'thread1001': root_node}
+
+        windows = []
+        summary = profiler.StreamingSummary(
+            on_summary=lambda s: windows.append(s.num_windows)
+        )
+        num_windows = 3
+        for i in range(num_windows):
+            summary.add(build_window(i * 1000))
+        self.assertEqual(windows, list(range(1, num_windows + 1)))
+        statistic_data = profiler.profiler_statistic.StatisticData(
+            build_window(0), {}
+        )
+        result = summary.get_summary()
+        self.assertEqual(result['num_windows'], num_windows)
+        self.assertEqual(result['num_steps'], num_windows)
+
+        time_range_summary = statistic_data.time_range_summary
+        for event_type in [
+            profiler.TracerEventType.ProfileStep,
+            profiler.TracerEventType.Forward,
+            profiler.TracerEventType.Operator,
+            profiler.TracerEventType.CudaRuntime,
+        ]:
+            self.assertEqual(
+                result['cpu_time_range'][event_type.name],
+                num_windows * time_range_summary.get_cpu_range_sum(event_type),
+            )
+        self.assertEqual(
+            result['gpu_time_range'][0]['Kernel'],
+            num_windows
+            * time_range_summary.get_gpu_range_sum(
+                0, profiler.TracerEventType.Kernel
+            ),
+        )
+
+        event_summary = statistic_data.event_summary
+        for name, item in event_summary.items.items():
+            streaming_item = result['operator'][name]
+            self.assertEqual(streaming_item['call'], num_windows * item.call)
+            self.assertEqual(
+                streaming_item['cpu_total'], num_windows * item.cpu_time
+            )
+            self.assertEqual(
+                streaming_item['gpu_total'], num_windows * item.gpu_time
+            )
+            self.assertEqual(streaming_item['cpu_max'], item.max_cpu_time)
+            self.assertEqual(streaming_item['cpu_p50'], item.max_cpu_time)
+        for name, item in event_summary.kernel_items.items():
+            self.assertEqual(
+                result['kernel'][name]['gpu_total'],
+                num_windows * item.gpu_time,
+            )
+        for name, item in event_summary.model_perspective_items.items():
+            self.assertEqual(
+                result['model_perspective'][name]['cpu_total'],
+                num_windows * item.cpu_time,
+            )
+        self.assertEqual(
+            result['distributed'],
+            {'communication': 180, 'computation': 150, 'overlap': 90},
+        )
+
+        for sort_key in [
+            profiler.SortedKeys.CPUTotal,
+            profiler.SortedKeys.CPUMin,
+            profiler.SortedKeys.GPUAvg,
+        ]:
+            print(summary.table(sorted_by=sort_key, time_unit='ns'))
+
+        summary.reset()
+        self.assertEqual(summary.get_summary()['operator'], {})
+
+        # used as on_trace_ready of Profiler
+        class ProfilerResult:
+            def get_data(self):
+                return build_window(0)
+
+        class Prof:
+            profiler_result = ProfilerResult()
+
+        windows.clear()
+        summary(Prof())
+        self.assertEqual(windows, [1])
+        self.assertEqual(summary.get_summary()['num_steps'], 1)
+
+    def test_histogram(self):
+        hist = profiler.statistic_helper.Histogram()
+        for value in range(1, 10001):
+            hist.add(value)
+        self.assertEqual(hist.count, 10000)
+        self.assertEqual(hist.percentile(0), 1)
+        self.assertEqual(hist.percentile(100), 10000)
+        for q in [50, 95, 99]:
+            self.assertLess(
+                abs(hist.percentile(q) - q * 100), q * 100 / hist.sub_buckets
+            )
+        self.assertLessEqual(
+            len(hist.buckets), hist.sub_buckets * 14 + 1
+        )  # 10000 < 2 ** 14
+
 
 if __name__ == '__main__':
     unittest.main()
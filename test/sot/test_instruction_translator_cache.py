@@ -29,6 +29,8 @@ from paddle.jit.sot.opcode_translator.custom_code import CustomCode
 from paddle.jit.sot.opcode_translator.executor.executor_cache import (
     OpcodeExecutorCache,
 )
+from paddle.jit.sot.utils import ENV_SOT_CACHE_SIZE
+from paddle.utils.environments import EnvironmentVariableGuard
 
 
 def fake_frames() -> (
@@ -150,6 +152,72 @@ class TestOpcodeExecutorCache(unittest.TestCase):
             self.assertEqual(ctx.translate_count, 2)
 
 
+class CountedCheck:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, frame):
+        self.count += 1
+        return True
+
+
+SHARED_CHECK = CountedCheck()
+
+
+def fake_frame_with_value(x):
+    frame = inspect.currentframe()
+    assert frame is not None
+    return frame
+
+
+def mock_start_translate_by_value(frame: types.FrameType, **kwargs):
+    value = frame.f_locals['x']
+    guard = lambda frame: SHARED_CHECK(frame) and frame.f_locals['x'] == value
+    guard.sub_exprs = [
+        ("check(frame)", {"check": SHARED_CHECK}),
+        (f"frame.f_locals['x'] == {value}", {}),
+    ]
+    return CustomCode(None, False), guard
+
+
+class TestOpcodeExecutorCacheEviction(unittest.TestCase):
+    @patch(
+        "paddle.jit.sot.opcode_translator.executor.executor_cache.start_translate",
+        mock_start_translate_by_value,
+    )
+    def test_lru_eviction(self):
+        with EnvironmentVariableGuard(
+            ENV_SOT_CACHE_SIZE, 2
+        ), test_instruction_translator_cache_context() as ctx:
+            for x in [1, 2, 1, 3]:
+                OpcodeExecutorCache()(fake_frame_with_value(x))
+            # 2 is evicted as the least recently hit one
+            self.assertEqual(ctx.translate_count, 3)
+            self.assertEqual(ctx.evict_count, 1)
+            OpcodeExecutorCache()(fake_frame_with_value(1))
+            self.assertEqual(ctx.translate_count, 3)
+            OpcodeExecutorCache()(fake_frame_with_value(2))
+            self.assertEqual(ctx.translate_count, 4)
+            stats = ctx.stats()
+            self.assertEqual(stats["hit_count"], 2)
+            self.assertEqual(stats["miss_count"], 3)
+            self.assertGreater(stats["guard_time"], 0)
+
+    @patch(
+        "paddle.jit.sot.opcode_translator.executor.executor_cache.start_translate",
+        mock_start_translate_by_value,
+    )
+    def test_shared_check(self):
+        with test_instruction_translator_cache_context() as ctx:
+            for x in range(5):
+                OpcodeExecutorCache()(fake_frame_with_value(x))
+            SHARED_CHECK.count = 0
+            OpcodeExecutorCache()(fake_frame_with_value(0))
+            self.assertEqual(ctx.translate_count, 5)
+            # the check shared by all guards is evaluated once
+            self.assertEqual(SHARED_CHECK.count, 1)
+
+
 def foo(x):
     return x + 1
 